@@ -9,7 +9,8 @@
 from .azure_openai import AzureOpenAIClient
 from .base_llm import BaseLLM
 from .function_definitions import FUNCTION_DEFINITIONS
-from .function_dispatcher import dispatch_function_call
+from .function_dispatcher import DispatchResult, dispatch_function_call
+from .tool_selector import ToolSelector
 from .prompt_templates import (
     BASE_SYSTEM_PROMPT_DOCS_ONLY,
     BASE_SYSTEM_PROMPT_GENERAL,
@@ -22,7 +23,9 @@ __all__ = [
     "AzureOpenAIClient",
     "BaseLLM",
     "FUNCTION_DEFINITIONS",
+    "DispatchResult",
     "dispatch_function_call",
+    "ToolSelector",
     "BASE_SYSTEM_PROMPT_DOCS_ONLY",
     "BASE_SYSTEM_PROMPT_GENERAL",
     "BASE_SYSTEM_PROMPT_EVENT",
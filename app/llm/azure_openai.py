@@ -8,7 +8,7 @@
 
 import os
 import openai
-from typing import List, Any
+from typing import List, Any, AsyncIterator, Iterator
 from dotenv import load_dotenv
 from .base_llm import BaseLLM
 
@@ -82,5 +82,68 @@ class AzureOpenAIClient(BaseLLM):
         except Exception as e:
             raise RuntimeError(f"Error calling the LLM: {e}")
 
+    def stream_llm(self, messages: List[dict], functions: Any = None) -> Iterator[str]:
+        """
+        Calls the Azure OpenAI ChatCompletion endpoint with stream=True
+        and yields the content of each delta as it arrives.
+        """
+        try:
+            response = openai.ChatCompletion.create(
+                engine=self.model,
+                messages=[{"role": "system", "content": self.system_message}] + messages,
+                functions=functions,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+            for chunk in response:
+                # Azure sends a first chunk with only content-filter results and no choices
+                if not chunk.get("choices"):
+                    continue
+                content = chunk["choices"][0].get("delta", {}).get("content")
+                if content:
+                    yield content
+        except Exception as e:
+            raise RuntimeError(f"Error streaming from the LLM: {e}")
 
+    async def acall_llm(self, messages: List[dict], functions: Any = None) -> Any:
+        """
+        Async call_llm using the native openai acreate (aiohttp), so no thread is held
+        while waiting on the model.
+        """
+        try:
+            response = await openai.ChatCompletion.acreate(
+                engine=self.model,
+                messages=[{"role": "system", "content": self.system_message}] + messages,
+                functions=functions,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                max_tokens=self.max_tokens
+            )
+            return response
+        except Exception as e:
+            raise RuntimeError(f"Error calling the LLM: {e}")
 
+    async def astream_llm(self, messages: List[dict], functions: Any = None) -> AsyncIterator[str]:
+        """
+        Async stream_llm using openai acreate with stream=True.
+        """
+        try:
+            response = await openai.ChatCompletion.acreate(
+                engine=self.model,
+                messages=[{"role": "system", "content": self.system_message}] + messages,
+                functions=functions,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+            async for chunk in response:
+                if not chunk.get("choices"):
+                    continue
+                content = chunk["choices"][0].get("delta", {}).get("content")
+                if content:
+                    yield content
+        except Exception as e:
+            raise RuntimeError(f"Error streaming from the LLM: {e}")
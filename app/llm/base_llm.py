@@ -6,8 +6,9 @@
 ## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
 ################################################################################
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, Iterator, List
 
 class BaseLLM(ABC):
     """
@@ -24,6 +25,35 @@ class BaseLLM(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_llm(self, messages: List[dict], functions: Any = None) -> Iterator[str]:
+        """
+        Call the LLM like call_llm, but yield the answer text
+        incrementally (one chunk per generated delta) instead of
+        returning a complete response.
+        """
+        pass
+
+    async def acall_llm(self, messages: List[dict], functions: Any = None) -> Any:
+        """
+        Async variant of call_llm. Backends without a native async client
+        run the blocking call in a worker thread so the event loop stays free.
+        """
+        return await asyncio.to_thread(self.call_llm, messages, functions)
+
+    async def astream_llm(self, messages: List[dict], functions: Any = None) -> AsyncIterator[str]:
+        """
+        Async variant of stream_llm. By default each chunk is pulled from the
+        blocking iterator in a worker thread.
+        """
+        iterator = iter(self.stream_llm(messages, functions))
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, done)
+            if chunk is done:
+                break
+            yield chunk
+
     @abstractmethod
     def get_embedding(self, text: str) -> List[float]:
         """
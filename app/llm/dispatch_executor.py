@@ -0,0 +1,91 @@
+################################################################################
+## cisco-data-bridge-domain-index/llm/dispatch_executor.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict
+
+from .function_definitions import FUNCTION_PLATFORMS
+from .function_dispatcher import DispatchResult, dispatch_function_call
+
+# Worker threads per platform. The Cisco SDKs are blocking, so each platform gets
+# its own bounded pool: a burst of slow Meraki calls can only queue behind other
+# Meraki calls and never starves Catalyst, Spaces or the event loop.
+DISPATCH_POOL_SIZES = {
+    "meraki": int(os.getenv("DISPATCH_POOL_MERAKI", "8")),
+    "catalyst": int(os.getenv("DISPATCH_POOL_CATALYST", "4")),
+    "spaces": int(os.getenv("DISPATCH_POOL_SPACES", "4")),
+    "webex": int(os.getenv("DISPATCH_POOL_WEBEX", "2")),
+}
+# Functions that are not listed in FUNCTION_PLATFORMS
+DISPATCH_POOL_DEFAULT = int(os.getenv("DISPATCH_POOL_DEFAULT", "4"))
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_in_flight: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def platform_for(func_name: str) -> str:
+    return FUNCTION_PLATFORMS.get(func_name, "default")
+
+
+def get_executor(platform: str) -> ThreadPoolExecutor:
+    """
+    Return the (lazily created) executor for a platform.
+    """
+    with _lock:
+        executor = _executors.get(platform)
+        if executor is None:
+            size = DISPATCH_POOL_SIZES.get(platform, DISPATCH_POOL_DEFAULT)
+            executor = ThreadPoolExecutor(max_workers=max(1, size), thread_name_prefix=f"dispatch-{platform}")
+            _executors[platform] = executor
+            logging.info(f"Created dispatch pool '{platform}' with {size} workers")
+        return executor
+
+
+async def dispatch_function_call_async(func_name: str, func_args: dict) -> DispatchResult:
+    """
+    Run dispatch_function_call on the platform's pool and await the result
+    without blocking the event loop.
+    """
+    platform = platform_for(func_name)
+    executor = get_executor(platform)
+    with _lock:
+        _in_flight[platform] = _in_flight.get(platform, 0) + 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(dispatch_function_call, func_name, func_args))
+    finally:
+        with _lock:
+            _in_flight[platform] -= 1
+
+
+def executor_stats() -> dict:
+    """
+    Pool size and number of calls running or queued, per platform.
+    """
+    with _lock:
+        return {
+            platform: {
+                "workers": executor._max_workers,
+                "in_flight": _in_flight.get(platform, 0),
+            }
+            for platform, executor in _executors.items()
+        }
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
@@ -272,6 +272,24 @@ get_spaces_location_subtree_function = {
     }
 }
 
+get_spaces_location_path_function = {
+    "name": "get_spaces_location_path",
+    "description": (
+        "Find where a Cisco Spaces location is: its path (campus, building, ...) and the floor it is on. "
+        "Accepts a location ID or name."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "location": {
+                "type": "string",
+                "description": "The location ID or name (e.g. a zone, floor or building name)."
+            }
+        },
+        "required": ["location"]
+    }
+}
+
 
 #############################
 # Cisco Catalyst Center (DNA Center)
@@ -307,7 +325,10 @@ get_catalyst_device_by_id_function = {
 # Run a CLI command on a Catalyst device
 run_cli_command_function = {
     "name": "run_cli_command_on_catalyst_device",
-    "description": "Run a CLI command on a given Catalyst device.",
+    "description": (
+        "Submit a CLI command on a given Catalyst device and return its task ID. "
+        "To get the output directly, use run_cli_commands_on_catalyst_devices."
+    ),
     "parameters": {
         "type": "object",
         "properties": {
@@ -324,6 +345,35 @@ run_cli_command_function = {
     }
 }
 
+# Run CLI commands on Catalyst devices and return the output in one call
+run_cli_commands_function = {
+    "name": "run_cli_commands_on_catalyst_devices",
+    "description": (
+        "Run one or more read-only CLI commands (e.g. 'show version') on one or more Catalyst devices "
+        "and return the output of every command per device. Waits for the result; no task or file lookups needed."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "devices": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Device IDs, hostnames or management IP addresses."
+            },
+            "commands": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "The read-only CLI commands to run on every device."
+            },
+            "timeout_s": {
+                "type": "number",
+                "description": "Optional maximum wait in seconds (default 120)."
+            }
+        },
+        "required": ["devices", "commands"]
+    }
+}
+
 # Check the status of a DNA Center task by ID
 get_catalyst_task_status_by_id_function = {
     "name": "get_catalyst_task_status_by_id",
@@ -381,7 +431,10 @@ get_all_ssids_function = {
 # Execute Path Trace
 execute_path_trace_function = {
     "name": "execute_path_trace",
-    "description": "Execute a path trace from a source IP to a destination IP.",
+    "description": (
+        "Trace the network path from a source IP to a destination IP and return the hops "
+        "(device, IP, ingress/egress interface). Waits for the result; no separate result lookup needed."
+    ),
     "parameters": {
         "type": "object",
         "properties": {
@@ -392,6 +445,18 @@ execute_path_trace_function = {
             "destination_ip": {
                 "type": "string",
                 "description": "The destination IP address."
+            },
+            "protocol": {
+                "type": "string",
+                "description": "Optional protocol: 'TCP' or 'UDP'."
+            },
+            "source_port": {
+                "type": "string",
+                "description": "Optional source port."
+            },
+            "destination_port": {
+                "type": "string",
+                "description": "Optional destination port."
             }
         },
         "required": ["source_ip", "destination_ip"]
@@ -437,7 +502,10 @@ get_dnac_packages_summary_function = {
 # Retrieve all interfaces globally
 get_all_interfaces_function = {
     "name": "get_all_interfaces",
-    "description": "Retrieve all interfaces globally (up to 500 per request).",
+    "description": (
+        "Retrieve the first page (up to 500) of Catalyst Center interfaces. For counts, breakdowns "
+        "or filtered lists across all interfaces use query_catalyst_interfaces instead."
+    ),
     "parameters": {
         "type": "object",
         "properties": {},
@@ -445,6 +513,36 @@ get_all_interfaces_function = {
     }
 }
 
+# Count, group or filter interfaces across all Catalyst devices
+query_catalyst_interfaces_function = {
+    "name": "query_catalyst_interfaces",
+    "description": (
+        "Answer questions about interfaces across all Catalyst Center devices, e.g. how many ports are down "
+        "per site, which trunk ports are on VLAN 10, or the 10G ports of a switch. Filters combine; "
+        "with group_by the matching interfaces are counted per value, otherwise the count and the first rows are returned."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string", "description": "Operational status: 'up' or 'down'."},
+            "admin_status": {"type": "string", "description": "Administrative status: 'up' or 'down'."},
+            "speed_mbps": {"type": "number", "description": "Interface speed in Mbps (e.g. 1000 or 10000)."},
+            "vlan": {"type": "integer", "description": "VLAN ID."},
+            "device": {"type": "string", "description": "Device ID or hostname."},
+            "site": {"type": "string", "description": "Site name, name hierarchy (e.g. 'Global/USA/San Jose') or ID; includes the sites below it."},
+            "port_mode": {"type": "string", "description": "'access', 'trunk' or 'routed'."},
+            "interface_type": {"type": "string", "description": "'physical' or 'virtual'."},
+            "port_name": {"type": "string", "description": "Part of the port name (e.g. 'TenGigabit' or '1/0/1')."},
+            "group_by": {
+                "type": "string",
+                "description": "Count matches per value of: status, admin_status, port_mode, interface_type, duplex, media_type, speed_mbps, vlan, hostname or site."
+            },
+            "limit": {"type": "integer", "description": "Maximum interfaces listed when not grouping (default 50)."}
+        },
+        "required": []
+    }
+}
+
 # Retrieve interfaces for a specific device
 get_device_interfaces_function = {
     "name": "get_device_interfaces",
@@ -576,13 +674,17 @@ get_catalyst_device_detail_by_mac_address_function = {
 
 get_site_by_name_function = {
     "name": "get_site_by_name",
-    "description": "Retrieve a site's info from DNAC (v2) by specifying a site name hierarchy (groupNameHierarchy). E.g. Global/USA/CA.",
+    "description": (
+        "Retrieve a Catalyst Center site (ID, type, parent sites and child sites) by name hierarchy "
+        "(e.g. Global/USA/CA), site name or ID; an unknown name returns the closest sites as candidates. "
+        "Use it to find a site ID."
+    ),
     "parameters": {
         "type": "object",
         "properties": {
             "site_name": {
                 "type": "string",
-                "description": "The site name hierarchy to look up (e.g. 'Global/USA/CA/San Jose')."
+                "description": "The site name hierarchy, site name or site ID (e.g. 'Global/USA/CA/San Jose' or 'San Jose')."
             }
         },
         "required": ["site_name"]
@@ -592,13 +694,17 @@ get_site_by_name_function = {
 
 get_all_devices_by_site_function = {
     "name": "get_all_devices_by_site",
-    "description": "Retrieve all devices in a specific site from DNA Center by site ID.",
+    "description": "Retrieve all devices in a specific site from DNA Center by site ID or name, optionally including all sites below it.",
     "parameters": {
         "type": "object",
         "properties": {
             "site_id": {
                 "type": "string",
-                "description": "The unique site ID in DNA Center (GUID)."
+                "description": "The site ID in DNA Center (GUID), name hierarchy or site name."
+            },
+            "include_children": {
+                "type": "boolean",
+                "description": "Also return the devices of every building and floor below the site."
             }
         },
         "required": ["site_id"]
@@ -4047,7 +4153,7 @@ getMembership_function = {
     "parameters": {
         "type": "object",
         "properties": {
-            "siteId": {"type": "string", "description": "Site id to retrieve device associated with the site."},
+            "siteId": {"type": "string", "description": "Site id (or site name hierarchy) to retrieve device associated with the site."},
             "offset": {"type": "number", "description": "offset/starting row"},
             "limit": {"type": "number", "description": "Number of sites to be retrieved"},
             "deviceFamily": {"type": "string", "description": "Device family name"},
@@ -4098,6 +4204,28 @@ list_all_clients_in_org_by_name = {
     }
 }
 
+search_clients_in_org = {
+    "name": "search_clients_in_org",
+    "description": (
+        "Find Meraki clients whose name, hostname, MAC address, IP address or user contains "
+        "the specified text, over a given timespan."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Case-insensitive text to find, e.g. part of a hostname, MAC or IP address."
+            },
+            "timespan": {
+                "type": "number",
+                "description": "Look back timespan in seconds (default 14 days)."
+            }
+        },
+        "required": ["query"]
+    }
+}
+
 get_network_alerts_history = {
     "name": "get_network_alerts_history",
     "description": "Retrieve historical alerts for a specific network.",
@@ -4106,13 +4234,43 @@ get_network_alerts_history = {
         "properties": {
             "network_id": {
                 "type": "string",
-                "description": "The unique ID of the network."
+                "description": "The unique ID of the network, or its name."
             }
         },
         "required": ["network_id"]
     }
 }
 
+search_alerts_in_org = {
+    "name": "search_alerts_in_org",
+    "description": (
+        "Find recent Meraki alerts across the organization, optionally for one network, alert type or device. "
+        "Answered from alerts received by webhook."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "network_id": {
+                "type": "string",
+                "description": "Only alerts of this network (ID or name)."
+            },
+            "alert_type": {
+                "type": "string",
+                "description": "An alert type ID such as 'appliances_went_down' or an alert type name such as 'APs went down'."
+            },
+            "device_serial": {
+                "type": "string",
+                "description": "Only alerts of the device with this serial number."
+            },
+            "timespan": {
+                "type": "number",
+                "description": "Look back timespan in seconds (default 1 day)."
+            }
+        },
+        "required": []
+    }
+}
+
 
 
 list_all_devices_in_org = {
@@ -4147,7 +4305,7 @@ list_all_switches_in_org = {
 
 list_all_cameras_in_org = {
     "name": "list_all_cameras_in_org",
-    "description": "List all Meraki cameras in the organization by checking camera onboarding statuses.",
+    "description": "List all Meraki cameras (MV) in the organization’s inventory.",
     "parameters": {
         "type": "object",
         "properties": {},
@@ -4155,6 +4313,50 @@ list_all_cameras_in_org = {
     }
 }
 
+list_inventory_devices = {
+    "name": "list_inventory_devices",
+    "description": (
+        "List Meraki devices from the organization’s inventory by device family and/or network. "
+        "Use for families without a dedicated function, e.g. sensors (MT), cellular gateways (MG) or appliances (MX)."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "family": {
+                "type": "string",
+                "description": (
+                    "A product type (wireless, switch, appliance, camera, sensor, cellularGateway) "
+                    "or a model prefix such as 'MT' or 'MS220'."
+                )
+            },
+            "network_id": {
+                "type": "string",
+                "description": "Only return devices in this network (ID or name)."
+            }
+        },
+        "required": []
+    }
+}
+
+find_inventory_device = {
+    "name": "find_inventory_device",
+    "description": "Find one Meraki device in the organization’s inventory by serial number or MAC address.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "serial": {
+                "type": "string",
+                "description": "The device serial number, e.g. Q2XX-XXXX-XXXX."
+            },
+            "mac": {
+                "type": "string",
+                "description": "The device MAC address, in any common format."
+            }
+        },
+        "required": []
+    }
+}
+
 
 
 #############################
@@ -10319,7 +10521,7 @@ get_webex_meeting_by_id_function = {
 #############################
 # Combine all function definitions
 #############################
-FUNCTION_DEFINITIONS = [
+SPACES_FUNCTIONS = [
 
     # Cisco Spaces
     get_spaces_floor_details_function,
@@ -10334,11 +10536,16 @@ FUNCTION_DEFINITIONS = [
     get_history_devices_function,
     get_device_history_function,
     get_spaces_location_subtree_function,
+    get_spaces_location_path_function,
+]
+
+CATALYST_FUNCTIONS = [
 
     # Cisco Catalyst Center
     get_all_catalyst_devices_function,
     get_catalyst_device_by_id_function,
     run_cli_command_function,
+    run_cli_commands_function,
     get_catalyst_task_status_by_id_function,
     get_cli_command_output_function,
     get_all_sites_function,
@@ -10346,8 +10553,10 @@ FUNCTION_DEFINITIONS = [
     get_catalyst_system_info_function,
     get_dnac_packages_summary_function,
     get_all_interfaces_function,
+    query_catalyst_interfaces_function,
     get_device_interfaces_function,
     get_interfaces_by_ip_function,
+    execute_path_trace_function,
     initiate_path_trace_function,
     get_path_trace_result_function,
     get_catalyst_device_list_function,
@@ -10600,18 +10809,22 @@ FUNCTION_DEFINITIONS = [
     getUserEnrichmentDetails_function,
     getDeviceEnrichmentDetails_function,
     getMembership_function,
+]
 
-
-
+MERAKI_FUNCTIONS = [
 
     # Meraki
     list_all_clients_in_org,
     list_all_clients_in_org_by_name,
+    search_clients_in_org,
     get_network_alerts_history,
+    search_alerts_in_org,
     list_all_devices_in_org,
     get_all_access_points,
     list_all_switches_in_org,
     list_all_cameras_in_org,
+    list_inventory_devices,
+    find_inventory_device,
 
 
 
@@ -11032,11 +11245,21 @@ FUNCTION_DEFINITIONS = [
     getOrganizationWirelessDevicesWirelessControllersByDevice,
     getOrganizationWirelessRfProfilesAssignmentsByDevice,
     getOrganizationWirelessSsidsStatusesByDevice,
+]
 
-       
-
+WEBEX_FUNCTIONS = [
 
     # Webex
     get_webex_meetings_function,
     get_webex_meeting_by_id_function,
-]
\ No newline at end of file
+]
+
+FUNCTION_DEFINITIONS = SPACES_FUNCTIONS + CATALYST_FUNCTIONS + MERAKI_FUNCTIONS + WEBEX_FUNCTIONS
+
+# Platform of each function, used to filter tools for disabled or unmentioned platforms
+FUNCTION_PLATFORMS = {
+    **{f["name"]: "spaces" for f in SPACES_FUNCTIONS},
+    **{f["name"]: "catalyst" for f in CATALYST_FUNCTIONS},
+    **{f["name"]: "meraki" for f in MERAKI_FUNCTIONS},
+    **{f["name"]: "webex" for f in WEBEX_FUNCTIONS},
+}
@@ -0,0 +1,321 @@
+################################################################################
+## cisco-data-bridge-domain-index/llm/function_registry.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import re
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cisco_integrations.unified_service import CiscoUnifiedService
+from .function_definitions import FUNCTION_DEFINITIONS, FUNCTION_PLATFORMS
+
+DEFAULT_CLIENT_TIMESPAN = 60 * 60 * 24 * 14  # 14 days, in seconds
+
+
+class DispatchArgumentError(ValueError):
+    """
+    Raised by an argument adapter when the LLM arguments cannot be used for the call.
+    """
+
+
+# -----------------------------------------------------
+# Argument adapters: LLM arguments -> (args, kwargs) for the handler
+# -----------------------------------------------------
+def keyword_arguments(func_args: dict) -> Tuple[tuple, dict]:
+    """
+    Pass every LLM argument through as a keyword argument (the default).
+    """
+    return (), dict(func_args)
+
+
+def no_arguments(func_args: dict) -> Tuple[tuple, dict]:
+    return (), {}
+
+
+def positional(*names: str, **defaults: Any) -> Callable[[dict], Tuple[tuple, dict]]:
+    """
+    Adapter that reads the given argument names in order and passes them positionally.
+    Missing names become None unless a default is given.
+    """
+    def adapter(func_args: dict) -> Tuple[tuple, dict]:
+        return tuple(func_args.get(name, defaults.get(name)) for name in names), {}
+    adapter.arg_names = names
+    return adapter
+
+
+def required_then_keywords(name: str) -> Callable[[dict], Tuple[tuple, dict]]:
+    """
+    Adapter that passes one required argument positionally and the rest as keywords.
+    """
+    def adapter(func_args: dict) -> Tuple[tuple, dict]:
+        kwargs = dict(func_args)
+        value = kwargs.pop(name, None)
+        if not value:
+            raise DispatchArgumentError(f"Missing required {name}")
+        return (value,), kwargs
+    adapter.arg_names = (name,)
+    return adapter
+
+
+def renamed(**mapping: str) -> Callable[[dict], Tuple[tuple, dict]]:
+    """
+    Keyword adapter for schemas whose parameter names differ from the handler's.
+    """
+    def adapter(func_args: dict) -> Tuple[tuple, dict]:
+        return (), {mapping.get(key, key): value for key, value in func_args.items()}
+    adapter.renames = mapping
+    return adapter
+
+
+# -----------------------------------------------------
+# Result formatters for functions returning raw bytes
+# -----------------------------------------------------
+def _image_summary(result: Any) -> str:
+    return "Binary image data (bytes). Length = {}".format(len(result))
+
+
+def _csv_summary(result: Any) -> str:
+    return f"CSV data returned. Byte length={len(result)}"
+
+
+def _gz_summary(result: Any) -> str:
+    return f"GZ data returned. Byte length={len(result)}"
+
+
+# -----------------------------------------------------
+# Functions that do not follow the default rule
+# (handler = CiscoUnifiedService.<snake_case name>, called with **arguments)
+# name: (unified service method, argument adapter, result formatter)
+# -----------------------------------------------------
+SPECIAL_FUNCTIONS: Dict[str, Tuple[str, Callable, Optional[Callable]]] = {
+    # Cisco Spaces
+    "get_spaces_floor_details": ("get_spaces_floor_details", positional("floor_id"), None),
+    "get_spaces_location_hierarchy": ("get_spaces_location_hierarchy", positional("tenant_id"), None),
+    "get_spaces_floor_image": (
+        "get_spaces_floor_image", positional("tenant_id", "image_path", "image_type"), _image_summary
+    ),
+    "get_spaces_devices_floors": ("get_spaces_devices_floors", no_arguments, None),
+    "export_history_csv": ("export_history_csv", keyword_arguments, _csv_summary),
+    "export_history_gz": ("export_history_gz", keyword_arguments, _gz_summary),
+    "get_spaces_device_history": ("get_history_for_device", required_then_keywords("deviceId"), None),
+    "get_spaces_location_subtree": ("get_spaces_location_subtree", positional("location_id"), None),
+
+    # Cisco Catalyst Center (hand-written helpers)
+    "get_all_catalyst_devices": ("get_all_catalyst_devices", no_arguments, None),
+    "get_catalyst_device_by_id": ("get_catalyst_device_by_id", positional("device_id"), None),
+    "run_cli_command_on_catalyst_device": (
+        "run_cli_command_on_catalyst_device", positional("device_id", "command"), None
+    ),
+    "run_cli_commands_on_catalyst_devices": (
+        "run_cli_commands_on_catalyst_devices", positional("devices", "commands", "timeout_s"), None
+    ),
+    "get_catalyst_task_status_by_id": ("get_catalyst_task_status_by_id", positional("task_id"), None),
+    "get_cli_command_output": ("get_command_output", positional("file_id"), None),
+    "get_all_sites": ("get_all_sites", no_arguments, None),
+    "get_site_details": ("get_site_details", positional("site_id"), None),
+    "get_all_ssids": ("get_all_ssids", no_arguments, None),
+    "get_aps_by_site": ("get_aps_by_site", positional("site_id"), None),
+    "get_ap_details": ("get_ap_details", positional("ap_id"), None),
+    "get_all_clients": ("get_all_clients", no_arguments, None),
+    "get_client_details": ("get_client_details", positional("mac_address"), None),
+    "get_catalyst_system_info": ("get_catalyst_system_info", no_arguments, None),
+    "get_dnac_packages_summary": ("get_dnac_packages_summary", no_arguments, None),
+    "get_all_interfaces": ("get_all_interfaces", no_arguments, None),
+    "get_device_interfaces": ("get_device_interfaces", positional("device_id"), None),
+    "get_interfaces_by_ip": ("get_interfaces_by_ip", positional("ip_address"), None),
+    "execute_path_trace": (
+        "execute_path_trace",
+        positional("source_ip", "destination_ip", "protocol", "source_port", "destination_port"),
+        None,
+    ),
+    "initiate_path_trace": ("initiate_path_trace", positional("source_ip", "destination_ip"), None),
+    "get_path_trace_result": ("get_path_trace_result", positional("flow_analysis_id"), None),
+    "delete_path_trace": ("delete_path_trace", positional("flow_analysis_id"), None),
+    "get_catalyst_device_list": ("get_catalyst_device_list_direct", no_arguments, None),
+    "get_catalyst_device_detail_by_name": (
+        "get_catalyst_device_detail_by_name", positional("device_name"), None
+    ),
+    "get_catalyst_device_detail_by_mac_address": (
+        "get_catalyst_device_detail_by_mac_address", positional("mac_address"), None
+    ),
+    "get_site_by_name": ("get_site_by_name", positional("site_name"), None),
+    "get_device_detail": ("get_device_detail", renamed(search_by="searchBy"), None),
+
+    # Cisco Meraki aggregators
+    "list_all_clients_in_org": (
+        "stream_all_clients_in_org", positional("timespan", timespan=DEFAULT_CLIENT_TIMESPAN), None
+    ),
+    "list_all_clients_in_org_by_name": (
+        "list_all_clients_in_org_by_name",
+        positional("name_substring", "timespan", timespan=DEFAULT_CLIENT_TIMESPAN),
+        None,
+    ),
+    "search_clients_in_org": (
+        "search_clients_in_org", positional("query", "timespan", timespan=DEFAULT_CLIENT_TIMESPAN), None
+    ),
+    "get_network_alerts_history": ("get_network_alerts_history", positional("network_id"), None),
+    "search_alerts_in_org": (
+        "search_alerts_in_org", positional("network_id", "alert_type", "device_serial", "timespan"), None
+    ),
+    "list_all_devices_in_org": ("list_all_devices_in_org", no_arguments, None),
+    "get_all_access_points": ("get_all_access_points", no_arguments, None),
+    "list_all_switches_in_org": ("list_all_switches_in_org", no_arguments, None),
+    "list_all_cameras_in_org": ("list_all_cameras_in_org", no_arguments, None),
+    "list_inventory_devices": ("list_inventory_devices", positional("family", "network_id"), None),
+    "find_inventory_device": ("find_inventory_device", positional("serial", "mac"), None),
+
+    # Cisco Webex
+    "get_webex_meetings": ("get_webex_meetings", no_arguments, None),
+    "get_webex_meeting_by_id": ("get_webex_meeting_by_id", positional("meeting_id"), None),
+}
+
+
+@dataclass(frozen=True)
+class FunctionEntry:
+    name: str
+    method_name: str
+    handler: Optional[Callable]  # unbound CiscoUnifiedService method; None if it does not exist
+    adapter: Callable[[dict], Tuple[tuple, dict]]
+    formatter: Optional[Callable[[Any], Any]]
+    platform: str
+    network_arg: Optional[str] = None  # Meraki keyword argument resolved through the org network index
+
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def snake_case(name: str) -> str:
+    """
+    getOrganizationNetworks -> get_organization_networks
+    """
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
+
+
+def _make_entry(
+    name: str,
+    method_name: str,
+    adapter: Callable,
+    formatter: Optional[Callable],
+    schema: Optional[dict] = None,
+) -> FunctionEntry:
+    handler = getattr(CiscoUnifiedService, method_name, None)
+    platform = FUNCTION_PLATFORMS.get(name, "default")
+    properties = (schema or {}).get("properties") or {}
+    network_arg = None
+    if platform == "meraki" and adapter is keyword_arguments and "networkId" in properties:
+        network_arg = "networkId"
+    return FunctionEntry(
+        name=name,
+        method_name=method_name,
+        handler=handler if callable(handler) else None,
+        adapter=adapter,
+        formatter=formatter,
+        platform=platform,
+        network_arg=network_arg,
+    )
+
+
+def build_registry(definitions: List[dict] = FUNCTION_DEFINITIONS) -> Dict[str, FunctionEntry]:
+    """
+    Map every function name to its handler, argument adapter and result formatter.
+    Definitions not listed in SPECIAL_FUNCTIONS use CiscoUnifiedService.<snake_case name>(**arguments).
+    Meraki functions taking a networkId get it validated (and a network name resolved) before the call.
+    """
+    registry: Dict[str, FunctionEntry] = {}
+    for definition in definitions:
+        name = definition["name"]
+        if name in registry:
+            continue
+        if name in SPECIAL_FUNCTIONS:
+            registry[name] = _make_entry(name, *SPECIAL_FUNCTIONS[name])
+        else:
+            registry[name] = _make_entry(name, snake_case(name), keyword_arguments, None, definition.get("parameters"))
+    # Special functions the LLM is not offered (kept callable for the REST routes and tests)
+    for name, spec in SPECIAL_FUNCTIONS.items():
+        if name not in registry:
+            registry[name] = _make_entry(name, *spec)
+    return registry
+
+
+def validate_registry(
+    registry: Dict[str, FunctionEntry],
+    definitions: List[dict] = FUNCTION_DEFINITIONS,
+) -> List[str]:
+    """
+    Compare each function definition's JSON schema with its handler's signature.
+    Returns one message per mismatch (missing handler, unknown or missing parameters).
+    """
+    issues = []
+    schemas = {}
+    for definition in definitions:
+        schemas.setdefault(definition["name"], definition.get("parameters", {}) or {})
+
+    for name, entry in registry.items():
+        if entry.handler is None:
+            issues.append(f"{name}: no handler CiscoUnifiedService.{entry.method_name}")
+            continue
+        schema = schemas.get(name)
+        if schema is None:
+            continue
+
+        properties = set((schema.get("properties") or {}).keys())
+        required = set(schema.get("required") or [])
+        params = list(inspect.signature(entry.handler).parameters.values())[1:]  # drop self
+        accepts_any_keyword = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params)
+        named = {
+            p.name for p in params
+            if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        }
+        handler_required = {
+            p.name for p in params
+            if p.default is inspect.Parameter.empty
+            and p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        }
+
+        arg_names = getattr(entry.adapter, "arg_names", None)
+        if entry.adapter is no_arguments:
+            if required:
+                issues.append(f"{name}: schema requires {sorted(required)} but the handler takes no arguments")
+        elif arg_names is not None:
+            unknown = [a for a in arg_names if a not in properties]
+            if unknown:
+                issues.append(f"{name}: adapter reads {unknown} which the schema does not define")
+            positional_slots = [
+                p for p in params
+                if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+            ]
+            takes_var_args = any(p.kind is inspect.Parameter.VAR_POSITIONAL for p in params)
+            if len(arg_names) > len(positional_slots) and not takes_var_args:
+                issues.append(f"{name}: adapter passes {len(arg_names)} arguments, handler accepts {len(positional_slots)}")
+        else:
+            renames = getattr(entry.adapter, "renames", {})
+            passed = {renames.get(p, p) for p in properties}
+            if not accepts_any_keyword:
+                unknown = sorted(passed - named)
+                if unknown:
+                    issues.append(f"{name}: schema parameters {unknown} are not accepted by the handler")
+            missing = sorted(handler_required - {renames.get(p, p) for p in required})
+            if missing:
+                issues.append(f"{name}: handler requires {missing} which the schema does not mark required")
+    return issues
+
+
+# Built once at import
+FUNCTION_REGISTRY: Dict[str, FunctionEntry] = build_registry()
+REGISTRY_ISSUES: List[str] = validate_registry(FUNCTION_REGISTRY)
+
+if REGISTRY_ISSUES:
+    logging.warning(
+        f"Function registry: {len(REGISTRY_ISSUES)} schema/handler mismatches "
+        f"across {len(FUNCTION_REGISTRY)} functions, e.g. {REGISTRY_ISSUES[:5]}"
+    )
+    for issue in REGISTRY_ISSUES:
+        logging.debug(f"Function registry mismatch: {issue}")
+else:
+    logging.info(f"Function registry: {len(FUNCTION_REGISTRY)} functions, no schema/handler mismatches")
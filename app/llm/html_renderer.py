@@ -0,0 +1,227 @@
+################################################################################
+## cisco-data-bridge-domain-index/llm/html_renderer.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import re
+import html
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from app.llm.function_dispatcher import DispatchResult
+from app.llm.result_compactor import common_values
+from app.llm.prompt_templates import (
+    MERAKI_INVENTORY_COLUMNS,
+    MERAKI_AP_COLUMNS,
+    HTML_TABLE_SUMMARY_PROMPT,
+)
+from app.responses import dumps_json
+
+load_dotenv()
+
+# Render list-of-records results locally instead of asking the LLM for the table
+HTML_TABLE_RENDERER = os.getenv("HTML_TABLE_RENDERER", "true").lower() == "true"
+# Smallest list rendered locally (tiny results read better as LLM prose)
+HTML_TABLE_MIN_ROWS = int(os.getenv("HTML_TABLE_MIN_ROWS", "2"))
+HTML_TABLE_MAX_ROWS = int(os.getenv("HTML_TABLE_MAX_ROWS", "1000"))
+HTML_TABLE_MAX_COLUMNS = int(os.getenv("HTML_TABLE_MAX_COLUMNS", "10"))
+# Ask the LLM for a short narrative next to the table (runs alongside rendering; skipped on timeout)
+HTML_TABLE_SUMMARY = os.getenv("HTML_TABLE_SUMMARY", "true").lower() == "true"
+HTML_TABLE_SUMMARY_TIMEOUT_S = float(os.getenv("HTML_TABLE_SUMMARY_TIMEOUT_S", "15"))
+# Sample rows included in the summary prompt
+HTML_TABLE_SUMMARY_SAMPLE_ROWS = int(os.getenv("HTML_TABLE_SUMMARY_SAMPLE_ROWS", "3"))
+
+# Preset column lists; the best-matching one is used when most of its fields are present
+PRESET_COLUMNS = [MERAKI_INVENTORY_COLUMNS, MERAKI_AP_COLUMNS]
+
+# Header words that read better upper-cased
+_ACRONYMS = {"id", "ip", "mac", "ssid", "url", "vlan", "lan", "wan", "dns", "os", "ap", "mx", "ms", "mr", "uuid", "api"}
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|[_\-\s]+")
+
+
+@dataclass
+class RenderedTable:
+    html: str
+    rows: int
+    total_rows: int
+    columns: List[Tuple[str, str]]
+    records_key: Optional[str] = None
+    message: Optional[str] = None
+    records: List[dict] = field(default_factory=list, repr=False)
+
+
+def header_label(key: str) -> str:
+    """
+    'networkId' -> 'Network ID', 'lan_ip' -> 'LAN IP'
+    """
+    words = [w for w in _CAMEL_RE.split(key) if w]
+    return " ".join(w.upper() if w.lower() in _ACRONYMS else w[:1].upper() + w[1:] for w in words) or key
+
+
+def find_records(result: Any) -> Optional[Tuple[Optional[str], List[dict], Optional[str]]]:
+    """
+    Locate the list of records in a function result:
+      - a list of dicts, or
+      - a dict holding one (the largest) list of dicts, e.g. {"message": ..., "access_points": [...]}
+    Returns (key, records, message) or None when the result is not tabular.
+    """
+    if isinstance(result, list):
+        if result and all(isinstance(item, dict) for item in result):
+            return None, result, None
+        return None
+    if not isinstance(result, dict) or "error" in result:
+        return None
+
+    best_key, best = None, None
+    for key, value in result.items():
+        if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+            if best is None or len(value) > len(best):
+                best_key, best = key, value
+    if best is None:
+        return None
+    message = result.get("message")
+    return best_key, best, message if isinstance(message, str) else None
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def choose_columns(records: List[dict], max_columns: int = HTML_TABLE_MAX_COLUMNS) -> List[Tuple[str, str]]:
+    """
+    Column (key, header) pairs for the records. A preset list (Meraki inventory or
+    APs) is used when at least half of its fields appear in the data; if several do,
+    the one with the largest share of its fields present (then the most columns)
+    wins. Otherwise the keys are taken in first-seen order, scalar fields first.
+    """
+    sample = records[:50]
+    seen: Dict[str, bool] = {}
+    for record in sample:
+        for key, value in record.items():
+            if key not in seen:
+                seen[key] = _is_scalar(value)
+            elif not _is_scalar(value):
+                seen[key] = False
+
+    best, best_score = None, None
+    for preset in PRESET_COLUMNS:
+        present = [(key, label) for key, label in preset if key in seen]
+        score = (len(present) / len(preset), len(present))
+        if len(present) * 2 >= len(preset) and (best_score is None or score > best_score):
+            best, best_score = present, score
+    if best is not None:
+        return best
+
+    scalar_keys = [key for key, scalar in seen.items() if scalar]
+    other_keys = [key for key, scalar in seen.items() if not scalar]
+    return [(key, header_label(key)) for key in (scalar_keys + other_keys)[:max_columns]]
+
+
+def format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (str, int, float)):
+        return html.escape(str(value))
+    if isinstance(value, list) and all(_is_scalar(v) for v in value):
+        return html.escape(", ".join("" if v is None else str(v) for v in value))
+    return html.escape(dumps_json(value).decode("utf-8"))
+
+
+def render_table(records: List[dict], columns: List[Tuple[str, str]]) -> str:
+    parts = ["<table><thead><tr>"]
+    parts.extend(f"<th>{html.escape(label)}</th>" for _, label in columns)
+    parts.append("</tr></thead><tbody>")
+    keys = [key for key, _ in columns]
+    for record in records:
+        parts.append("<tr>")
+        parts.extend(f"<td>{format_cell(record.get(key))}</td>" for key in keys)
+        parts.append("</tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def table_candidate(dispatch_result: DispatchResult) -> Optional[RenderedTable]:
+    """
+    Cheap check (no HTML yet): the records and columns to render, or None.
+    """
+    if not HTML_TABLE_RENDERER or not dispatch_result.ok:
+        return None
+    found = find_records(dispatch_result.result)
+    if found is None:
+        return None
+    records_key, records, message = found
+    if len(records) < HTML_TABLE_MIN_ROWS:
+        return None
+    columns = choose_columns(records)
+    if not columns:
+        return None
+    return RenderedTable(
+        html="",
+        rows=min(len(records), HTML_TABLE_MAX_ROWS),
+        total_rows=len(records),
+        columns=columns,
+        records_key=records_key,
+        message=message,
+        records=records,
+    )
+
+
+def render_candidate(table: RenderedTable) -> RenderedTable:
+    """
+    Fill in table.html: optional message paragraph, the table, and a note when rows were cut.
+    """
+    parts = []
+    if table.message:
+        parts.append(f"<p>{html.escape(table.message)}</p>")
+    parts.append(render_table(table.records[:table.rows], table.columns))
+    if table.rows < table.total_rows:
+        parts.append(f"<p><em>Showing the first {table.rows} of {table.total_rows} rows.</em></p>")
+    table.html = "".join(parts)
+    return table
+
+
+def render_result(dispatch_result: DispatchResult) -> Optional[RenderedTable]:
+    """
+    HTML for a tabular function result, or None if it should go to the LLM.
+    """
+    table = table_candidate(dispatch_result)
+    return render_candidate(table) if table is not None else None
+
+
+def build_summary_messages(dispatch_result: DispatchResult, table: RenderedTable) -> List[dict]:
+    """
+    Messages for the short narrative written next to a locally rendered table.
+    Only a description of the data is sent, so the prompt stays small however
+    many rows the function returned.
+    """
+    records = table.records
+    labels = dict(table.columns)
+    most_common = {labels[key]: counts for key, counts in common_values(records, list(labels)).items()}
+
+    description = {
+        "function": dispatch_result.function,
+        "arguments": dispatch_result.arguments,
+        "rows": table.total_rows,
+        "columns": [label for _, label in table.columns],
+        "most_common_values": most_common,
+        "sample_rows": [
+            {label: record.get(key) for key, label in table.columns}
+            for record in records[:HTML_TABLE_SUMMARY_SAMPLE_ROWS]
+        ],
+    }
+    if table.message:
+        description["message"] = table.message
+    if dispatch_result.warning:
+        description["warning"] = dispatch_result.warning
+    return [
+        {"role": "system", "content": HTML_TABLE_SUMMARY_PROMPT},
+        {"role": "user", "content": dumps_json(description).decode("utf-8")},
+    ]
@@ -6,14 +6,23 @@
 ## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
 ################################################################################
 
+import json
 import requests
 import logging
+from typing import Iterator, List
+from .base_llm import BaseLLM
 
-class Llama3Client:
-    def __init__(self, base_url: str, model_name: str):
+class Llama3Client(BaseLLM):
+    def __init__(self, base_url: str, model_name: str, embedder: BaseLLM):
         self.base_url = base_url
         self.model_name = model_name
-        logging.info(f"Llama3Client initialized with base_url={base_url}, model={model_name}")
+        # The Llama3 server has no embedding endpoint: retrieval embeds with this client
+        self.embedder = embedder
+        self.embedding_name = embedder.embedding_name
+        logging.info(
+            f"Llama3Client initialized with base_url={base_url}, model={model_name}, "
+            f"embeddings={type(embedder).__name__}/{self.embedding_name}"
+        )
 
     def call_llm(self, messages, functions=None):
         payload = {
@@ -28,3 +37,48 @@ class Llama3Client:
         else:
             logging.error(f"Llama3 request failed: {response.text}")
             response.raise_for_status()
+
+    def stream_llm(self, messages, functions=None) -> Iterator[str]:
+        """
+        Streams the answer from the /generate endpoint. The server returns
+        newline-delimited JSON objects; each one carries a piece of the answer
+        either as message.content (Ollama chat), response (Ollama generate)
+        or choices[0].delta.content (OpenAI-compatible servers).
+        """
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "functions": functions or [],
+            "stream": True
+        }
+        with requests.post(f"{self.base_url}/generate", json=payload, stream=True) as response:
+            if not response.ok:
+                logging.error(f"Llama3 stream request failed: {response.text}")
+                response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:
+                    continue
+                if line.startswith("data:"):
+                    line = line[len("data:"):].strip()
+                    if line == "[DONE]":
+                        break
+                try:
+                    chunk = json.loads(line)
+                except ValueError:
+                    logging.debug(f"Skipping non-JSON stream line from Llama3: {line!r}")
+                    continue
+                content = (
+                    (chunk.get("message") or {}).get("content")
+                    or chunk.get("response")
+                    or ((chunk.get("choices") or [{}])[0].get("delta") or {}).get("content")
+                )
+                if content:
+                    yield content
+                if chunk.get("done"):
+                    break
+
+    def get_embedding(self, text: str) -> List[float]:
+        """
+        Embedding from the configured embedding backend (see llm_factory).
+        """
+        return self.embedder.get_embedding(text)
@@ -11,6 +11,21 @@ import logging
 from app.llm.azure_openai import AzureOpenAIClient
 from app.llm.llam3 import Llama3Client  # <-- updated import path
 
+def get_embedding_client():
+    """
+    The client that embeds text for retrieval when the chat model cannot
+    (LLAMA3_EMBEDDING_PROVIDER, only "azure" for now).
+    """
+    provider = os.getenv("LLAMA3_EMBEDDING_PROVIDER", "azure").lower()
+    if provider == "azure":
+        if not os.getenv("AZURE_OPENAI_ENDPOINT") or not os.getenv("AZURE_OPENAI_KEY"):
+            raise ValueError(
+                "LLM_PROVIDER=llama3 embeds with Azure OpenAI: set AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_KEY "
+                "and AZURE_OPENAI_EMBEDDING_DEPLOYMENT."
+            )
+        return AzureOpenAIClient()
+    raise ValueError(f"Unsupported LLAMA3_EMBEDDING_PROVIDER specified: {provider}")
+
 def get_llm_client():
     provider = os.getenv("LLM_PROVIDER", "azure").lower()
     logging.info(f"Initializing LLM Client, provider={provider}")
@@ -18,14 +33,11 @@ def get_llm_client():
     if provider == "llama3":
         base_url = os.getenv("LLAMA3_BASE_URL")
         model_name = os.getenv("LLAMA3_MODEL_NAME", "llama3_default")
-        return Llama3Client(base_url=base_url, model_name=model_name)
+        return Llama3Client(base_url=base_url, model_name=model_name, embedder=get_embedding_client())
 
     elif provider == "azure":
-        return AzureOpenAIClient(
-            deployment=os.getenv("AZURE_OPENAI_MODEL"),
-            api_key=os.getenv("AZURE_OPENAI_KEY"),
-            endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
-        )
+        # AzureOpenAIClient reads AZURE_OPENAI_MODEL / _KEY / _ENDPOINT itself
+        return AzureOpenAIClient()
     
     else:
         raise ValueError(f"Unsupported LLM provider specified: {provider}")
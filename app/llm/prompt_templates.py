@@ -67,20 +67,39 @@ When responding:
 
 """
 
+# (JSON field, column header) pairs for Meraki inventory tables. Shared by the
+# prompt below and the server-side table renderer (app/llm/html_renderer.py).
+MERAKI_INVENTORY_COLUMNS = [
+    ("serial", "Serial"),
+    ("mac", "MAC"),
+    ("name", "Name"),
+    ("model", "Model"),
+    ("networkId", "Network ID"),
+    ("productType", "Product Type"),
+    ("claimedAt", "Claimed At"),
+    ("licenseExpirationDate", "License Expiration Date"),
+    ("tags", "Tags"),
+    ("countryCode", "Country Code"),
+]
+
+MERAKI_AP_COLUMNS = [
+    ("serial", "Serial"),
+    ("model", "Model"),
+    ("mac", "MAC"),
+    ("networkId", "Network ID"),
+    ("productType", "Product Type"),
+]
+
+
+def _column_bullets(columns, indent=""):
+    return "\n".join(f"{indent}- <strong>{label}</strong>" for _, label in columns)
+
+
 HTML_MERAKI_INVENTORY_PROMPT = """
 You just called a Cisco function (Meraki) and have JSON with devices in the organization's inventory.
 Please parse each device object and display the following fields (if available) in an HTML table:
 
-- <strong>Serial</strong>
-- <strong>MAC</strong>
-- <strong>Name</strong>
-- <strong>Model</strong>
-- <strong>Network ID</strong>
-- <strong>Product Type</strong>
-- <strong>Claimed At</strong>
-- <strong>License Expiration Date</strong>
-- <strong>Tags</strong>
-- <strong>Country Code</strong>
+""" + _column_bullets(MERAKI_INVENTORY_COLUMNS) + """
 
 **Requirements**:
 1. Only output valid HTML (no Markdown fences). 
@@ -97,16 +116,21 @@ You just called a Cisco function that returned JSON with two keys:
 Please produce valid HTML:
 1. Display 'message' in an HTML paragraph: <p>{{message}}</p>
 2. Below that, build an HTML table for the 'access_points' array with columns:
-   - <strong>Serial</strong>
-   - <strong>Model</strong>
-   - <strong>MAC</strong>
-   - <strong>Network ID</strong>
-   - <strong>Product Type</strong>
+""" + _column_bullets(MERAKI_AP_COLUMNS, indent="   ") + """
    - etc. (any relevant fields)
 3. No Markdown backticks or code fences; pure HTML only.
 4. If a field is missing for a device, leave it blank.
 5. No extra commentary or summary—just the HTML.
 """
 
+# Used when the table is rendered server-side: the LLM only sees a compact
+# description of the rows (count, columns, common values, a few samples).
+HTML_TABLE_SUMMARY_PROMPT = """
+You just called a Cisco function. Its result is already shown to the user as an HTML table.
+You are given a short description of that table (row count, columns, most common values and a few sample rows).
+
+Write a brief summary (2-4 sentences) of what the table shows, in a single HTML <p> element.
+Do not reproduce the table or list every row. No Markdown backticks or code fences.
+"""
 
 USER_PROMPT_TEMPLATE = """User: {user_query}"""
\ No newline at end of file
@@ -0,0 +1,400 @@
+################################################################################
+## cisco-data-bridge-domain-index/llm/result_compactor.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+import secrets
+import logging
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from .function_dispatcher import DispatchResult
+from .token_counter import count_tokens
+from app.responses import dumps_json
+
+load_dotenv()
+
+# Token budget for the function result sent to the second LLM call
+RESULT_TOKEN_BUDGET = int(os.getenv("RESULT_TOKEN_BUDGET", "8000"))
+# Per-model overrides, "model:tokens" pairs matched by longest prefix, e.g. "gpt-4o:24000,gpt-4:6000"
+RESULT_TOKEN_BUDGETS = os.getenv("RESULT_TOKEN_BUDGETS", "gpt-4o:24000,gpt-4:6000,gpt-35-turbo:3000")
+# Fields dropped first when a result is over budget
+RESULT_LOW_VALUE_FIELDS = os.getenv(
+    "RESULT_LOW_VALUE_FIELDS",
+    "url,details,notes,lat,lng,address,beaconIdParams,firmwareUpgrades,imageUrl",
+)
+# String values longer than this are cut when a result is over budget
+RESULT_MAX_STRING_CHARS = int(os.getenv("RESULT_MAX_STRING_CHARS", "200"))
+# Full results of compacted answers are kept this long for GET /chat/results/{handle}
+RESULT_STORE_TTL_S = int(os.getenv("RESULT_STORE_TTL_S", "900"))
+RESULT_STORE_MAX_ENTRIES = int(os.getenv("RESULT_STORE_MAX_ENTRIES", "256"))
+
+# Serialized size above which token counts are extrapolated from a prefix
+_EXACT_COUNT_BYTES = 64 * 1024
+_LOW_VALUE = {name.strip() for name in RESULT_LOW_VALUE_FIELDS.split(",") if name.strip()}
+
+
+def _parse_budgets(spec: str) -> Dict[str, int]:
+    budgets = {}
+    for item in spec.split(","):
+        name, _, value = item.partition(":")
+        if name.strip() and value.strip().isdigit():
+            budgets[name.strip()] = int(value)
+    return budgets
+
+
+MODEL_TOKEN_BUDGETS = _parse_budgets(RESULT_TOKEN_BUDGETS)
+
+
+def token_budget(model: Optional[str]) -> int:
+    """
+    Result budget for a model/deployment name (longest matching prefix, else RESULT_TOKEN_BUDGET).
+    """
+    if model:
+        matches = [name for name in MODEL_TOKEN_BUDGETS if model.lower().startswith(name.lower())]
+        if matches:
+            return MODEL_TOKEN_BUDGETS[max(matches, key=len)]
+    return RESULT_TOKEN_BUDGET
+
+
+def model_name(llm_client: Any) -> Optional[str]:
+    return getattr(llm_client, "model", None) or getattr(llm_client, "model_name", None)
+
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Tokens of value as compact JSON. Large values are counted on a prefix and scaled.
+    """
+    data = value if isinstance(value, bytes) else dumps_json(value)
+    if len(data) <= _EXACT_COUNT_BYTES:
+        return count_tokens(data.decode("utf-8"))
+    prefix = data[:_EXACT_COUNT_BYTES].decode("utf-8", errors="ignore")
+    return count_tokens(prefix) * len(data) // _EXACT_COUNT_BYTES
+
+
+# -------------------------
+# Result store (handles)
+# -------------------------
+class ResultStore:
+    """
+    Short-lived, in-memory store of full function results that were compacted for
+    the LLM, so the complete data can still be fetched by handle.
+    """
+
+    def __init__(self, ttl_s: int = RESULT_STORE_TTL_S, max_entries: int = RESULT_STORE_MAX_ENTRIES):
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, DispatchResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            handle, (stored_at, _) = next(iter(self._entries.items()))
+            if now - stored_at < self.ttl_s and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def put(self, dispatch_result: DispatchResult) -> str:
+        handle = secrets.token_urlsafe(12)
+        now = time.time()
+        with self._lock:
+            self._entries[handle] = (now, dispatch_result)
+            self._expire(now)
+        return handle
+
+    def get(self, handle: str) -> Optional[DispatchResult]:
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(handle)
+            return entry[1] if entry else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, "ttl_s": self.ttl_s}
+
+
+RESULT_STORE = ResultStore()
+
+
+# -------------------------
+# Compaction
+# -------------------------
+@dataclass
+class CompactedResult:
+    content: str
+    tokens: int
+    original_tokens: int
+    budget: int
+    compacted: bool = False
+    handle: Optional[str] = None
+    steps: Tuple[str, ...] = ()
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _is_records(value: Any) -> bool:
+    return isinstance(value, list) and len(value) > 1 and all(isinstance(item, dict) for item in value)
+
+
+def _find_record_lists(value: Any, path: Tuple = (), depth: int = 0) -> List[Tuple[Tuple, list]]:
+    """
+    (path, records) for every list of dicts in value, up to two levels deep.
+    """
+    if _is_records(value):
+        return [(path, value)]
+    found = []
+    if isinstance(value, dict) and depth < 2:
+        for key, item in value.items():
+            found.extend(_find_record_lists(item, path + (key,), depth + 1))
+    return found
+
+
+def _replace(value: Any, path: Tuple, new: Any) -> Any:
+    if not path:
+        return new
+    copy = dict(value)
+    copy[path[0]] = _replace(value[path[0]], path[1:], new)
+    return copy
+
+
+def common_values(records: List[dict], keys: List[str], top: int = 5) -> Dict[str, list]:
+    """
+    Most frequent values of the low-cardinality scalar columns (model, status, band...).
+    """
+    summary = {}
+    for key in keys:
+        values = [r.get(key) for r in records if _is_scalar(r.get(key)) and r.get(key) not in (None, "")]
+        counts = Counter(values)
+        if values and len(counts) <= max(10, len(values) // 10) and len(counts) < len(values):
+            summary[key] = counts.most_common(top)
+    return summary
+
+
+def numeric_ranges(records: List[dict], keys: List[str]) -> Dict[str, dict]:
+    ranges = {}
+    for key in keys:
+        values = [r.get(key) for r in records if isinstance(r.get(key), (int, float)) and not isinstance(r.get(key), bool)]
+        if values and len(values) * 2 >= len(records):
+            ranges[key] = {"min": min(values), "max": max(values), "sum": sum(values)}
+    return ranges
+
+
+def _flatten(records: List[dict]) -> List[dict]:
+    """
+    Expand nested dicts of scalars into dotted keys: {"usage": {"sent": 1}} -> {"usage.sent": 1}.
+    """
+    flat = []
+    for record in records:
+        row = {}
+        for key, value in record.items():
+            if isinstance(value, dict) and value and all(_is_scalar(v) for v in value.values()):
+                for sub_key, sub_value in value.items():
+                    row[f"{key}.{sub_key}"] = sub_value
+            else:
+                row[key] = value
+        flat.append(row)
+    return flat
+
+
+def _columnar(records: List[dict], drop_low_value: bool) -> dict:
+    """
+    {"columns": [...], "rows": [[...]], "constant": {...}}: keys written once, empty
+    columns removed, columns with one value for every record hoisted to "constant".
+    With drop_low_value, RESULT_LOW_VALUE_FIELDS and nested values are removed and
+    long strings are cut.
+    """
+    columns: List[str] = []
+    seen = set()
+    for record in records:
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                columns.append(key)
+
+    keep, constant = [], {}
+    for key in columns:
+        values = [record.get(key) for record in records]
+        if all(v in (None, "", [], {}) for v in values):
+            continue
+        if drop_low_value and (key in _LOW_VALUE or not all(_is_scalar(v) for v in values)):
+            continue
+        first = values[0]
+        if _is_scalar(first) and all(v == first for v in values):
+            constant[key] = first
+            continue
+        keep.append(key)
+
+    def cell(value):
+        if drop_low_value and isinstance(value, str) and len(value) > RESULT_MAX_STRING_CHARS:
+            return value[:RESULT_MAX_STRING_CHARS] + "..."
+        return value
+
+    encoded = {"columns": keep, "rows": [[cell(record.get(key)) for key in keep] for record in records]}
+    if constant:
+        encoded["constant"] = constant
+    return encoded
+
+
+def _aggregates(encoded: dict, records: List[dict]) -> dict:
+    aggregates = {
+        "most_common_values": common_values(records, encoded["columns"]),
+        "numeric_ranges": numeric_ranges(records, encoded["columns"]),
+    }
+    return {name: value for name, value in aggregates.items() if value}
+
+
+def _sample(encoded: dict, records: List[dict], max_rows: int, aggregates: Optional[dict] = None) -> dict:
+    """
+    Keep max_rows evenly spaced rows and add aggregates computed over all records.
+    The sampling fields come before "rows", so they are read first.
+    """
+    total = len(encoded["rows"])
+    if max_rows >= total:
+        return encoded
+    max_rows = max(0, max_rows)
+    step = total / max(1, max_rows)
+    indices = [int(i * step) for i in range(max_rows)]
+    sampled = {key: value for key, value in encoded.items() if key != "rows"}
+    sampled["total_rows"] = total
+    sampled["sampled_rows"] = len(indices)
+    sampled["aggregates"] = _aggregates(encoded, records) if aggregates is None else aggregates
+    sampled["rows"] = [encoded["rows"][i] for i in indices]
+    return sampled
+
+
+def _envelope(dispatch_result: DispatchResult, result: Any, note: Optional[str] = None) -> dict:
+    payload = {"function": dispatch_result.function, "arguments": dispatch_result.arguments}
+    if dispatch_result.warning:
+        payload["warning"] = dispatch_result.warning
+    if note:
+        payload["note"] = note
+    payload["result"] = result
+    return payload
+
+
+def compact_result(dispatch_result: DispatchResult, budget: int, value: Any = None) -> CompactedResult:
+    """
+    Fit a function result into 'budget' tokens for the second LLM call.
+
+    Applied in order until the result fits, each step losing more detail:
+      1. columnar encoding of record lists (header + rows), nested dicts flattened,
+         empty columns dropped, constant columns written once;
+      2. low-value fields (RESULT_LOW_VALUE_FIELDS), nested values and long strings removed;
+      3. evenly spaced sample of rows, plus value counts and numeric ranges over all rows;
+         the sample is halved until it fits (down to no rows);
+      4. results without record lists: a prefix of the serialized result, sent as a
+         JSON string, so the answer is always valid JSON.
+    Steps 2-4 keep the full result in RESULT_STORE under a handle.
+
+    'value' overrides the JSON sent (default: the DispatchResult envelope).
+    """
+    original = dispatch_result.to_json() if value is None else dumps_json(value)
+    original_tokens = estimate_tokens(original)
+    if original_tokens <= budget or not dispatch_result.ok:
+        return CompactedResult(original.decode("utf-8"), original_tokens, original_tokens, budget)
+
+    result = dispatch_result.result if value is None else value
+    wrap = (lambda r, note=None: _envelope(dispatch_result, r, note)) if value is None else (lambda r, note=None: r)
+    record_lists = [(path, _flatten(records)) for path, records in _find_record_lists(result)]
+    steps: List[str] = []
+    handle = None
+
+    def fits(candidate) -> Tuple[bool, bytes, int]:
+        data = dumps_json(candidate)
+        tokens = estimate_tokens(data)
+        return tokens <= budget, data, tokens
+
+    def done(data: bytes, tokens: int) -> CompactedResult:
+        logging.info(
+            f"Compacted {dispatch_result.function} result from {original_tokens} to {tokens} tokens "
+            f"(budget {budget}, steps {steps})"
+        )
+        return CompactedResult(data.decode("utf-8"), tokens, original_tokens, budget, True, handle, tuple(steps))
+
+    if record_lists:
+        # 1. Lossless-ish columnar encoding
+        encoded = {path: _columnar(records, drop_low_value=False) for path, records in record_lists}
+        candidate = result
+        for path, _ in record_lists:
+            candidate = _replace(candidate, path, encoded[path])
+        steps.append("columnar")
+        ok, data, tokens = fits(wrap(candidate))
+        if ok:
+            return done(data, tokens)
+
+        handle = RESULT_STORE.put(dispatch_result)
+        note = (
+            f"Result reduced to fit the context window; the complete data is available "
+            f"at /chat/results/{handle}."
+        )
+
+        # 2. Project away low-value fields
+        encoded = {path: _columnar(records, drop_low_value=True) for path, records in record_lists}
+        candidate = result
+        for path, _ in record_lists:
+            candidate = _replace(candidate, path, encoded[path])
+        steps.append("projected")
+        ok, data, tokens = fits(wrap(candidate, note))
+        if ok:
+            return done(data, tokens)
+
+        # 3. Sample rows, sharing the remaining budget between the lists by size
+        list_tokens = {path: estimate_tokens(encoded[path]["rows"]) for path, _ in record_lists}
+        overhead = max(0, tokens - sum(list_tokens.values()))
+        # Room for the aggregates and the sampling fields
+        available = max(0, budget - overhead - 300 * len(record_lists))
+        total_list_tokens = sum(list_tokens.values()) or 1
+        max_rows, aggregates = {}, {}
+        for path, records in record_lists:
+            rows = encoded[path]["rows"]
+            per_row = max(1, list_tokens[path] // max(1, len(rows)))
+            share = available * list_tokens[path] // total_list_tokens
+            max_rows[path] = min(len(rows), share // per_row)
+            aggregates[path] = _aggregates(encoded[path], records)
+        steps.append("sampled")
+        # The estimate above is rough: measure, and shrink the samples (by up to half) until they fit
+        while True:
+            candidate = result
+            for path, records in record_lists:
+                candidate = _replace(
+                    candidate, path, _sample(encoded[path], records, max_rows[path], aggregates[path])
+                )
+            ok, data, tokens = fits(wrap(candidate, note))
+            if ok or not any(max_rows.values()):
+                if not ok:
+                    logging.warning(
+                        f"{dispatch_result.function} result is {tokens} tokens without any rows (budget {budget})"
+                    )
+                return done(data, tokens)
+            factor = min(0.95, max(0.5, budget / tokens * 0.95))
+            max_rows = {path: min(rows - 1, int(rows * factor)) if rows else 0 for path, rows in max_rows.items()}
+    else:
+        handle = RESULT_STORE.put(dispatch_result)
+        note = (
+            f"Result truncated to fit the context window; the complete data is available "
+            f"at /chat/results/{handle}."
+        )
+        data = dumps_json(result)
+        tokens = estimate_tokens(data)
+
+    # 4. Last resort: a prefix of the serialized result, as a JSON string
+    steps.append("truncated")
+    text = data.decode("utf-8")
+    keep_chars = len(text) * budget // max(1, tokens)
+    while True:
+        ok, truncated, truncated_tokens = fits(wrap({"partial_json": text[:keep_chars] + " ..."}, note))
+        if ok or keep_chars == 0:
+            return done(truncated, truncated_tokens)
+        keep_chars = keep_chars * 3 // 4
@@ -0,0 +1,52 @@
+################################################################################
+## cisco-data-bridge-domain-index/llm/token_counter.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import json
+import logging
+from typing import Any
+
+try:
+    import tiktoken
+except ImportError:  # optional dependency
+    tiktoken = None
+
+# Rough characters-per-token ratio for GPT-style tokenizers when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+_encoding = None
+
+
+def _get_encoding():
+    global _encoding
+    if _encoding is None and tiktoken is not None:
+        try:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logging.warning(f"Could not load tiktoken encoding, falling back to estimates: {e}")
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens in a string. Uses tiktoken when it is installed,
+    otherwise estimates from the character length.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def count_json_tokens(obj: Any) -> int:
+    """
+    Count the tokens of an object once serialized to compact JSON
+    (e.g. a list of function definitions sent to the LLM).
+    """
+    return count_tokens(json.dumps(obj, separators=(",", ":"), default=str))
@@ -0,0 +1,214 @@
+################################################################################
+## cisco-data-bridge-domain-index/llm/tool_selector.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import math
+import re
+import time
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from .token_counter import count_json_tokens
+
+# Words that carry no signal for picking a Cisco function
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for", "from",
+    "get", "gets", "give", "has", "have", "how", "i", "in", "is", "it", "list", "many", "me", "my",
+    "of", "on", "or", "our", "please", "return", "returns", "retrieve", "show", "tell",
+    "that", "the", "their", "there", "this", "to", "us", "want", "what", "which", "who",
+    "with", "you", "all", "any", "given", "specific", "id", "ids",
+}
+
+# Short user vocabulary expanded into the words used in function definitions
+SYNONYMS = {
+    "ap": ["access", "point", "wireless"],
+    "wifi": ["wireless", "ssid"],
+    "dnac": ["catalyst"],
+    "dna": ["catalyst"],
+    "mac": ["mac", "address"],
+    "ip": ["ip", "address"],
+    "camera": ["camera"],
+    "mv": ["camera"],
+    "mr": ["access", "point", "wireless"],
+    "ms": ["switch"],
+    "mx": ["appliance"],
+    "floorplan": ["floor", "map"],
+}
+
+# Field weights: a match in the function name counts more than one in the description
+NAME_WEIGHT = 3
+PARAM_WEIGHT = 1
+DESCRIPTION_WEIGHT = 1
+
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_ACRONYM_RE = re.compile(r"^[A-Z0-9]+s?$")
+
+
+def _stem(word: str) -> str:
+    """
+    Very small plural stemmer so that 'clients' matches 'client' and 'switches' matches 'switch'.
+    """
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("ches", "shes", "sses", "xes")):
+        return word[:-2]
+    if len(word) > 2 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split free text, snake_case and camelCase identifiers into stemmed lowercase terms.
+    """
+    terms = []
+    for raw in _WORD_RE.findall(text or ""):
+        # Keep acronyms such as "APs" or "SSIDs" whole instead of splitting them as camelCase
+        parts = [raw] if _ACRONYM_RE.match(raw) else _CAMEL_RE.split(raw)
+        for part in parts:
+            for piece in part.split("_"):
+                word = piece.lower()
+                if word and word not in STOPWORDS:
+                    terms.append(_stem(word))
+    return terms
+
+
+class ToolSelector:
+    """
+    Lexical (BM25) index over the function definitions the LLM can call.
+
+    The index is built once from each definition's name, description and parameter
+    names. For every chat turn it returns only the top-N most relevant definitions,
+    so the prompt does not carry every schema on every request.
+    """
+
+    def __init__(
+        self,
+        definitions: List[dict],
+        platforms: Optional[Dict[str, str]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        start = time.perf_counter()
+        self.definitions = definitions
+        self.platforms = platforms or {}
+        self.k1 = k1
+        self.b = b
+
+        self._doc_lengths: List[int] = []
+        self._postings: Dict[str, List[tuple]] = defaultdict(list)
+        for doc_id, definition in enumerate(definitions):
+            term_counts = Counter(self._definition_terms(definition))
+            self._doc_lengths.append(sum(term_counts.values()))
+            for term, tf in term_counts.items():
+                self._postings[term].append((doc_id, tf))
+
+        doc_count = len(definitions) or 1
+        self._avg_length = (sum(self._doc_lengths) / doc_count) or 1.0
+        self._idf = {
+            term: math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        self.total_tokens = count_json_tokens(definitions)
+        logging.info(
+            f"ToolSelector indexed {len(definitions)} functions "
+            f"({len(self._postings)} terms, ~{self.total_tokens} tokens) "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+
+    @staticmethod
+    def _definition_terms(definition: dict) -> List[str]:
+        params = definition.get("parameters", {}).get("properties", {}) or {}
+        terms = tokenize(definition.get("name", "")) * NAME_WEIGHT
+        terms += tokenize(" ".join(params.keys())) * PARAM_WEIGHT
+        terms += tokenize(definition.get("description", "")) * DESCRIPTION_WEIGHT
+        return terms
+
+    @staticmethod
+    def _query_terms(query: str) -> List[str]:
+        terms = []
+        for term in tokenize(query):
+            terms.append(term)
+            terms.extend(SYNONYMS.get(term, []))
+        return terms
+
+    def score(self, query: str, allowed_platforms: Optional[Iterable[str]] = None) -> Dict[int, float]:
+        """
+        Return BM25 scores keyed by definition index for every definition matching the query.
+        """
+        allowed = set(allowed_platforms) if allowed_platforms is not None else None
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(self._query_terms(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, tf in self._postings[term]:
+                if allowed is not None:
+                    name = self.definitions[doc_id].get("name")
+                    if self.platforms.get(name) not in allowed:
+                        continue
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / self._avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def select(
+        self,
+        query: str,
+        top_n: int,
+        allowed_platforms: Optional[Iterable[str]] = None,
+        fallback_n: Optional[int] = None,
+        min_score: float = 0.0,
+    ) -> dict:
+        """
+        Pick the top_n definitions for the query.
+
+        Returns a dict with:
+          - "functions": the selected definitions (ready to pass to call_llm)
+          - "stats": selection metrics (counts, tokens sent/saved, top score, latency)
+        A top_n of 0 (or less) selects every allowed definition. When fallback_n is given
+        and the query matches nothing, or nothing scores at least min_score, the first
+        fallback_n allowed definitions (0: all) are selected instead, with "fallback": True.
+        """
+        start = time.perf_counter()
+        allowed = set(allowed_platforms) if allowed_platforms is not None else None
+        candidates = [
+            i for i, d in enumerate(self.definitions)
+            if allowed is None or self.platforms.get(d.get("name")) in allowed
+        ]
+
+        scores = self.score(query, allowed)
+        if top_n and top_n > 0:
+            # Highest score first; ties keep the original definition order
+            ranked = sorted(scores, key=lambda i: (-scores[i], i))[:top_n]
+        else:
+            ranked = sorted(candidates, key=lambda i: (-scores.get(i, 0.0), i))
+        top_score = scores[ranked[0]] if ranked and ranked[0] in scores else 0.0
+
+        # A weak match says little about which function is needed: send the broader set
+        fallback = fallback_n is not None and (not scores or top_score < min_score)
+        if fallback:
+            ranked = sorted(candidates, key=lambda i: (-scores.get(i, 0.0), i))
+            if fallback_n > 0:
+                ranked = ranked[:fallback_n]
+
+        functions = [self.definitions[i] for i in ranked]
+        selected_tokens = count_json_tokens(functions) if functions else 0
+        stats = {
+            "selected": len(functions),
+            "total": len(self.definitions),
+            "candidates": len(candidates),
+            "top_score": round(top_score, 3),
+            "fallback": fallback,
+            "tokens_selected": selected_tokens,
+            "tokens_all": self.total_tokens,
+            "tokens_saved": self.total_tokens - selected_tokens,
+            "selection_ms": round((time.perf_counter() - start) * 1000, 2),
+            "top_functions": [d.get("name") for d in functions[:5]],
+        }
+        return {"functions": functions, "stats": stats}
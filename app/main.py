@@ -7,6 +7,8 @@
 ################################################################################
 
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
@@ -17,6 +19,22 @@ from app.routers.chat_routes import router as chat_router
 from app.routers.catalyst_routes import router as catalyst_router
 from app.routers.meraki_routes import router as meraki_router
 from app.routers.spaces_routes import router as spaces_router
+from app.llm.dispatch_executor import executor_stats, shutdown_executors
+from cisco_integrations.client_pool import CLIENT_POOL
+from cisco_integrations.meraki_inventory import INVENTORY_CACHE
+from cisco_integrations.meraki_networks import NETWORK_CACHE
+from cisco_integrations.meraki_client_index import CLIENT_INDEX_CACHE
+from cisco_integrations.meraki_alert_store import get_alert_store
+from cisco_integrations.rate_limit import meraki_rate_limit_stats
+from cisco_integrations.catalyst_auth import catalyst_token_stats
+from cisco_integrations.catalyst_interfaces import INTERFACE_CACHE as CATALYST_INTERFACE_CACHE
+from cisco_integrations.catalyst_inventory import DEVICE_CACHE as CATALYST_DEVICE_CACHE
+from cisco_integrations.catalyst_path_trace import PATH_TRACE_CACHE
+from cisco_integrations.catalyst_sites import SITE_CACHE as CATALYST_SITE_CACHE
+from cisco_integrations.spaces_locations import HIERARCHY_CACHE as SPACES_HIERARCHY_CACHE
+from retrievers.embedding_cache import warm_embedding_cache
+from retrievers.embedding_store import get_embedding_store
+from app.responses import FastJSONResponse
 
 # Load environment variables
 load_dotenv()
@@ -26,7 +44,28 @@ print(f"AZURE_SEARCH_ENABLE_IN_DOMAIN: {os.getenv('AZURE_SEARCH_ENABLE_IN_DOMAIN
 print(f"AZURE_OPENAI_MODEL: {os.getenv('AZURE_OPENAI_MODEL', 'not set')}")
 print(f"EVENT_AZURE_OPENAI_MODEL: {os.getenv('EVENT_AZURE_OPENAI_MODEL', 'not set')}")
 
-app = FastAPI()
+CLIENT_POOL_WARM_ON_STARTUP = os.getenv("CLIENT_POOL_WARM_ON_STARTUP", "true").lower() == "true"
+EMBEDDING_CACHE_WARM_ON_STARTUP = os.getenv("EMBEDDING_CACHE_WARM_ON_STARTUP", "true").lower() == "true"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if CLIENT_POOL_WARM_ON_STARTUP:
+        # Build the Cisco platform clients in the background so startup is not held up by logins
+        asyncio.get_running_loop().run_in_executor(None, CLIENT_POOL.warm)
+    if EMBEDDING_CACHE_WARM_ON_STARTUP:
+        # Preload recent query embeddings from the embedding store (no-op when it is disabled)
+        asyncio.get_running_loop().run_in_executor(None, warm_embedding_cache)
+    yield
+    # Stop the per-platform function dispatch pools and release the pooled clients
+    shutdown_executors(wait=False)
+    CLIENT_POOL.clear()
+    # Write out any embeddings still queued for the store
+    store = get_embedding_store()
+    if store is not None:
+        store.close()
+
+# JSON bodies are encoded with orjson (see app/responses.py)
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 
 # -------------------------------------------------------------------
 # Compute the project root and get absolute paths for the "static" folder
@@ -67,6 +106,31 @@ async def health_check():
     """
     return {"status": "ok", "message": "Service is up and running."}
 
+@app.get("/health/clients")
+async def client_pool_stats():
+    """
+    Stats for the pooled Cisco platform clients, the function dispatch pools, the
+    Meraki inventory, network and client snapshots, the webhook alert store, the
+    per-org Meraki rate limiters (queue depth and wait times by priority), the
+    shared Catalyst Center tokens, device snapshots, site hierarchies, interface stores
+    and recent path traces, and the Cisco Spaces location hierarchies.
+    """
+    return {
+        "client_pool": CLIENT_POOL.stats(),
+        "dispatch_pools": executor_stats(),
+        "meraki_inventory": INVENTORY_CACHE.stats(),
+        "meraki_networks": NETWORK_CACHE.stats(),
+        "meraki_clients": CLIENT_INDEX_CACHE.stats(),
+        "meraki_alerts": get_alert_store().stats(),
+        "meraki_rate_limits": meraki_rate_limit_stats(),
+        "catalyst_tokens": catalyst_token_stats(),
+        "catalyst_devices": CATALYST_DEVICE_CACHE.stats(),
+        "catalyst_sites": CATALYST_SITE_CACHE.stats(),
+        "catalyst_interfaces": CATALYST_INTERFACE_CACHE.stats(),
+        "catalyst_path_traces": PATH_TRACE_CACHE.stats(),
+        "spaces_hierarchy": SPACES_HIERARCHY_CACHE.stats(),
+    }
+
 # -------------------------------------------------------------------
 # Include Routers
 # -------------------------------------------------------------------
@@ -0,0 +1,70 @@
+################################################################################
+## cisco-data-bridge-domain-index/responses.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import json
+from itertools import islice
+from typing import Any, Iterator, Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library encoder
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes with orjson (several times faster than
+    json.dumps on large device/client lists). Unknown types are written with str().
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(content, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with dumps_json. Used as the application's default
+    response class so every JSON body is encoded once, by orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def ndjson_lines(stream, limit: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Encode a RecordStream as NDJSON: one record per line, then one
+    {"_summary": {...meta, "records": n, "truncated": bool}} line.
+    Stops (and closes the stream, ending its page requests) after limit records
+    or when the client disconnects.
+    """
+    sent = 0
+    truncated = False
+    try:
+        records = iter(stream)
+        for record in islice(records, limit):
+            sent += 1
+            yield dumps_json(record) + b"\n"
+        if limit is not None and sent == limit:
+            truncated = next(records, None) is not None
+    finally:
+        stream.close()
+    yield dumps_json({"_summary": {**stream.meta, "records": sent, "truncated": truncated}}) + b"\n"
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Newline-delimited JSON, written as the records are produced.
+    """
+    media_type = "application/x-ndjson"
+
+    def __init__(self, stream, limit: Optional[int] = None, **kwargs):
+        super().__init__(ndjson_lines(stream, limit), **kwargs)
@@ -8,16 +8,30 @@
 
 import os
 import json
+import time
+import asyncio
 import logging
-from typing import List
-from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Request, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
 # LLM modules
-from app.llm.function_dispatcher import dispatch_function_call
+from app.llm.dispatch_executor import dispatch_function_call_async
+from app.llm.function_dispatcher import DispatchResult
+from app.llm.html_renderer import (
+    HTML_TABLE_SUMMARY,
+    HTML_TABLE_SUMMARY_TIMEOUT_S,
+    find_records,
+    table_candidate,
+    render_candidate,
+    build_summary_messages,
+)
+from app.llm.result_compactor import RESULT_STORE, CompactedResult, compact_result, model_name, token_budget
+from app.responses import FastJSONResponse, dumps_json
 from app.llm.llm_factory import get_llm_client
+from app.llm.base_llm import BaseLLM
 from app.llm.prompt_templates import (
     BASE_SYSTEM_PROMPT_DOCS_ONLY,
     BASE_SYSTEM_PROMPT_GENERAL,
@@ -26,13 +40,15 @@ from app.llm.prompt_templates import (
     USER_PROMPT_TEMPLATE,
     HTML_MERAKI_APS_WITH_MESSAGE_PROMPT
 )
-from app.llm.function_definitions import FUNCTION_DEFINITIONS
+from app.llm.function_definitions import FUNCTION_DEFINITIONS, FUNCTION_PLATFORMS
+from app.llm.tool_selector import ToolSelector
 
 # Retrievers
 from retrievers.azure_search_retriever import AzureSearchRetriever
 from retrievers.chroma_retriever import ChromaRetriever
 from retrievers.elastic_retriever import ElasticRetriever
 from retrievers.null_retriever import NullRetriever
+from retrievers.embedding_cache import request_scope
 
 # ------------------------------------------------------------------------------
 # Import the CiscoSpacesClient so we can optionally download floor plan images
@@ -74,9 +90,24 @@ WEBEX_TOKEN = os.getenv("CISCO_WEBEX_TOKEN", "")
 ENABLE_CATALYST_CENTER = os.getenv("ENABLE_CATALYST_CENTER", "false").lower() == "true"
 ENABLE_MERAKI = os.getenv("ENABLE_MERAKI", "false").lower() == "true"
 print("ENABLE CATALYST CENTER", ENABLE_CATALYST_CENTER)
+ENABLE_CISCO_SPACES = os.getenv("ENABLE_CISCO_SPACES", "true").lower() == "true"
+ENABLE_CISCO_WEBEX = os.getenv("ENABLE_CISCO_WEBEX", "false").lower() == "true"
 SPACES_TOKEN = os.getenv("CISCO_SPACES_API_KEY", "")
 WEBEX_TOKEN = os.getenv("CISCO_WEBEX_TOKEN", "")
 
+# Tool selection: only send the top-N relevant function definitions to the LLM
+TOOL_SELECTION_ENABLED = os.getenv("TOOL_SELECTION_ENABLED", "true").lower() == "true"
+TOOL_SELECTION_TOP_N = int(os.getenv("TOOL_SELECTION_TOP_N", "25"))
+# Broader set sent when the query matches the tool index weakly, or retried when the
+# model answers without a function call (0 = all functions)
+TOOL_SELECTION_FALLBACK_N = int(os.getenv("TOOL_SELECTION_FALLBACK_N", "150"))
+# Below this top score the first call already gets the broader set; at or above it a
+# call without a function call is retried with it
+TOOL_SELECTION_FALLBACK_MIN_SCORE = float(os.getenv("TOOL_SELECTION_FALLBACK_MIN_SCORE", "5.0"))
+
+# Built once at startup
+TOOL_SELECTOR = ToolSelector(FUNCTION_DEFINITIONS, FUNCTION_PLATFORMS)
+
 
 # -----------------------------------------------------
 # Pydantic model for user input
@@ -358,6 +389,49 @@ def get_retriever() -> object:
         return NullRetriever()
 
 
+# -----------------------------------------------------
+# Helper: allowed_tool_platforms
+# -----------------------------------------------------
+def allowed_tool_platforms(mentions_meraki: bool, mentions_catalyst: bool) -> List[str]:
+    """
+    Platforms whose functions may be offered to the LLM: the enabled ones,
+    narrowed to Meraki or Catalyst when the user names only one of them.
+    """
+    enabled = {
+        "spaces": ENABLE_CISCO_SPACES,
+        "catalyst": ENABLE_CATALYST_CENTER,
+        "meraki": ENABLE_MERAKI,
+        "webex": ENABLE_CISCO_WEBEX,
+    }
+    platforms = [name for name, is_enabled in enabled.items() if is_enabled]
+    if mentions_meraki and not mentions_catalyst and ENABLE_MERAKI:
+        platforms = ["meraki"]
+    elif mentions_catalyst and not mentions_meraki and ENABLE_CATALYST_CENTER:
+        platforms = ["catalyst"]
+    return platforms
+
+
+# -----------------------------------------------------
+# Helper: select_functions
+# -----------------------------------------------------
+def select_functions(user_input: str, platforms: List[str], top_n: int, fallback_n: Optional[int] = None) -> dict:
+    """
+    Pick the function definitions to send with this query.
+    Falls back to every definition when tool selection is disabled, and to the
+    fallback_n best (if given) when the query matches no definition strongly.
+    """
+    if not TOOL_SELECTION_ENABLED:
+        return {
+            "functions": FUNCTION_DEFINITIONS,
+            "stats": {"selected": len(FUNCTION_DEFINITIONS), "total": len(FUNCTION_DEFINITIONS),
+                      "tokens_selected": TOOL_SELECTOR.total_tokens, "tokens_saved": 0},
+        }
+    return TOOL_SELECTOR.select(
+        user_input, top_n, allowed_platforms=platforms,
+        fallback_n=fallback_n, min_score=TOOL_SELECTION_FALLBACK_MIN_SCORE,
+    )
+
+
 # -----------------------------------------------------
 # Helper: create_messages (general doc-based RAG)
 # -----------------------------------------------------
@@ -428,38 +502,88 @@ You have access to the following LOB documents:
 
 
 # -----------------------------------------------------
-# Helper: finalize Meraki AP data with message
+# Helper: build the second-call messages for a function result
 # -----------------------------------------------------
-def finalize_meraki_aps_with_message(llm_client: AzureOpenAIClient, function_result: dict) -> str:
+FINAL_ANSWER_SYSTEM_PROMPT = (
+    "You just called a Cisco function and obtained this JSON result. "
+    "Please produce your final answer in a well-structured HTML format. "
+    "If the JSON includes arrays of items (e.g. devices), create an HTML table with columns. "
+    "Otherwise, provide bullet-lists or paragraphs. No triple backticks."
+)
+
+
+def final_messages_within_budget(dispatch_result: DispatchResult, budget: Optional[int]) -> Tuple[List[dict], CompactedResult]:
     """
-    This helper uses the specialized HTML_MERAKI_APS_WITH_MESSAGE_PROMPT
-    to produce HTML output that includes 'message' and 'access_points'.
+    Messages for the second LLM call that turns a function result into the final HTML answer.
+    Results with "access_points" & "message" use the specialized Meraki AP prompt.
+    Results over 'budget' tokens are compacted first (see result_compactor.py);
+    budget=None sends the result as is.
     """
-    # Convert dict to JSON for the user input
-    json_str = json.dumps(function_result, indent=2)
-
-    second_messages = [
-        {
-            "role": "system",
-            "content": HTML_MERAKI_APS_WITH_MESSAGE_PROMPT
-        },
-        {
-            "role": "user",
-            "content": json_str
-        }
-    ]
+    result = dispatch_result.result
+    ap_result = isinstance(result, dict) and "access_points" in result and "message" in result
+    value = result if ap_result else None
+    if budget is None:
+        content = dumps_json(value).decode("utf-8") if ap_result else dispatch_result.to_json().decode("utf-8")
+        compacted = CompactedResult(content, 0, 0, 0)
+    else:
+        compacted = compact_result(dispatch_result, budget, value=value)
+    system_prompt = HTML_MERAKI_APS_WITH_MESSAGE_PROMPT if ap_result else FINAL_ANSWER_SYSTEM_PROMPT
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": compacted.content},
+    ], compacted
+
 
-    response = llm_client.call_llm(second_messages)
-    final_html = response.choices[0].message.get("content", "").strip()
-    return final_html
+def build_final_messages(dispatch_result: DispatchResult, budget: Optional[int] = None) -> List[dict]:
+    return final_messages_within_budget(dispatch_result, budget)[0]
 
 
 # -----------------------------------------------------
-# Main chat route (with second LLM call for final summary)
+# Helper: short LLM summary next to a locally rendered table
 # -----------------------------------------------------
-@router.post("/")
-async def chat_route(query: UserQuery, request: Request):
+async def summarize_table(llm_client: BaseLLM, summary_messages: List[dict]) -> str:
+    response = await asyncio.wait_for(llm_client.acall_llm(summary_messages), HTML_TABLE_SUMMARY_TIMEOUT_S)
+    return response.choices[0].message.get("content", "").strip()
+
+
+async def stream_table_summary(llm_client: BaseLLM, summary_messages: List[dict]) -> AsyncIterator[str]:
+    """
+    Streams the summary, giving up once HTML_TABLE_SUMMARY_TIMEOUT_S has passed.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + HTML_TABLE_SUMMARY_TIMEOUT_S
+    chunks = llm_client.astream_llm(summary_messages).__aiter__()
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), max(0.0, deadline - loop.time()))
+            except StopAsyncIteration:
+                return
+            yield chunk
+    finally:
+        if hasattr(chunks, "aclose"):
+            await chunks.aclose()
+
+
+# -----------------------------------------------------
+# Chat pipeline shared by the JSON and streaming routes
+# -----------------------------------------------------
+async def run_chat_pipeline(query: UserQuery, stream_answer: bool = False) -> AsyncIterator[Tuple[str, dict]]:
+    """
+    Runs one chat turn and yields (event, data) tuples as each stage completes:
+      - "retrieval":       documents retrieved for the prompt
+      - "tool_selection":  function definitions offered to the LLM
+      - "function_call":   the function the LLM asked for (about to be dispatched)
+      - "function_result": the dispatched function finished
+      - "token":           a piece of the final answer (only when stream_answer=True)
+      - "final":           the complete answer and request metrics
+      - "error":           the turn failed; data carries the response and status_code
+
+    Every blocking step (retrieval, SDK dispatch, non-async LLM backends) runs off
+    the event loop, so a slow request does not stall other users on the worker.
+    """
     logging.info(f"Received user query: {query.message}")
+    request_start = time.perf_counter()
 
     # ------------------------------------------------------------------
     # A) Check if user wants to "download floor plan" (Spaces image)
@@ -477,7 +601,8 @@ async def chat_route(query: UserQuery, request: Request):
         local_filename = "floor_sjc12_1.png"
 
         spaces_client = CiscoSpacesClient()
-        result = spaces_client.get_floor_image(
+        result = await asyncio.to_thread(
+            spaces_client.get_floor_image,
             tenant_id=tenant_id,
             image_path=image_path,
             image_type=image_type,
@@ -487,20 +612,14 @@ async def chat_route(query: UserQuery, request: Request):
 
         # If we got a dict with "error", return that
         if isinstance(result, dict) and "error" in result:
-            return JSONResponse({
-                "role": "assistant",
-                "label": "Cisco AI",
-                "response": f"Could not download the floor image: {result['error']}"
-            })
+            yield "final", {"response": f"Could not download the floor image: {result['error']}"}
+            return
 
         # Otherwise success
         msg = f"Floor plan downloaded & saved to app/assets/{local_filename}."
         logging.info(msg)
-        return JSONResponse({
-            "role": "assistant",
-            "label": "Cisco AI",
-            "response": msg
-        })
+        yield "final", {"response": msg}
+        return
 
     # --- Step B: Decide about Meraki / Catalyst usage ---
     user_text = query.message.lower()
@@ -570,34 +689,46 @@ async def chat_route(query: UserQuery, request: Request):
             logging.info(f"LOB keywords matched: {matched_keywords}")
 
     # 2) Retrieve relevant docs (event, LOB, or fallback domain)
-    if is_event_query:
-        logging.info("Route branch: event-based retrieval")
-        retrieved_docs = retriever.retrieve_event_info(query.message)
-        messages = create_messages_for_events(query.message, retrieved_docs)
-
-    elif is_lob_query:
-        logging.info(f"LOB query => Using index: {effective_lob_index}")
-        if hasattr(retriever, "lob_index"):
-            logging.info(f"Setting retriever.lob_index => {effective_lob_index}")
-            retriever.lob_index = effective_lob_index
-        retrieved_docs = retriever.retrieve_lob_info(query.message)
-        messages = create_messages_for_lob(query.message, retrieved_docs)
+    retrieval_start = time.perf_counter()
+    # The query is embedded once and reused by every retrieval call in this scope
+    with request_scope():
+        if is_event_query:
+            logging.info("Route branch: event-based retrieval")
+            retrieval_branch = "event"
+            retrieved_docs = await asyncio.to_thread(retriever.retrieve_event_info, query.message)
+            messages = create_messages_for_events(query.message, retrieved_docs)
+
+        elif is_lob_query:
+            logging.info(f"LOB query => Using index: {effective_lob_index}")
+            retrieval_branch = "lob"
+            if hasattr(retriever, "lob_index"):
+                logging.info(f"Setting retriever.lob_index => {effective_lob_index}")
+                retriever.lob_index = effective_lob_index
+            retrieved_docs = await asyncio.to_thread(retriever.retrieve_lob_info, query.message)
+            messages = create_messages_for_lob(query.message, retrieved_docs)
 
-    else:
-        logging.info("Route branch: fallback domain-based retrieval")
-        if ENABLE_IN_DOMAIN:
-            logging.info("In-domain retrieval only.")
-            retrieved_docs = retriever.retrieve_domain_info(query.message)
-            messages = create_messages(query.message, retrieved_docs, use_general_knowledge=False)
         else:
-            logging.info("Domain info + possible API docs retrieval.")
-            domain_docs = retriever.retrieve_domain_info(query.message)
-            platform_names = [doc.get("platform", "") for doc in domain_docs if "platform" in doc]
-            retrieved_docs = retriever.retrieve_api_docs(query.message, platform_names)
-            messages = create_messages(query.message, retrieved_docs, use_general_knowledge=True)
-
+            logging.info("Route branch: fallback domain-based retrieval")
+            retrieval_branch = "domain"
+            if ENABLE_IN_DOMAIN:
+                logging.info("In-domain retrieval only.")
+                retrieved_docs = await asyncio.to_thread(retriever.retrieve_domain_info, query.message)
+                messages = create_messages(query.message, retrieved_docs, use_general_knowledge=False)
+            else:
+                logging.info("Domain info + possible API docs retrieval.")
+                domain_docs = await asyncio.to_thread(retriever.retrieve_domain_info, query.message)
+                platform_names = [doc.get("platform", "") for doc in domain_docs if "platform" in doc]
+                retrieved_docs = await asyncio.to_thread(retriever.retrieve_api_docs, query.message, platform_names)
+                messages = create_messages(query.message, retrieved_docs, use_general_knowledge=True)
+
+    metrics = {"retrieval_ms": round((time.perf_counter() - retrieval_start) * 1000, 1)}
     logging.info(f"Retrieved {len(retrieved_docs)} documents.")
     logging.debug(f"Constructed system prompt: {messages[0]['content']}")
+    yield "retrieval", {
+        "branch": retrieval_branch,
+        "documents": len(retrieved_docs),
+        "elapsed_ms": metrics["retrieval_ms"],
+    }
 
     # ----- Insert extra_instructions as a system message at the front -----
     if extra_instructions:
@@ -605,16 +736,42 @@ async def chat_route(query: UserQuery, request: Request):
         messages.insert(0, {"role": "system", "content": combined_text})
 
     # -----------------------------------------------------
-    # 3) First LLM call (with function definitions)
+    # 3) First LLM call (with the relevant function definitions)
     # -----------------------------------------------------
+    platforms = allowed_tool_platforms(mentions_meraki, mentions_catalyst)
+    selection = select_functions(query.message, platforms, TOOL_SELECTION_TOP_N, TOOL_SELECTION_FALLBACK_N)
+    metrics["tool_selection"] = selection["stats"]
+    yield "tool_selection", selection["stats"]
+
     try:
-        response = llm_client.call_llm(messages, functions=FUNCTION_DEFINITIONS)
+        llm_start = time.perf_counter()
+        response = await llm_client.acall_llm(messages, functions=selection["functions"] or None)
+        metrics["first_llm_ms"] = round((time.perf_counter() - llm_start) * 1000, 1)
         logging.debug(f"LLM Response: {response}")
+        choice_msg = response.choices[0].message
+
+        # The narrowed tool list may have missed the right function: retry once with a broader set
+        if (
+            TOOL_SELECTION_ENABLED
+            and not choice_msg.get("function_call")
+            and not selection["stats"].get("fallback")
+            and selection["stats"].get("top_score", 0) >= TOOL_SELECTION_FALLBACK_MIN_SCORE
+            and selection["stats"]["selected"] < selection["stats"].get("candidates", 0)
+        ):
+            logging.info("No function call with the selected tools; retrying with the fallback tool set.")
+            selection = select_functions(query.message, platforms, TOOL_SELECTION_FALLBACK_N)
+            metrics["tool_selection_fallback"] = selection["stats"]
+            yield "tool_selection", selection["stats"]
+            llm_start = time.perf_counter()
+            response = await llm_client.acall_llm(messages, functions=selection["functions"] or None)
+            metrics["fallback_llm_ms"] = round((time.perf_counter() - llm_start) * 1000, 1)
+            choice_msg = response.choices[0].message
     except Exception as e:
         logging.error(f"Error calling LLM: {e}")
-        return JSONResponse({"response": "An error occurred while processing your request."}, status_code=500)
+        yield "error", {"response": "An error occurred while processing your request.", "status_code": 500}
+        return
 
-    choice_msg = response.choices[0].message
+    logging.info(f"Tool selection metrics: {json.dumps(metrics)}")
 
     # -----------------------------------------------------
     # 4) If the LLM wants to call a function, do it
@@ -622,50 +779,84 @@ async def chat_route(query: UserQuery, request: Request):
     if choice_msg.get("function_call"):
         func_name = choice_msg["function_call"]["name"]
         func_args = json.loads(choice_msg["function_call"]["arguments"] or "{}")
-
-        # Dispatch the function
-        function_result_response = dispatch_function_call(func_name, func_args)
-        if not function_result_response.body:
-            return function_result_response
-
-        # Convert the JSONResponse body to string
-        raw_json_str = function_result_response.body.decode("utf-8")
-
-        # Attempt to parse into a dict
-        try:
-            function_result_dict = json.loads(raw_json_str)
-        except json.JSONDecodeError as err:
-            logging.error(f"Failed to parse function JSON: {err}")
-            function_result_dict = {}
-
-        # If it includes "access_points" & "message" => specialized Meraki AP helper
-        if "access_points" in function_result_dict and "message" in function_result_dict:
-            final_answer = finalize_meraki_aps_with_message(llm_client, function_result_dict)
+        yield "function_call", {"function": func_name, "arguments": func_args}
+
+        # Dispatch the function on the platform's worker pool
+        dispatch_start = time.perf_counter()
+        dispatch_result = await dispatch_function_call_async(func_name, func_args)
+        metrics["function_ms"] = round((time.perf_counter() - dispatch_start) * 1000, 1)
+
+        # Tabular results are rendered here; everything else goes back to the LLM
+        table = table_candidate(dispatch_result)
+        metrics["function_result_bytes"] = dispatch_result.size_bytes
+
+        yield "function_result", {
+            "function": func_name,
+            "ok": dispatch_result.ok,
+            "error": dispatch_result.error,
+            "bytes": metrics["function_result_bytes"],
+            "elapsed_ms": metrics["function_ms"],
+        }
+        llm_start = time.perf_counter()
+        if table is not None:
+            metrics["renderer"] = "table"
+            metrics["table_rows"] = table.total_rows
+            summary_messages = build_summary_messages(dispatch_result, table) if HTML_TABLE_SUMMARY else None
+            # The summary call runs while the table is rendered
+            summary_task = None
+            if summary_messages and not stream_answer:
+                summary_task = asyncio.create_task(summarize_table(llm_client, summary_messages))
+            try:
+                render_start = time.perf_counter()
+                await asyncio.to_thread(render_candidate, table)
+                metrics["render_ms"] = round((time.perf_counter() - render_start) * 1000, 1)
+
+                parts = [table.html]
+                if stream_answer:
+                    metrics["first_token_ms"] = round((time.perf_counter() - request_start) * 1000, 1)
+                    yield "token", {"text": table.html}
+                try:
+                    if summary_task is not None:
+                        parts.append(await summary_task)
+                    elif summary_messages:
+                        summary_parts = []
+                        async for chunk in stream_table_summary(llm_client, summary_messages):
+                            summary_parts.append(chunk)
+                            yield "token", {"text": chunk}
+                        parts.append("".join(summary_parts).strip())
+                except Exception as e:
+                    # The table is the answer; the narrative is optional
+                    logging.warning(f"Table summary skipped: {e!r}")
+            finally:
+                # Rendering failed or the client went away: stop the summary call
+                if summary_task is not None and not summary_task.done():
+                    summary_task.cancel()
+            final_answer = "".join(parts)
+            if summary_messages:
+                metrics["second_llm_ms"] = round((time.perf_counter() - llm_start) * 1000, 1)
         else:
-            # Otherwise do a standard second prompt
-            second_messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You just called a Cisco function and obtained this JSON result. "
-                        "Please produce your final answer in a well-structured HTML format. "
-                        "If the JSON includes arrays of items (e.g. devices), create an HTML table with columns. "
-                        "Otherwise, provide bullet-lists or paragraphs. No triple backticks."
-                    )
-                },
-                {
-                    "role": "user",
-                    "content": raw_json_str
-                }
-            ]
-            second_response = llm_client.call_llm(second_messages)
-            final_answer = second_response.choices[0].message.get("content", "").strip()
-
-        return JSONResponse({
-            "role": "assistant",
-            "label": "Cisco AI",
-            "response": final_answer
-        })
+            # Second prompt: specialized Meraki AP helper or the standard HTML summary,
+            # with the result compacted to the model's token budget
+            second_messages, compacted = await asyncio.to_thread(
+                final_messages_within_budget, dispatch_result, token_budget(model_name(llm_client))
+            )
+            metrics["function_result_tokens"] = compacted.original_tokens
+            if compacted.compacted:
+                metrics["llm_result_tokens"] = compacted.tokens
+                metrics["result_compaction"] = list(compacted.steps)
+                metrics["result_handle"] = compacted.handle
+            if stream_answer:
+                parts = []
+                async for chunk in llm_client.astream_llm(second_messages):
+                    if "first_token_ms" not in metrics:
+                        metrics["first_token_ms"] = round((time.perf_counter() - request_start) * 1000, 1)
+                    parts.append(chunk)
+                    yield "token", {"text": chunk}
+                final_answer = "".join(parts).strip()
+            else:
+                second_response = await llm_client.acall_llm(second_messages)
+                final_answer = second_response.choices[0].message.get("content", "").strip()
+            metrics["second_llm_ms"] = round((time.perf_counter() - llm_start) * 1000, 1)
 
     else:
         # -----------------------------------------------------
@@ -673,9 +864,91 @@ async def chat_route(query: UserQuery, request: Request):
         # -----------------------------------------------------
         final_answer = choice_msg.get("content", "").strip()
         logging.info(f"Final Answer: {final_answer}")
+        if stream_answer and final_answer:
+            # The first call is not streamed (it may return a function_call), so send the answer whole
+            metrics["first_token_ms"] = round((time.perf_counter() - request_start) * 1000, 1)
+            yield "token", {"text": final_answer}
+
+    metrics["total_ms"] = round((time.perf_counter() - request_start) * 1000, 1)
+    logging.info(f"Request metrics: {json.dumps(metrics)}")
+    yield "final", {"response": final_answer, "metrics": metrics}
 
-        return JSONResponse({
-            "role": "assistant",
-            "label": "Cisco AI",
-            "response": final_answer
-        })
+
+# -----------------------------------------------------
+# Main chat route (with second LLM call for final summary)
+# -----------------------------------------------------
+@router.post("/")
+async def chat_route(query: UserQuery, request: Request):
+    async for event, data in run_chat_pipeline(query):
+        if event == "error":
+            return FastJSONResponse({"response": data["response"]}, status_code=data["status_code"])
+        if event == "final":
+            return FastJSONResponse({"role": "assistant", "label": "Cisco AI", **data})
+    return FastJSONResponse({"response": "An error occurred while processing your request."}, status_code=500)
+
+
+# -----------------------------------------------------
+# Full data of a result that was compacted for the LLM
+# -----------------------------------------------------
+@router.get("/results/{handle}")
+def get_result(handle: str, offset: int = Query(0, ge=0), limit: Optional[int] = Query(None, ge=1)):
+    """
+    Returns the complete function result behind a compaction handle (see
+    metrics.result_handle). offset/limit page through the result's record list.
+    """
+    dispatch_result = RESULT_STORE.get(handle)
+    if dispatch_result is None:
+        return FastJSONResponse({"error": f"Unknown or expired result handle: {handle}"}, status_code=404)
+
+    payload = {"handle": handle, "function": dispatch_result.function, "arguments": dispatch_result.arguments}
+    found = find_records(dispatch_result.result)
+    if found is None:
+        payload["result"] = dispatch_result.result
+        return FastJSONResponse(payload)
+
+    records_key, records, _ = found
+    end = len(records) if limit is None else offset + limit
+    page = records[offset:end]
+    payload.update({"total": len(records), "offset": offset, "count": len(page)})
+    if records_key is None:
+        payload["result"] = page
+    else:
+        payload["result"] = {**dispatch_result.result, records_key: page}
+    return FastJSONResponse(payload)
+
+
+# -----------------------------------------------------
+# Streaming chat route (server-sent events)
+# -----------------------------------------------------
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {dumps_json(data).decode('utf-8')}\n\n"
+
+
+async def chat_event_stream(query: UserQuery) -> AsyncIterator[str]:
+    """
+    Wraps run_chat_pipeline as a server-sent-event stream. Failures after the
+    stream has started are reported as an "error" event, since the HTTP status
+    has already been sent.
+    """
+    try:
+        async for event, data in run_chat_pipeline(query, stream_answer=True):
+            if event == "final":
+                data = {"role": "assistant", "label": "Cisco AI", **data}
+            yield format_sse(event, data)
+    except Exception as e:
+        logging.error(f"Error in chat stream: {e}")
+        yield format_sse("error", {"response": "An error occurred while processing your request.", "status_code": 500})
+
+
+@router.post("/stream")
+async def chat_stream_route(query: UserQuery, request: Request):
+    """
+    Same pipeline as POST /chat, but answers with text/event-stream: stage events
+    (retrieval, tool_selection, function_call, function_result) as they complete,
+    then the final answer as "token" events and a closing "final" event.
+    """
+    return StreamingResponse(
+        chat_event_stream(query),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -8,68 +8,140 @@
 
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from app.responses import FastJSONResponse, NDJSONResponse
 from typing import Optional
-from cisco_integrations.unified_service import CiscoUnifiedService
+from cisco_integrations.client_pool import get_unified_service
+from cisco_integrations.record_stream import RecordStream
+from cisco_integrations.meraki_alert_store import MERAKI_WEBHOOK_SECRET, get_alert_store, verify_shared_secret
 import os
+import asyncio
 
 router = APIRouter()
 
 # Pull Meraki API key from env (or pass it from top-level config)
 MERAKI_API_KEY = os.getenv("CISCO_MERAKI_API_KEY", "")
 
-# Suppose you also need Catalyst info or other tokens:
-CATALYST_USERNAME = os.getenv("CISCO_CATALYST_USERNAME", "")
-CATALYST_PASSWORD = os.getenv("CISCO_CATALYST_PASSWORD", "")
-CATALYST_URL = os.getenv("CISCO_CATALYST_URL", "https://sandboxdnac.cisco.com:443")
-CATALYST_VERSION = os.getenv("CISCO_CATALYST_VERSION", "2.3.7.6")
-
-SPACES_TOKEN = os.getenv("CISCO_SPACES_TOKEN", "")
-WEBEX_TOKEN = os.getenv("CISCO_WEBEX_TOKEN", "")
+# The other platform credentials are read by the client pool (cisco_integrations/client_pool.py)
 
 @router.get("/meraki/networks")
-def list_meraki_networks():
+def list_meraki_networks(tag: Optional[str] = None):
     """
-    Return all Meraki networks in the org (requires your unified_service implementing get_meraki_networks).
+    Return all Meraki networks in the org (optionally only those with a tag), from the cached network index.
     """
     if not MERAKI_API_KEY:
         raise HTTPException(status_code=400, detail="MERAKI_API_KEY is missing.")
 
-    service = CiscoUnifiedService(
-        catalyst_username=CATALYST_USERNAME,
-        catalyst_password=CATALYST_PASSWORD,
-        catalyst_url=CATALYST_URL,
-        catalyst_version=CATALYST_VERSION,
-        meraki_api_key=MERAKI_API_KEY,
-        spaces_token=SPACES_TOKEN,
-        webex_token=WEBEX_TOKEN
-    )
+    service = get_unified_service()
     try:
-        networks_data = service.get_meraki_networks()
-        return JSONResponse(content={"networks": networks_data})
+        networks_data = service.get_meraki_networks(tag=tag)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if isinstance(networks_data, dict) and "error" in networks_data:
+        raise HTTPException(status_code=502, detail=networks_data["error"])
+    return FastJSONResponse(content={"networks": networks_data})
 
 
 @router.get("/meraki/networks/{network_id}")
 def get_meraki_network(network_id: str):
     """
-    Return details of a single Meraki network by ID.
+    Return details of a single Meraki network by ID or name.
     """
     if not MERAKI_API_KEY:
         raise HTTPException(status_code=400, detail="MERAKI_API_KEY is missing.")
 
-    service = CiscoUnifiedService(
-        catalyst_username=CATALYST_USERNAME,
-        catalyst_password=CATALYST_PASSWORD,
-        catalyst_url=CATALYST_URL,
-        catalyst_version=CATALYST_VERSION,
-        meraki_api_key=MERAKI_API_KEY,
-        spaces_token=SPACES_TOKEN,
-        webex_token=WEBEX_TOKEN
-    )
+    service = get_unified_service()
     try:
         network_data = service.get_meraki_network_by_id(network_id)
-        return JSONResponse(content={"network": network_data})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if isinstance(network_data, dict) and "error" in network_data:
+        status = 502 if network_data["error"].startswith("Cannot list networks") else 404
+        raise HTTPException(status_code=status, detail=network_data["error"])
+    return FastJSONResponse(content={"network": network_data})
+
+
+# -------------------------------------------------------------------
+# NDJSON streaming variants: one record per line as pages arrive,
+# then a {"_summary": {...}} line (network_errors, records, truncated)
+# -------------------------------------------------------------------
+def _ndjson(result, limit: Optional[int]):
+    if isinstance(result, RecordStream):
+        return NDJSONResponse(result, limit=limit)
+    if isinstance(result, dict) and "error" in result:
+        status = 502 if result["error"].startswith("Cannot list networks") else 404
+        raise HTTPException(status_code=status, detail=result["error"])
+    raise HTTPException(status_code=503, detail=(result or {}).get("message", "Meraki is not available."))
+
+
+@router.get("/meraki/stream/clients")
+def stream_meraki_clients(timespan: int = 60 * 60 * 24 * 14, limit: Optional[int] = None):
+    """
+    Stream all clients in the org as NDJSON; stops fetching after 'limit' clients.
+    """
+    if not MERAKI_API_KEY:
+        raise HTTPException(status_code=400, detail="MERAKI_API_KEY is missing.")
+    return _ndjson(get_unified_service().stream_all_clients_in_org(timespan=timespan), limit)
+
+
+@router.get("/meraki/stream/networks/{network_id}/clients")
+def stream_meraki_network_clients(network_id: str, timespan: int = 60 * 60 * 24 * 14, limit: Optional[int] = None):
+    """
+    Stream one network's clients (network ID or name) as NDJSON.
+    """
+    if not MERAKI_API_KEY:
+        raise HTTPException(status_code=400, detail="MERAKI_API_KEY is missing.")
+    return _ndjson(get_unified_service().stream_network_clients(network_id, timespan=timespan), limit)
+
+
+@router.get("/meraki/stream/inventory")
+def stream_meraki_inventory(family: Optional[str] = None, network_id: Optional[str] = None, limit: Optional[int] = None):
+    """
+    Stream inventory devices (optionally by family and/or network) as NDJSON.
+    """
+    if not MERAKI_API_KEY:
+        raise HTTPException(status_code=400, detail="MERAKI_API_KEY is missing.")
+    return _ndjson(get_unified_service().stream_inventory_devices(family=family, network_id=network_id), limit)
+
+
+# -------------------------------------------------------------------
+# Webhook receiver: Meraki alerts are pushed here (configure a webhook
+# HTTP server with MERAKI_WEBHOOK_SECRET as its shared secret) and kept
+# in the local alert store that answers alert history questions
+# -------------------------------------------------------------------
+@router.post("/meraki/webhooks")
+async def receive_meraki_webhook(request: Request):
+    """
+    Validate the shared secret of a Meraki webhook and store its alert.
+    """
+    if not MERAKI_WEBHOOK_SECRET:
+        raise HTTPException(status_code=503, detail="MERAKI_WEBHOOK_SECRET is not configured.")
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body is not JSON.")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Body is not a webhook payload.")
+    if not verify_shared_secret(payload):
+        raise HTTPException(status_code=401, detail="Invalid shared secret.")
+    stored = await asyncio.to_thread(get_alert_store().add, payload)
+    return {"status": "ok", "stored": stored}
+
+
+@router.get("/meraki/alerts")
+def list_meraki_alerts(
+    network_id: Optional[str] = None,
+    alert_type: Optional[str] = None,
+    device_serial: Optional[str] = None,
+    timespan: int = 60 * 60 * 24,
+):
+    """
+    Alerts received by webhook (most recent first), optionally by network (ID or name), type or device.
+    """
+    if not MERAKI_API_KEY:
+        raise HTTPException(status_code=400, detail="MERAKI_API_KEY is missing.")
+    result = get_unified_service().search_alerts_in_org(
+        network_id=network_id, alert_type=alert_type, device_serial=device_serial, timespan=timespan
+    )
+    if isinstance(result, dict) and "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    return FastJSONResponse(content=result)
@@ -8,12 +8,11 @@
 
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from app.responses import FastJSONResponse
 import logging
-import os
 
-# Import the unified service that encapsulates Webex functionality.
-from cisco_integrations.unified_service import CiscoUnifiedService
+# Pooled unified service that encapsulates Webex functionality.
+from cisco_integrations.client_pool import get_unified_service
 
 # Create a router instance for Webex endpoints.
 router = APIRouter()
@@ -25,18 +24,10 @@ def get_webex_meetings():
     This stub endpoint uses the unified service to obtain a response.
     """
     try:
-        service = CiscoUnifiedService(
-            catalyst_username=os.getenv("CISCO_CATALYST_USERNAME", ""),
-            catalyst_password=os.getenv("CISCO_CATALYST_PASSWORD", ""),
-            catalyst_url=os.getenv("CISCO_CATALYST_URL", "https://sandboxdnac.cisco.com:443"),
-            catalyst_version=os.getenv("CISCO_CATALYST_VERSION", "2.3.7.6"),
-            meraki_api_key=os.getenv("CISCO_MERAKI_API_KEY", ""),
-            spaces_token=os.getenv("CISCO_SPACES_API_KEY", ""),
-            webex_token=os.getenv("CISCO_WEBEX_TOKEN", "")
-        )
+        service = get_unified_service()
         # Call the stub method for Webex meetings.
         result = service.get_webex_meetings()
-        return JSONResponse(content={"webex_meetings": result})
+        return FastJSONResponse(content={"webex_meetings": result})
     except Exception as e:
         logging.error(f"Error retrieving Webex meetings: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -47,17 +38,9 @@ def get_webex_meeting_by_id(meeting_id: str):
     Retrieve details of a specific Webex meeting by its meeting ID.
     """
     try:
-        service = CiscoUnifiedService(
-            catalyst_username=os.getenv("CISCO_CATALYST_USERNAME", ""),
-            catalyst_password=os.getenv("CISCO_CATALYST_PASSWORD", ""),
-            catalyst_url=os.getenv("CISCO_CATALYST_URL", "https://sandboxdnac.cisco.com:443"),
-            catalyst_version=os.getenv("CISCO_CATALYST_VERSION", "2.3.7.6"),
-            meraki_api_key=os.getenv("CISCO_MERAKI_API_KEY", ""),
-            spaces_token=os.getenv("CISCO_SPACES_API_KEY", ""),
-            webex_token=os.getenv("CISCO_WEBEX_TOKEN", "")
-        )
+        service = get_unified_service()
         result = service.get_webex_meeting_by_id(meeting_id)
-        return JSONResponse(content={"webex_meeting": result})
+        return FastJSONResponse(content={"webex_meeting": result})
     except Exception as e:
         logging.error(f"Error retrieving Webex meeting with ID {meeting_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
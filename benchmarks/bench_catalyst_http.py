@@ -0,0 +1,184 @@
+################################################################################
+## cisco-data-bridge-domain-index/benchmarks/bench_catalyst_http.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+"""
+Benchmark for the direct Catalyst Center REST helpers: bare requests.get vs. the pooled session.
+
+A local HTTPS Catalyst Center stand-in (self-signed certificate, HTTP/1.1 keep-alive,
+ThreadingHTTPServer) serves the token endpoint and /dna/intent/api/v1/network-device
+with an optional fixed latency. For sequential calls and for --threads concurrent
+callers it reports per-call latency and how many TCP/TLS connections were opened:
+  - bare: requests.get(..., verify=False) per call, as the helpers used to do
+  - pooled: CatalystCenterClient.get_device_list_direct over the client's session
+
+Usage (from the project root):
+    python benchmarks/bench_catalyst_http.py [--calls 300] [--threads 8] [--latency-ms 0]
+"""
+
+import os
+import sys
+import ssl
+import json
+import time
+import argparse
+import datetime
+import tempfile
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+import urllib3
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from cisco_integrations.cisco_catalyst_client import CatalystCenterClient
+
+urllib3.disable_warnings()
+
+DEVICES = {"response": [{"id": f"dev-{i}", "hostname": f"switch-{i}", "managementIpAddress": f"10.0.0.{i}"} for i in range(50)]}
+
+
+def self_signed_cert(directory: str):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name).public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_s: float):
+        super().__init__(address, StandInHandler)
+        self.latency_s = latency_s
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def get_request(self):
+        request = super().get_request()
+        with self._lock:
+            self.connections += 1
+        return request
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, keep-alive responses stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._send({"Token": "bench-token"})
+
+    def do_GET(self):
+        if self.server.latency_s:
+            time.sleep(self.server.latency_s)
+        self._send(DEVICES)
+
+
+def start_stand_in(latency_s: float):
+    directory = tempfile.mkdtemp(prefix="catalyst-bench-")
+    cert_path, key_path = self_signed_cert(directory)
+    server = StandInServer(("127.0.0.1", 0), latency_s)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"https://127.0.0.1:{server.server_address[1]}"
+
+
+def run(label: str, call, calls: int, threads: int, server) -> dict:
+    connections_before = server.connections
+    latencies = []
+    lock = threading.Lock()
+
+    def one(_):
+        start = time.perf_counter()
+        result = call()
+        elapsed = (time.perf_counter() - start) * 1000
+        assert isinstance(result, list) and len(result) == len(DEVICES["response"]), result
+        with lock:
+            latencies.append(elapsed)
+
+    start = time.perf_counter()
+    if threads == 1:
+        for i in range(calls):
+            one(i)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(one, range(calls)))
+    wall_s = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "mode": label,
+        "threads": threads,
+        "calls": calls,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        "calls_per_s": round(calls / wall_s),
+        "connections": server.connections - connections_before,
+    }
+
+
+def main(args):
+    server, url = start_stand_in(args.latency_ms / 1000)
+    client = CatalystCenterClient(url, dnac_username="bench", dnac_password="bench", dnac_verify=False)
+    endpoint = f"{url}/dna/intent/api/v1/network-device"
+
+    def bare():
+        # What the helpers did before: a new connection (TCP + TLS) per call
+        token = client._auth_token()
+        resp = requests.get(endpoint, headers={"Accept": "application/json", "X-Auth-Token": token}, timeout=30, verify=False)
+        resp.raise_for_status()
+        return resp.json().get("response")
+
+    client.get_device_list_direct()  # log in once so both modes measure only the GETs
+    results = []
+    for threads in sorted({1, args.threads}):
+        results.append(run("bare", bare, args.calls, threads, server))
+        results.append(run("pooled", client.get_device_list_direct, args.calls, threads, server))
+    for entry in results:
+        print(json.dumps(entry))
+    server.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    main(parser.parse_args())
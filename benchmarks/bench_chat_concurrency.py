@@ -0,0 +1,204 @@
+################################################################################
+## cisco-data-bridge-domain-index/benchmarks/bench_chat_concurrency.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+"""
+Concurrency benchmark for POST /chat.
+
+Serves the real chat router with uvicorn in a background thread (one event loop,
+like one production worker) with stand-ins for the retriever, the LLM and the Cisco SDK calls that sleep for
+fixed latencies. Fast requests are fired concurrently, once on their own and once
+while a single request is stuck in a slow Meraki call, and their latency
+percentiles are compared with a "blocking" route that runs the same steps inline
+the way the pipeline used to.
+
+Usage (from the project root):
+    python benchmarks/bench_chat_concurrency.py [--requests 200] [--concurrency 20] [--slow-seconds 3]
+"""
+
+import os
+import sys
+import time
+import json
+import asyncio
+import socket
+import argparse
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENABLE_MERAKI", "true")
+os.environ.setdefault("ENABLE_CATALYST_CENTER", "true")
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+import app.llm.dispatch_executor as dispatch_executor
+from app.llm.function_dispatcher import DispatchResult
+import app.routers.chat_routes as chat_routes
+
+RETRIEVAL_SECONDS = 0.02
+LLM_SECONDS = 0.05
+FAST_FUNCTION_SECONDS = 0.03
+SLOW_FUNCTION_SECONDS = 3.0
+
+
+class _Message(dict):
+    pass
+
+
+class _Response:
+    def __init__(self, message: dict):
+        self.choices = [type("Choice", (), {"message": _Message(message)})()]
+
+
+class FakeLLM(chat_routes.BaseLLM):
+    """
+    Picks a function from the query text; the async methods wait like a native
+    async client, the sync ones block like openai.ChatCompletion.create.
+    """
+
+    @staticmethod
+    def _response(messages, functions):
+        if not functions:
+            return _Response({"content": "<p>done</p>"})
+        text = messages[-1]["content"]
+        name = "list_all_clients_in_org" if "slow" in text else (
+            "getDeviceList" if "catalyst" in text else "getOrganizations"
+        )
+        return _Response({"function_call": {"name": name, "arguments": "{}"}})
+
+    def call_llm(self, messages, functions=None):
+        time.sleep(LLM_SECONDS)
+        return self._response(messages, functions)
+
+    async def acall_llm(self, messages, functions=None):
+        await asyncio.sleep(LLM_SECONDS)
+        return self._response(messages, functions)
+
+    def stream_llm(self, messages, functions=None):
+        time.sleep(LLM_SECONDS)
+        yield "<p>done</p>"
+
+    def get_embedding(self, text):
+        return []
+
+
+class FakeRetriever:
+    lob_index = ""
+
+    def _retrieve(self, *args):
+        time.sleep(RETRIEVAL_SECONDS)
+        return [{"content": "doc"}]
+
+    retrieve_domain_info = retrieve_api_docs = retrieve_event_info = retrieve_lob_info = _retrieve
+
+
+def fake_dispatch(func_name, func_args):
+    time.sleep(SLOW_FUNCTION_SECONDS if func_name == "list_all_clients_in_org" else FAST_FUNCTION_SECONDS)
+    return DispatchResult(func_name, func_args, result=[])
+
+
+def build_app() -> FastAPI:
+    chat_routes.get_llm_client = lambda: FakeLLM()
+    chat_routes.get_retriever = lambda: FakeRetriever()
+    dispatch_executor.dispatch_function_call = fake_dispatch
+
+    app = FastAPI()
+    app.include_router(chat_routes.router, prefix="/chat")
+
+    @app.post("/legacy")
+    async def legacy_chat(query: chat_routes.UserQuery):
+        # The previous pipeline: every blocking step runs on the event loop
+        retriever, llm = FakeRetriever(), FakeLLM()
+        docs = retriever.retrieve_domain_info(query.message)
+        messages = chat_routes.create_messages(query.message, docs, use_general_knowledge=True)
+        choice = llm.call_llm(messages, functions=[{}]).choices[0].message
+        call = choice["function_call"]
+        result = fake_dispatch(call["name"], {})
+        answer = llm.call_llm([{"role": "user", "content": json.dumps(result.to_dict())}])
+        return {"response": answer.choices[0].message["content"]}
+
+    return app
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_scenario(client, path, total, concurrency, with_slow):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        message = "catalyst devices" if i % 2 else "meraki organizations"
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(path, json={"message": message})
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    slow_task = None
+    if with_slow:
+        slow_task = asyncio.create_task(client.post(path, json={"message": "slow meraki clients"}))
+        await asyncio.sleep(0.2)  # let the slow request reach its function call
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    wall = time.perf_counter() - wall_start
+    if slow_task:
+        await slow_task
+
+    return {
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(max(latencies), 1),
+        "throughput_rps": round(total / wall, 1),
+    }
+
+
+def start_server(app: FastAPI) -> tuple:
+    """
+    Run uvicorn in a daemon thread so a blocked server loop cannot stall the client.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+async def main(args):
+    global SLOW_FUNCTION_SECONDS
+    SLOW_FUNCTION_SECONDS = args.slow_seconds
+    server, thread, base_url = start_server(build_app())
+    results = {}
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        for label, path in (("async (/chat)", "/chat/"), ("blocking (legacy)", "/legacy")):
+            for with_slow in (False, True):
+                key = f"{label} {'+ 1 slow request' if with_slow else 'baseline'}"
+                results[key] = await run_scenario(client, path, args.requests, args.concurrency, with_slow)
+                print(f"{key:45s} {json.dumps(results[key])}")
+    server.should_exit = True
+    thread.join()
+    dispatch_executor.shutdown_executors()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--slow-seconds", type=float, default=SLOW_FUNCTION_SECONDS)
+    asyncio.run(main(parser.parse_args()))
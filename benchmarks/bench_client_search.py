@@ -0,0 +1,117 @@
+################################################################################
+## cisco-data-bridge-domain-index/benchmarks/bench_client_search.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+"""
+Benchmark for Meraki client name search: substring scan vs. the trigram ClientIndex.
+
+For synthetic org client sets of several sizes it reports:
+  - scan: the per-question substring scan list_all_clients_in_org_by_name used to
+    run over description/hostname (after re-crawling every network).
+  - index: ClientIndex.search over the same fields, plus the one-off full index
+    build and a delta sync of 1% of the clients.
+Crawl time is not modeled here; see bench_meraki_clients.py for what one org
+crawl costs against the rate limit.
+
+Usage (from the project root):
+    python benchmarks/bench_client_search.py [--clients 10000 100000] [--queries 200]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cisco_integrations.meraki_client_index import ClientIndex, NAME_FIELDS
+
+WORDS = ["iphone", "galaxy", "laptop", "printer", "camera", "desk", "kiosk", "pos", "tv", "ipad"]
+
+
+def clients(count: int, networks: int, rng: random.Random) -> dict:
+    now = time.time()
+    by_network = {}
+    for i in range(count):
+        network_id = f"L_{i % networks:04d}"
+        by_network.setdefault(network_id, []).append({
+            "id": f"k{i:07x}",
+            "mac": ":".join(f"{rng.randrange(256):02x}" for _ in range(6)),
+            "description": f"{rng.choice(WORDS)}-{rng.randrange(10**5):05d}",
+            "dhcpHostname": f"host-{i}" if rng.random() < 0.5 else None,
+            "ip": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "user": f"user{rng.randrange(5000)}" if rng.random() < 0.3 else None,
+            "networkId": network_id,
+            "lastSeen": int(now - rng.randrange(14 * 86400)),
+        })
+    return by_network
+
+
+def scan(all_clients: list, query: str) -> list:
+    query = query.lower()
+    return [
+        c for c in all_clients
+        if query in (c.get("description") or "").lower() or query in (c.get("dhcpHostname") or "").lower()
+    ]
+
+
+def measure(count: int, args) -> dict:
+    rng = random.Random(count)
+    by_network = clients(count, args.networks, rng)
+    all_clients = [c for network_clients in by_network.values() for c in network_clients]
+    queries = [f"{rng.choice(WORDS)}-{rng.randrange(100):02d}" for _ in range(args.queries // 2)]
+    queries += [f"host-{rng.randrange(count)}" for _ in range(args.queries - len(queries))]
+
+    index = ClientIndex("bench")
+    start = time.perf_counter()
+    index.apply_sync(time.time(), by_network.keys(), by_network, [], full=True)
+    build_s = time.perf_counter() - start
+
+    scan_ms, index_ms = [], []
+    for query in queries:
+        start = time.perf_counter()
+        expected = scan(all_clients, query)
+        scan_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        found = index.search(query, NAME_FIELDS)
+        index_ms.append((time.perf_counter() - start) * 1000)
+        assert len(found) == len(expected), query
+
+    # Delta sync: 1% of clients seen again with a new description
+    delta = {}
+    for c in rng.sample(all_clients, max(1, count // 100)):
+        delta.setdefault(c["networkId"], []).append({**c, "description": f"renamed-{c['id']}", "lastSeen": int(time.time())})
+    start = time.perf_counter()
+    index.apply_sync(time.time(), by_network.keys(), delta, [], full=False)
+    delta_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "clients": count,
+        "scan_p50_ms": round(statistics.median(scan_ms), 2),
+        "index_p50_ms": round(statistics.median(index_ms), 3),
+        "index_max_ms": round(max(index_ms), 3),
+        "speedup": round(statistics.median(scan_ms) / max(statistics.median(index_ms), 1e-6)),
+        "index_build_s": round(build_s, 2),
+        "delta_1pct_ms": round(delta_ms, 1),
+    }
+
+
+def main(args):
+    results = [measure(count, args) for count in args.clients]
+    for entry in results:
+        print(json.dumps(entry))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--networks", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    main(parser.parse_args())
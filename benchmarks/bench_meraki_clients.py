@@ -0,0 +1,227 @@
+################################################################################
+## cisco-data-bridge-domain-index/benchmarks/bench_meraki_clients.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+"""
+Benchmark for CiscoMerakiClient.list_all_clients_in_org: serial vs. concurrent.
+
+A local Meraki Dashboard stand-in (uvicorn in a background thread) serves
+/organizations/{id}/networks and paginated /networks/{id}/clients with a fixed
+per-request latency. Like the real API, it enforces a per-org rate limit (rate
+per second plus an equal burst) and answers 429 with Retry-After when it is exceeded. A fraction of networks can be
+made to fail with 404. The real Meraki SDK talks to it over HTTP.
+
+The serial loop the client used to run is compared with the concurrent fan-out
+at several worker counts. With --probe-interval-ms, an interactive single-object
+call is issued periodically during each run and its latency reported: fan-out
+requests run at bulk priority on the shared per-org scheduler, so the probe
+should wait for at most about one token. --client-rate above --rate-limit makes
+the stand-in answer 429s and shows the org-wide Retry-After pause.
+
+Usage (from the project root):
+    python benchmarks/bench_meraki_clients.py [--networks 100] [--clients-per-network 1500]
+        [--latency-ms 500] [--rate-limit 10] [--client-rate 10] [--fail-ratio 0.02]
+        [--workers 1 4 8 16] [--probe-interval-ms 1000]
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+import cisco_integrations.rate_limit as rate_limit
+from cisco_integrations.cisco_meraki_client import CiscoMerakiClient
+from meraki.exceptions import APIError
+
+ORG_ID = "123456"
+
+
+def build_stand_in(args) -> FastAPI:
+    app = FastAPI()
+    networks = [{"id": f"L_{i:05d}", "name": f"Site {i}", "organizationId": ORG_ID} for i in range(args.networks)]
+    failing = {net["id"] for i, net in enumerate(networks) if args.fail_ratio and i % round(1 / args.fail_ratio) == 0}
+    counters = {"requests": 0, "throttled": 0}
+    # Per-org allowance as documented for the Dashboard API: rate per second plus a burst of the same size
+    allowance = {"tokens": 2 * args.rate_limit, "updated": time.monotonic()}
+
+    async def admit():
+        """
+        Server-side token bucket per org, answering 429 like the Dashboard does.
+        """
+        counters["requests"] += 1
+        now = time.monotonic()
+        allowance["tokens"] = min(2 * args.rate_limit, allowance["tokens"] + (now - allowance["updated"]) * args.rate_limit)
+        allowance["updated"] = now
+        if allowance["tokens"] < 1:
+            counters["throttled"] += 1
+            return JSONResponse({"errors": ["API rate limit exceeded"]}, status_code=429, headers={"Retry-After": "1"})
+        allowance["tokens"] -= 1
+        await asyncio.sleep(args.latency_ms / 1000)
+        return None
+
+    @app.get("/api/v1/organizations/{org_id}")
+    async def organization(org_id: str):
+        return await admit() or {"id": org_id, "name": "Bench org"}
+
+    @app.get("/api/v1/organizations/{org_id}/networks")
+    async def org_networks(org_id: str):
+        return await admit() or networks
+
+    @app.get("/api/v1/networks/{network_id}/clients")
+    async def network_clients(network_id: str, request: Request, perPage: int = 1000, startingAfter: str = ""):
+        throttled = await admit()
+        if throttled:
+            return throttled
+        if network_id in failing:
+            return JSONResponse({"errors": ["Network not found"]}, status_code=404)
+        start = int(startingAfter.rsplit("_", 1)[1]) + 1 if startingAfter else 0
+        end = min(args.clients_per_network, start + perPage)
+        page = [
+            {"id": f"k{network_id}_{i}", "mac": f"00:00:00:00:{i // 256 % 256:02x}:{i % 256:02x}",
+             "description": f"client-{i}", "ip": f"10.0.{i // 256 % 256}.{i % 256}", "status": "Online"}
+            for i in range(start, end)
+        ]
+        headers = {}
+        if end < args.clients_per_network:
+            # Relative to the base URL: the SDK only follows absolute links on meraki.com hosts
+            next_url = f"/networks/{network_id}/clients?{request.url.include_query_params(startingAfter=f'k{network_id}_{end - 1}').query}"
+            headers["Link"] = f'<{next_url}>; rel=next'
+        return JSONResponse(page, headers=headers)
+
+    app.state.counters = counters
+    return app
+
+
+def start_server(app: FastAPI) -> tuple:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{port}/api/v1"
+
+
+def serial_list_all_clients(client: CiscoMerakiClient, timespan=60 * 60 * 24 * 14) -> list:
+    """
+    The loop list_all_clients_in_org used to run: one network at a time.
+    """
+    all_clients = []
+    networks = client.dashboard.organizations.getOrganizationNetworks(client.organization_id)
+    for net in networks:
+        try:
+            all_clients.extend(client.dashboard.networks.getNetworkClients(
+                networkId=net["id"], timespan=timespan, perPage=1000, total_pages="all"
+            ))
+        except APIError:
+            pass
+    return all_clients
+
+
+def probe(client: CiscoMerakiClient, interval_s: float, stop: threading.Event, latencies: list) -> None:
+    """
+    An interactive user's single call, repeated while the fan-out runs.
+    """
+    while not stop.wait(interval_s):
+        start = time.perf_counter()
+        client.dashboard.organizations.getOrganization(client.organization_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+def run(label, fn, counters, client=None, probe_interval_ms=0) -> dict:
+    before = dict(counters)
+    stop, latencies = threading.Event(), []
+    prober = None
+    if client is not None and probe_interval_ms:
+        prober = threading.Thread(target=probe, args=(client, probe_interval_ms / 1000, stop, latencies), daemon=True)
+        prober.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if prober is not None:
+        prober.join()
+    clients = result if isinstance(result, list) else result["clients"]
+    errors = None if isinstance(result, list) else len(result["network_errors"])
+    entry = {
+        "run": label,
+        "seconds": round(elapsed, 2),
+        "clients": len(clients),
+        "network_errors": errors,
+        "requests": counters["requests"] - before["requests"],
+        "throttled_429": counters["throttled"] - before["throttled"],
+    }
+    if latencies:
+        entry["probe_calls"] = len(latencies)
+        entry["probe_p50_ms"] = round(statistics.median(latencies), 1)
+        entry["probe_max_ms"] = round(max(latencies), 1)
+    print(json.dumps(entry))
+    return entry
+
+
+def main(args):
+    # Client-side pacing matches the stand-in's limit unless --client-rate says otherwise
+    client_rate = args.client_rate or args.rate_limit
+    rate_limit.MERAKI_ORG_RATE_LIMIT = client_rate
+    rate_limit.MERAKI_ORG_RATE_BURST = int(client_rate)
+    app = build_stand_in(args)
+    server, thread, base_url = start_server(app)
+    counters = app.state.counters
+
+    client = CiscoMerakiClient(api_key="0" * 40, organization_id=ORG_ID, base_url=base_url)
+    print(
+        f"{args.networks} networks x {args.clients_per_network} clients, {args.latency_ms} ms per request, "
+        f"{args.rate_limit} req/s per org (client paced at {client_rate}), fail ratio {args.fail_ratio}"
+    )
+    results = []
+    if not args.skip_serial:
+        results.append(run(
+            "serial (previous loop)", lambda: serial_list_all_clients(client), counters, client, args.probe_interval_ms
+        ))
+    for workers in args.workers:
+        # A fresh bucket per run so one run's debt does not slow the next
+        rate_limit._org_limiters.clear()
+        results.append(run(
+            f"concurrent, {workers} workers",
+            lambda: client.list_all_clients_in_org(max_workers=workers),
+            counters,
+            client,
+            args.probe_interval_ms,
+        ))
+        entry = results[-1]
+        entry["scheduler"] = rate_limit.meraki_rate_limit_stats()[ORG_ID]["by_priority"]
+        print(json.dumps({"run": entry["run"], "scheduler": entry["scheduler"]}))
+
+    server.should_exit = True
+    thread.join()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--networks", type=int, default=100)
+    parser.add_argument("--clients-per-network", type=int, default=1500)
+    parser.add_argument("--latency-ms", type=float, default=500)
+    parser.add_argument("--rate-limit", type=float, default=10)
+    parser.add_argument("--client-rate", type=float, default=0, help="client-side pacing; defaults to --rate-limit")
+    parser.add_argument("--fail-ratio", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--skip-serial", action="store_true")
+    parser.add_argument("--probe-interval-ms", type=float, default=0, help="interactive probe period; 0 = off")
+    main(parser.parse_args())
@@ -0,0 +1,124 @@
+################################################################################
+## cisco-data-bridge-domain-index/benchmarks/bench_table_renderer.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+"""
+Benchmark: HTML table from the second LLM call vs. the server-side renderer.
+
+For synthetic Meraki inventory results of several sizes it reports:
+  - LLM path: prompt tokens (the whole result JSON), the output tokens needed for
+    the table, how much of it fits in max_tokens, and a modeled latency.
+  - Local path: measured render time, summary prompt tokens, and the modeled
+    latency of the summary call that runs alongside rendering.
+
+LLM latency is modeled as prompt_tokens / prefill_rate + output_tokens / decode_rate;
+pass the rates your deployment actually sees. Token counts use app/llm/token_counter.py
+(tiktoken when installed, otherwise a character estimate).
+
+Usage (from the project root):
+    python benchmarks/bench_table_renderer.py [--rows 10 100 1000 5000] [--max-tokens 4096]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.llm.function_dispatcher import DispatchResult
+from app.llm.html_renderer import render_result, table_candidate, build_summary_messages
+from app.llm.token_counter import count_tokens
+import app.routers.chat_routes as chat_routes
+
+SUMMARY_OUTPUT_TOKENS = 80
+MODELS = ["MR46", "MR36", "MS120-8", "MX68", "MV12"]
+PRODUCT_TYPES = {"MR": "wireless", "MS": "switch", "MX": "appliance", "MV": "camera"}
+
+
+def inventory(rows: int) -> list:
+    rng = random.Random(rows)
+    devices = []
+    for i in range(rows):
+        model = rng.choice(MODELS)
+        devices.append({
+            "serial": f"Q2XX-{i:04d}-{rng.randrange(16**4):04X}",
+            "mac": ":".join(f"{rng.randrange(256):02x}" for _ in range(6)),
+            "name": f"device-{i}",
+            "model": model,
+            "networkId": f"L_6469716375{rng.randrange(20):02d}",
+            "orderNumber": f"4C{rng.randrange(10**6):06d}",
+            "claimedAt": "2024-03-14T17:20:31.000000Z",
+            "licenseExpirationDate": "2027-03-14T00:00:00Z",
+            "tags": rng.sample(["hq", "branch", "lab", "retail"], 2),
+            "productType": PRODUCT_TYPES[model[:2]],
+            "countryCode": "US",
+            "details": [],
+        })
+    return devices
+
+
+def modeled_ms(prompt_tokens: int, output_tokens: int, args) -> float:
+    return (prompt_tokens / args.prefill_rate + output_tokens / args.decode_rate) * 1000
+
+
+def measure(rows: int, args) -> dict:
+    result = DispatchResult("getOrganizationInventoryDevices", {"organizationId": "123"}, result=inventory(rows))
+
+    # Current path: the whole result goes back to the LLM, which writes the table
+    llm_messages = chat_routes.build_final_messages(result)
+    llm_prompt_tokens = sum(count_tokens(m["content"]) for m in llm_messages)
+
+    # New path: render locally (timed), summary prompt describes the data
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        table = render_result(result)
+        timings.append((time.perf_counter() - start) * 1000)
+    render_ms = statistics.median(timings)
+    summary_messages = build_summary_messages(result, table_candidate(result))
+    summary_prompt_tokens = sum(count_tokens(m["content"]) for m in summary_messages)
+
+    # The LLM would have to emit roughly the same HTML as the renderer (scaled up
+    # when the rendered table was cut at HTML_TABLE_MAX_ROWS)
+    table_tokens = count_tokens(table.html) * rows // table.rows
+    llm_output_tokens = min(table_tokens, args.max_tokens)
+    llm_ms = modeled_ms(llm_prompt_tokens, llm_output_tokens, args)
+    summary_ms = modeled_ms(summary_prompt_tokens, SUMMARY_OUTPUT_TOKENS, args)
+
+    return {
+        "rows": rows,
+        "llm_prompt_tokens": llm_prompt_tokens,
+        "llm_output_tokens": table_tokens,
+        "llm_rows_within_max_tokens": min(rows, int(rows * args.max_tokens / table_tokens)) if table_tokens else rows,
+        "llm_modeled_ms": round(llm_ms),
+        "render_ms": round(render_ms, 2),
+        "summary_prompt_tokens": summary_prompt_tokens,
+        "local_modeled_ms": round(max(render_ms, summary_ms)),
+        "local_without_summary_ms": round(render_ms, 2),
+        "speedup": round(llm_ms / max(render_ms, summary_ms), 1),
+    }
+
+
+def main(args):
+    print(f"prefill {args.prefill_rate:.0f} tok/s, decode {args.decode_rate:.0f} tok/s, max_tokens {args.max_tokens}")
+    results = [measure(rows, args) for rows in args.rows]
+    for entry in results:
+        print(json.dumps(entry))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--max-tokens", type=int, default=int(os.getenv("AZURE_OPENAI_MAX_TOKENS", "4096")))
+    parser.add_argument("--prefill-rate", type=float, default=5000.0, help="prompt tokens per second")
+    parser.add_argument("--decode-rate", type=float, default=60.0, help="output tokens per second")
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
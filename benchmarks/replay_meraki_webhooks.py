@@ -0,0 +1,147 @@
+################################################################################
+## cisco-data-bridge-domain-index/benchmarks/replay_meraki_webhooks.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+"""
+Replay Meraki webhook alerts into the alert store, for testing and timing.
+
+Payloads come from a JSONL file (one webhook body per line, e.g. captured from
+a real receiver) or are generated: --alerts synthetic alerts across --networks
+networks, spread over --days days. They are either POSTed to a running app's
+receiver (--url, with --secret) or added straight to an AlertStore (--store,
+in memory by default), which also reports:
+  - ingest rate (alerts per second)
+  - p50/max latency of per-network, per-type and org-wide alert queries
+  - how many alerts retention (--retention-days) evicted
+
+Usage (from the project root):
+    python benchmarks/replay_meraki_webhooks.py [--file alerts.jsonl] [--alerts 100000]
+        [--url http://localhost:8000/meraki/meraki/webhooks --secret ...] [--store alerts.sqlite]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cisco_integrations.meraki_alert_store import AlertStore
+
+ORG_ID = "123456"
+ALERT_TYPES = [
+    ("appliances_went_down", "Appliance went down", "critical"),
+    ("aps_went_down", "APs went down", "critical"),
+    ("switches_went_down", "Switch went down", "critical"),
+    ("port_down", "Port down", "warning"),
+    ("rogue_ap", "Rogue AP detected", "warning"),
+    ("settings_changed", "Settings changed", "informational"),
+]
+
+
+def synthetic(count: int, networks: int, days: float, secret: str, rng: random.Random):
+    now = time.time()
+    for i in range(count):
+        alert_type_id, alert_type, level = rng.choice(ALERT_TYPES)
+        network = rng.randrange(networks)
+        occurred = now - rng.random() * days * 86400
+        yield {
+            "version": "0.1",
+            "sharedSecret": secret,
+            "sentAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
+            "organizationId": ORG_ID,
+            "organizationName": "Replay Org",
+            "networkId": f"L_{network:05d}",
+            "networkName": f"Site {network}",
+            "deviceSerial": f"Q2XX-{network:04d}-{rng.randrange(20):04d}",
+            "deviceName": f"dev-{network}-{rng.randrange(20)}",
+            "alertId": f"{i:016x}",
+            "alertType": alert_type,
+            "alertTypeId": alert_type_id,
+            "alertLevel": level,
+            "occurredAt": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(occurred)) + f".{int(occurred % 1 * 1e6):06d}Z",
+            "alertData": {},
+        }
+
+
+def from_file(path: str, secret: str):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                payload = json.loads(line)
+                if secret:
+                    payload["sharedSecret"] = secret
+                yield payload
+
+
+def replay_http(payloads, url: str) -> dict:
+    import httpx
+
+    sent, statuses = 0, {}
+    start = time.perf_counter()
+    with httpx.Client(timeout=10) as client:
+        for payload in payloads:
+            status = client.post(url, json=payload).status_code
+            statuses[status] = statuses.get(status, 0) + 1
+            sent += 1
+    elapsed = time.perf_counter() - start
+    return {"sent": sent, "statuses": statuses, "per_second": round(sent / max(elapsed, 1e-9))}
+
+
+def timed(fn, repeat: int) -> dict:
+    ms = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = fn()
+        ms.append((time.perf_counter() - start) * 1000)
+    return {"rows": len(rows), "p50_ms": round(statistics.median(ms), 3), "max_ms": round(max(ms), 3)}
+
+
+def replay_local(payloads, args) -> dict:
+    store = AlertStore(args.store, int(args.retention_days * 86400))
+    start = time.perf_counter()
+    stored = sum(1 for payload in payloads if store.add(payload))
+    elapsed = time.perf_counter() - start
+    evicted = store.evict()
+    day = time.time() - 86400
+    return {
+        "stored": stored,
+        "ingest_per_second": round(stored / max(elapsed, 1e-9)),
+        "evicted": evicted,
+        "network_history": timed(lambda: store.query(organization_id=ORG_ID, network_id="L_00001"), args.queries),
+        "type_last_day": timed(lambda: store.query(organization_id=ORG_ID, alert_type="APs went down", since=day), args.queries),
+        "org_last_day": timed(lambda: store.query(organization_id=ORG_ID, since=day), args.queries),
+        "store": store.stats(),
+    }
+
+
+def main(args):
+    rng = random.Random(args.seed)
+    if args.file:
+        payloads = from_file(args.file, args.secret)
+    else:
+        payloads = synthetic(args.alerts, args.networks, args.days, args.secret, rng)
+    result = replay_http(payloads, args.url) if args.url else replay_local(payloads, args)
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--file", help="JSONL file of webhook payloads (default: synthetic alerts)")
+    parser.add_argument("--alerts", type=int, default=100000)
+    parser.add_argument("--networks", type=int, default=200)
+    parser.add_argument("--days", type=float, default=45)
+    parser.add_argument("--url", help="POST to this receiver instead of a local store")
+    parser.add_argument("--secret", default=os.getenv("MERAKI_WEBHOOK_SECRET", ""))
+    parser.add_argument("--store", default="", help="SQLite file for the local store ('' = memory)")
+    parser.add_argument("--retention-days", type=float, default=30)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    main(parser.parse_args())
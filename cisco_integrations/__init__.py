@@ -13,6 +13,7 @@ from .cisco_meraki_client import CiscoMerakiClient
 from .cisco_spaces_client import CiscoSpacesClient
 from .cisco_webex_client import CiscoWebexClient
 from .unified_service import CiscoUnifiedService
+from .client_pool import ClientPool, CLIENT_POOL, get_unified_service
 
 __all__ = [
     "BaseCiscoClient",
@@ -21,4 +22,7 @@ __all__ = [
     "CiscoSpacesClient",
     "CiscoWebexClient",
     "CiscoUnifiedService",
+    "ClientPool",
+    "CLIENT_POOL",
+    "get_unified_service",
 ]
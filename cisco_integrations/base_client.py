@@ -8,9 +8,29 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 from typing import Any, Optional
 
+# Keep-alive connections kept per host; size it to the dispatch pool so concurrent calls reuse them
+CISCO_HTTP_POOL_MAXSIZE = int(os.getenv("CISCO_HTTP_POOL_MAXSIZE", "16"))
+# Hosts (connection pools) kept per session
+CISCO_HTTP_POOL_CONNECTIONS = int(os.getenv("CISCO_HTTP_POOL_CONNECTIONS", "4"))
+
+
+def pooled_session(verify: bool = True) -> requests.Session:
+    """
+    requests.Session with keep-alive connection pools of CISCO_HTTP_POOL_MAXSIZE per host,
+    so repeated calls skip the TCP and TLS handshakes.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=CISCO_HTTP_POOL_CONNECTIONS, pool_maxsize=CISCO_HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.verify = verify
+    return session
+
+
 class BaseCiscoClient:
     def __init__(self, base_url: str, token: Optional[str] = None):
         """
@@ -19,7 +39,7 @@ class BaseCiscoClient:
         """
         self.base_url = base_url.rstrip('/')
         self.token = token
-        self.session = requests.Session()
+        self.session = pooled_session()
 
     def _headers(self) -> dict:
         """
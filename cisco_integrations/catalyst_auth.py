@@ -0,0 +1,281 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/catalyst_auth.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import requests
+from dotenv import load_dotenv
+
+try:
+    import fcntl
+except ImportError:  # Windows: tokens are still shared within the process
+    fcntl = None
+
+load_dotenv()
+
+# Catalyst Center tokens are valid for 60 minutes; used when the token carries no "exp"
+CATALYST_TOKEN_TTL_S = float(os.getenv("CATALYST_TOKEN_TTL_S", "3600"))
+# Within this much of expiry a token is refreshed in the background while still in use
+CATALYST_TOKEN_REFRESH_MARGIN_S = float(os.getenv("CATALYST_TOKEN_REFRESH_MARGIN_S", "300"))
+# A token with less than this left is not handed out; callers wait for the refresh
+CATALYST_TOKEN_MIN_REMAINING_S = float(os.getenv("CATALYST_TOKEN_MIN_REMAINING_S", "30"))
+# Directory for a token file shared by the uvicorn workers of one host ("" = per process)
+CATALYST_TOKEN_SHARE_DIR = os.getenv("CATALYST_TOKEN_SHARE_DIR", "")
+CATALYST_TOKEN_TIMEOUT_S = float(os.getenv("CATALYST_TOKEN_TIMEOUT_S", "30"))
+
+TOKEN_PATH = "/dna/system/api/v1/auth/token"
+
+
+def token_expiry(token: str, issued_at: float) -> float:
+    """
+    Expiry (epoch seconds) from the token's JWT "exp" claim, or issued_at + CATALYST_TOKEN_TTL_S.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return issued_at + CATALYST_TOKEN_TTL_S
+
+
+class CatalystTokenManager:
+    """
+    One Catalyst Center auth token per (URL, credentials), shared by every client
+    and thread of the process, and optionally by all processes through a token file.
+
+    - token() returns the current token. Close to expiry it starts a single
+      background refresh and keeps serving the old token meanwhile; a missing or
+      nearly expired token is fetched while callers wait (once, not per caller).
+    - refresh_after_401(token) replaces a rejected token. Concurrent 401s for the
+      same token cause one refresh; callers whose token was already replaced get
+      the new one.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        encoded_auth: Optional[str] = None,
+        verify: bool = False,
+        share_dir: str = CATALYST_TOKEN_SHARE_DIR,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.encoded_auth = encoded_auth
+        self.verify = verify
+        key = hashlib.sha256(f"{self.base_url}\x1f{username}\x1f{password}\x1f{encoded_auth}".encode("utf-8"))
+        self.fingerprint = key.hexdigest()[:16]
+        self.share_path = os.path.join(share_dir, f"catalyst-token-{self.fingerprint}.json") if share_dir else None
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._stats = {"fetches": 0, "shared_reads": 0, "refreshes_401": 0, "background_refreshes": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    # -------------------------
+    # Token endpoint
+    # -------------------------
+    def _fetch(self) -> Tuple[str, float]:
+        headers = {"Content-Type": "application/json"}
+        auth = None
+        if self.encoded_auth:
+            headers["Authorization"] = f"Basic {self.encoded_auth}"
+        else:
+            auth = (self.username or "", self.password or "")
+        issued_at = time.time()
+        try:
+            response = requests.post(
+                f"{self.base_url}{TOKEN_PATH}",
+                auth=auth,
+                headers=headers,
+                verify=self.verify,
+                timeout=CATALYST_TOKEN_TIMEOUT_S,
+            )
+            response.raise_for_status()
+            token = response.json()["Token"]
+        except Exception as e:
+            self._count("errors")
+            logging.error(f"Catalyst Center token request to {self.base_url} failed: {e}")
+            raise
+        self._count("fetches")
+        logging.info(f"Catalyst Center token fetched for {self.base_url} ({self.fingerprint[:8]})")
+        return token, token_expiry(token, issued_at)
+
+    # -------------------------
+    # Shared token file
+    # -------------------------
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.share_path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_shared(self) -> Optional[Tuple[str, float]]:
+        try:
+            with open(self.share_path, "r", encoding="utf-8") as f:
+                shared = json.load(f)
+            return shared["token"], float(shared["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_shared(self, token: str, expires_at: float) -> None:
+        directory = os.path.dirname(self.share_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalyst-token-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"token": token, "expires_at": expires_at}, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.share_path)
+        except OSError as e:
+            logging.warning(f"Could not write shared Catalyst Center token to {self.share_path}: {e}")
+
+    # -------------------------
+    # Refresh
+    # -------------------------
+    def _usable(self, expires_at: float, now: float) -> bool:
+        return now < expires_at - CATALYST_TOKEN_MIN_REMAINING_S
+
+    def _refresh(self, stale: Optional[str]) -> str:
+        """
+        Replace 'stale' with a new token, unless another thread or worker already has.
+        """
+        with self._refresh_lock:
+            now = time.time()
+            if self._token and self._token != stale and self._usable(self._expires_at, now):
+                return self._token
+            if self.share_path is None:
+                self._token, self._expires_at = self._fetch()
+                return self._token
+            os.makedirs(os.path.dirname(self.share_path) or ".", exist_ok=True)
+            with self._file_lock():
+                shared = self._read_shared()
+                if shared and shared[0] != stale and self._usable(shared[1], now):
+                    self._count("shared_reads")
+                    self._token, self._expires_at = shared
+                    return self._token
+                self._token, self._expires_at = self._fetch()
+                self._write_shared(self._token, self._expires_at)
+            return self._token
+
+    def _refresh_in_background(self, stale: str) -> None:
+        with self._stats_lock:
+            if self._background is not None and self._background.is_alive():
+                return
+
+            def run():
+                try:
+                    self._refresh(stale)
+                    self._count("background_refreshes")
+                except Exception:
+                    pass  # logged by _fetch; the next token() call retries
+
+            self._background = threading.Thread(target=run, name="catalyst-token-refresh", daemon=True)
+            self._background.start()
+
+    def token(self) -> str:
+        token, expires_at = self._token, self._expires_at
+        now = time.time()
+        if token and now < expires_at - CATALYST_TOKEN_REFRESH_MARGIN_S:
+            return token
+        if token and self._usable(expires_at, now):
+            self._refresh_in_background(token)
+            return token
+        return self._refresh(token)
+
+    def refresh_after_401(self, rejected: Optional[str]) -> str:
+        self._count("refreshes_401")
+        return self._refresh(rejected)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            **stats,
+            "base_url": self.base_url,
+            "has_token": self._token is not None,
+            "expires_in_s": round(self._expires_at - time.time(), 1) if self._token else None,
+            "shared_file": self.share_path,
+        }
+
+
+_managers: Dict[Tuple, CatalystTokenManager] = {}
+_managers_lock = threading.Lock()
+
+
+def catalyst_token_manager(
+    base_url: str,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    encoded_auth: Optional[str] = None,
+    verify: bool = False,
+) -> CatalystTokenManager:
+    """
+    Process-wide token manager for one Catalyst Center URL and credential set.
+    """
+    key = (base_url.rstrip("/"), username, password, encoded_auth, verify)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = CatalystTokenManager(base_url, username, password, encoded_auth, verify)
+            _managers[key] = manager
+        return manager
+
+
+def catalyst_token_stats() -> Dict[str, dict]:
+    with _managers_lock:
+        managers = list(_managers.values())
+    return {manager.fingerprint[:8]: manager.stats() for manager in managers}
+
+
+def use_shared_token(sdk, manager: CatalystTokenManager) -> None:
+    """
+    Make a DNACenterAPI take its X-Auth-Token from the manager before every request
+    (instead of logging in itself) and hand 401s to manager.refresh_after_401, so
+    the SDK's one retry after a 401 uses the replacement token.
+    """
+    session = getattr(sdk, "_session", None)
+    if session is None:
+        return
+
+    def set_token(token: str) -> None:
+        if token != session._access_token:
+            session._access_token = token
+            session.update_headers({"X-Auth-Token": token})
+        session._authenticated = True
+
+    def ensure_authenticated():
+        set_token(manager.token())
+
+    def refresh_token():
+        set_token(manager.refresh_after_401(session._access_token))
+
+    session._get_access_token = manager.token
+    session._ensure_authenticated = ensure_authenticated
+    session.refresh_token = refresh_token
@@ -0,0 +1,104 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/catalyst_commands.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import json
+import time
+import threading
+import statistics
+from collections import deque
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Overall deadline for submitting the commands, waiting for the task and reading the output
+CATALYST_CLI_TIMEOUT_S = float(os.getenv("CATALYST_CLI_TIMEOUT_S", "120"))
+# Task polling: the first wait, growing by POLL_FACTOR per poll up to POLL_MAX
+CATALYST_CLI_POLL_INITIAL_S = float(os.getenv("CATALYST_CLI_POLL_INITIAL_S", "0.5"))
+CATALYST_CLI_POLL_MAX_S = float(os.getenv("CATALYST_CLI_POLL_MAX_S", "5"))
+CATALYST_CLI_POLL_FACTOR = float(os.getenv("CATALYST_CLI_POLL_FACTOR", "1.5"))
+
+# Command runner output statuses, as keys of each device's "commandResponses"
+COMMAND_STATUSES = ("SUCCESS", "FAILURE", "BLACKLISTED")
+
+
+class PollSchedule:
+    """
+    Waits between task polls. The first wait is about half the median of recent
+    task durations (at least initial_s), so a task that usually takes 6 s is not
+    polled ten times; later waits grow by factor up to max_s. No wait runs past
+    the deadline.
+    """
+
+    def __init__(
+        self,
+        initial_s: float = CATALYST_CLI_POLL_INITIAL_S,
+        max_s: float = CATALYST_CLI_POLL_MAX_S,
+        factor: float = CATALYST_CLI_POLL_FACTOR,
+        history: int = 20,
+    ):
+        self.initial_s = initial_s
+        self.max_s = max_s
+        self.factor = factor
+        self._durations = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def first_wait(self) -> float:
+        with self._lock:
+            typical = statistics.median(self._durations) if self._durations else 0.0
+        return min(max(self.initial_s, typical / 2), self.max_s)
+
+    def waits(self, deadline: float):
+        wait = self.first_wait()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(wait, remaining)
+            wait = min(wait * self.factor, self.max_s)
+
+    def record(self, duration_s: float) -> None:
+        with self._lock:
+            self._durations.append(duration_s)
+
+
+# CLI command tasks of every CatalystCenterClient of the process
+POLL_SCHEDULE = PollSchedule()
+
+
+def task_file_id(task: dict) -> Optional[str]:
+    """
+    The output file of a finished command runner task; its "progress" is then
+    a JSON string such as '{"fileId":"..."}' (before that, a status message).
+    """
+    progress = task.get("progress")
+    if isinstance(progress, str) and progress.startswith("{"):
+        try:
+            return json.loads(progress).get("fileId")
+        except ValueError:
+            return None
+    return None
+
+
+def command_results(file_content: List[dict], hostnames: Dict[str, str] = None) -> List[dict]:
+    """
+    Per device, every command with its status and output text, from the command
+    runner output file: [{"deviceUuid": ..., "commandResponses": {"SUCCESS": {cmd: output}, ...}}].
+    """
+    hostnames = hostnames or {}
+    devices = []
+    for entry in file_content or []:
+        device_id = entry.get("deviceUuid")
+        commands = {}
+        for status in COMMAND_STATUSES:
+            for command, output in ((entry.get("commandResponses") or {}).get(status) or {}).items():
+                commands[command] = {"status": status, "output": output}
+        devices.append({"device_id": device_id, "hostname": hostnames.get(device_id), "commands": commands})
+    return devices
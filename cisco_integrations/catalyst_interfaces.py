@@ -0,0 +1,234 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/catalyst_interfaces.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+from dotenv import load_dotenv
+
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Interface store age served without refreshing (and trusted for per-device lookups),
+# and the age up to which a stale store is served while a background refresh runs
+CATALYST_INTERFACES_TTL_S = float(os.getenv("CATALYST_INTERFACES_TTL_S", "300"))
+CATALYST_INTERFACES_MAX_STALE_S = float(os.getenv("CATALYST_INTERFACES_MAX_STALE_S", "1800"))
+# /interface returns at most 500 interfaces per request
+CATALYST_INTERFACES_PAGE_SIZE = int(os.getenv("CATALYST_INTERFACES_PAGE_SIZE", "500"))
+# Rows returned by an interface query that is not grouped
+CATALYST_INTERFACES_MAX_ROWS = int(os.getenv("CATALYST_INTERFACES_MAX_ROWS", "50"))
+
+# Shared by every CatalystCenterClient in the process, keyed by (URL, credentials fingerprint)
+INTERFACE_CACHE = RefreshingCache("catalyst-interfaces", CATALYST_INTERFACES_TTL_S, CATALYST_INTERFACES_MAX_STALE_S)
+
+# Column: /interface field. Repeated strings are stored as categories.
+CATEGORY_COLUMNS = {
+    "device_id": "deviceId",
+    "status": "status",
+    "admin_status": "adminStatus",
+    "port_mode": "portMode",
+    "interface_type": "interfaceType",
+    "duplex": "duplex",
+    "media_type": "mediaType",
+    # Port names and descriptions repeat across devices
+    "port_name": "portName",
+    "description": "description",
+}
+# Unique per interface: not stored as columns, added to listed rows from the records
+ROW_FIELDS = {
+    "mac": "macAddress",
+    "ipv4": "ipv4Address",
+}
+# Columns accepted by InterfaceStore.group_count
+GROUP_COLUMNS = ("status", "admin_status", "port_mode", "interface_type", "duplex", "media_type",
+                 "speed_mbps", "vlan", "hostname", "site")
+
+
+def _speed_mbps(value) -> Optional[float]:
+    # Catalyst Center reports speed in kbps, as a string
+    try:
+        return float(value) / 1000
+    except (TypeError, ValueError):
+        return None
+
+
+def _vlan(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class InterfaceStore:
+    """
+    Every interface of a Catalyst Center (/dna/intent/api/v1/interface) as one
+    pandas DataFrame: repeated strings as categories, speed in Mbps, VLAN as an
+    integer, plus the device hostname and (once ensure_sites has run) site
+    hierarchy. Row i is records[i]. Counts and group-bys ("down ports per site")
+    are computed here, so only the answer goes back to the LLM. The original
+    records are kept for per-device lookups.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        records: List[dict],
+        hostnames: Dict[str, str] = None,
+        device_sites: Dict[str, str] = None,
+        pages: int = 1,
+    ):
+        self.base_url = base_url
+        self.records = records
+        self.pages = pages
+        self.fetched_at = time.time()
+        self._sites_lock = threading.Lock()
+        hostnames = hostnames or {}
+
+        columns = {}
+        for column, field in CATEGORY_COLUMNS.items():
+            values = [record.get(field) for record in records]
+            if column in ("status", "admin_status", "port_mode", "interface_type", "duplex"):
+                values = [value.lower() if isinstance(value, str) else value for value in values]
+            columns[column] = pd.Categorical(values)
+        columns["speed_mbps"] = pd.array([_speed_mbps(r.get("speed")) for r in records], dtype="Float32")
+        columns["vlan"] = pd.array([_vlan(r.get("vlanId")) for r in records], dtype="Int32")
+        device_ids = [record.get("deviceId") for record in records]
+        columns["hostname"] = pd.Categorical([hostnames.get(device_id) for device_id in device_ids])
+        if device_sites is not None:
+            columns["site"] = pd.Categorical([device_sites.get(device_id) for device_id in device_ids])
+        self.frame = pd.DataFrame(columns)
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def has_sites(self) -> bool:
+        return "site" in self.frame.columns
+
+    def ensure_sites(self, load_device_sites: Callable[[], Dict[str, str]]) -> None:
+        """
+        Add the site column from load_device_sites() ({device ID: site hierarchy}) the
+        first time a site filter or group_by="site" needs it; loading it takes one
+        request per site.
+        """
+        with self._sites_lock:
+            if self.has_sites:
+                return
+            device_sites = load_device_sites()
+            sites = pd.Categorical([device_sites.get(record.get("deviceId")) for record in self.records])
+            # A new frame, so concurrent queries keep reading a complete one
+            self.frame = self.frame.assign(site=sites)
+
+    def _mask(
+        self,
+        status: str = None,
+        admin_status: str = None,
+        speed_mbps: float = None,
+        vlan: int = None,
+        device: str = None,
+        site: str = None,
+        port_mode: str = None,
+        interface_type: str = None,
+        port_name: str = None,
+    ) -> pd.Series:
+        frame = self.frame
+        mask = pd.Series(True, index=frame.index)
+        for column, value in (
+            ("status", status),
+            ("admin_status", admin_status),
+            ("port_mode", port_mode),
+            ("interface_type", interface_type),
+        ):
+            if value:
+                mask &= frame[column] == str(value).strip().lower()
+        if speed_mbps is not None:
+            mask &= (frame["speed_mbps"] == float(speed_mbps)).fillna(False)
+        if vlan is not None:
+            mask &= (frame["vlan"] == int(vlan)).fillna(False)
+        # String filters are evaluated once per category, not once per row
+        if device:
+            value = str(device).strip().lower()
+            # "edge-1" also matches "edge-1.example.com"
+            hostnames = [name for name in frame["hostname"].cat.categories
+                         if name.lower() == value or name.lower().split(".")[0] == value]
+            mask &= (frame["device_id"] == str(device).strip()) | frame["hostname"].isin(hostnames)
+        if site:
+            if not self.has_sites:
+                raise ValueError("Interface sites are not loaded (see InterfaceStore.ensure_sites)")
+            prefix = str(site).strip().strip("/").lower()
+            # A site matches its whole subtree: "Global/USA" covers "Global/USA/San Jose/..."
+            sites = [name for name in frame["site"].cat.categories
+                     if name.lower() == prefix or name.lower().startswith(prefix + "/")]
+            mask &= frame["site"].isin(sites)
+        if port_name:
+            value = str(port_name).lower()
+            port_names = [name for name in frame["port_name"].cat.categories if value in name.lower()]
+            mask &= frame["port_name"].isin(port_names)
+        return mask
+
+    def filter(self, **filters) -> pd.DataFrame:
+        """
+        Rows matching every given filter: status, admin_status, speed_mbps, vlan,
+        device (ID or hostname), site (hierarchy, including sites below it),
+        port_mode, interface_type, port_name (substring).
+        """
+        return self.frame[self._mask(**filters)]
+
+    def count(self, **filters) -> int:
+        return int(self._mask(**filters).sum())
+
+    def group_count(self, by: str, **filters) -> Dict[str, int]:
+        """
+        Matching interfaces per value of column 'by' (see GROUP_COLUMNS), largest first.
+        """
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by '{by}'; use one of {', '.join(GROUP_COLUMNS)}")
+        counts = self.filter(**filters)[by].value_counts(dropna=False)
+        return {
+            ("unknown" if pd.isna(value) else str(value)): int(count)
+            for value, count in counts.items() if count
+        }
+
+    def rows(self, frame: pd.DataFrame, limit: int = CATALYST_INTERFACES_MAX_ROWS) -> List[dict]:
+        """
+        Up to 'limit' rows as compact dicts (columns without a value left out).
+        """
+        result = []
+        head = frame.head(limit)
+        for position, row in zip(head.index, head.to_dict("records")):
+            record = self.records[position]
+            row.update({column: record.get(field) for column, field in ROW_FIELDS.items()})
+            result.append({
+                # NumPy scalars (speed, VLAN) as plain numbers for JSON
+                key: value.item() if hasattr(value, "item") else value
+                for key, value in row.items() if value is not None and not pd.isna(value)
+            })
+        return result
+
+    def device_records(self, device_id: str) -> List[dict]:
+        """
+        The original /interface records of one device.
+        """
+        positions = (self.frame["device_id"] == device_id).to_numpy().nonzero()[0]
+        return [self.records[position] for position in positions]
+
+    def summary(self) -> dict:
+        return {
+            "base_url": self.base_url,
+            "interfaces": len(self.frame),
+            "devices": int(self.frame["device_id"].nunique()),
+            "pages": self.pages,
+            "age_s": round(self.age_s, 1),
+            "memory_kb": round(float(self.frame.memory_usage(deep=True).sum()) / 1024, 1),
+            "status": self.group_count("status"),
+        }
@@ -0,0 +1,110 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/catalyst_inventory.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from cisco_integrations.meraki_inventory import normalize_mac
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Snapshot age served without refreshing (and trusted for single-device lookups),
+# and the age up to which a stale snapshot is served while a background refresh runs
+CATALYST_DEVICES_TTL_S = float(os.getenv("CATALYST_DEVICES_TTL_S", "300"))
+CATALYST_DEVICES_MAX_STALE_S = float(os.getenv("CATALYST_DEVICES_MAX_STALE_S", "1800"))
+# /network-device returns at most 500 devices per request
+CATALYST_DEVICES_PAGE_SIZE = int(os.getenv("CATALYST_DEVICES_PAGE_SIZE", "500"))
+# Pages fetched in parallel
+CATALYST_DEVICES_PAGE_WORKERS = int(os.getenv("CATALYST_DEVICES_PAGE_WORKERS", "4"))
+
+# Shared by every CatalystCenterClient in the process, keyed by (URL, credentials fingerprint)
+DEVICE_CACHE = RefreshingCache("catalyst-devices", CATALYST_DEVICES_TTL_S, CATALYST_DEVICES_MAX_STALE_S)
+
+
+def page_offsets(count: int, page_size: int = CATALYST_DEVICES_PAGE_SIZE) -> List[int]:
+    """
+    1-based offsets of the pages holding 'count' devices.
+    """
+    return [offset + 1 for offset in range(0, max(count, 1), page_size)]
+
+
+class DeviceSnapshot:
+    """
+    All network devices of a Catalyst Center (/dna/intent/api/v1/network-device)
+    with lookup indexes built once per fetch. Lookups return the shared device
+    dicts, which callers should treat as read-only.
+    """
+
+    def __init__(self, base_url: str, devices: List[dict], pages: int = 1):
+        self.base_url = base_url
+        self.devices = devices
+        self.pages = pages
+        self.fetched_at = time.time()
+        self.by_id: Dict[str, dict] = {}
+        self.by_hostname: Dict[str, dict] = {}
+        self.by_ip: Dict[str, dict] = {}
+        self.by_serial: Dict[str, dict] = {}
+        self.by_mac: Dict[str, dict] = {}
+
+        for device in devices:
+            if device.get("id"):
+                self.by_id[device["id"]] = device
+            hostname = (device.get("hostname") or "").strip().lower()
+            if hostname:
+                self.by_hostname[hostname] = device
+                # "edge-1.example.com" is also found as "edge-1"
+                self.by_hostname.setdefault(hostname.split(".")[0], device)
+            if device.get("managementIpAddress"):
+                self.by_ip[device["managementIpAddress"]] = device
+            # Stacks list every member's serial: "FOC1, FOC2"
+            for serial in (device.get("serialNumber") or "").split(","):
+                if serial.strip():
+                    self.by_serial[serial.strip().upper()] = device
+            if device.get("macAddress"):
+                self.by_mac[normalize_mac(device["macAddress"])] = device
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.fetched_at
+
+    def device(
+        self,
+        id: str = None,
+        hostname: str = None,
+        ip: str = None,
+        serial: str = None,
+        mac: str = None,
+    ) -> Optional[dict]:
+        if id:
+            return self.by_id.get(id.strip())
+        if hostname:
+            return self.by_hostname.get(hostname.strip().lower())
+        if ip:
+            return self.by_ip.get(ip.strip())
+        if serial:
+            return self.by_serial.get(serial.strip().upper())
+        if mac:
+            return self.by_mac.get(normalize_mac(mac))
+        return None
+
+    def summary(self) -> dict:
+        families: Dict[str, int] = {}
+        for device in self.devices:
+            family = device.get("family") or "Unknown"
+            families[family] = families.get(family, 0) + 1
+        return {
+            "base_url": self.base_url,
+            "devices": len(self.devices),
+            "pages": self.pages,
+            "age_s": round(self.age_s, 1),
+            "families": families,
+        }
@@ -0,0 +1,94 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/catalyst_path_trace.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from cisco_integrations.catalyst_commands import PollSchedule
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# How long a path trace may take, from the request until COMPLETED/FAILED
+CATALYST_PATH_TRACE_TIMEOUT_S = float(os.getenv("CATALYST_PATH_TRACE_TIMEOUT_S", "60"))
+# Finished traces are reused for identical source/destination/protocol/ports for this long
+CATALYST_PATH_TRACE_CACHE_TTL_S = float(os.getenv("CATALYST_PATH_TRACE_CACHE_TTL_S", "120"))
+CATALYST_PATH_TRACE_CACHE_SIZE = int(os.getenv("CATALYST_PATH_TRACE_CACHE_SIZE", "256"))
+CATALYST_PATH_TRACE_POLL_INITIAL_S = float(os.getenv("CATALYST_PATH_TRACE_POLL_INITIAL_S", "1"))
+CATALYST_PATH_TRACE_POLL_MAX_S = float(os.getenv("CATALYST_PATH_TRACE_POLL_MAX_S", "5"))
+
+# Flow analysis request statuses that end polling
+FINAL_STATUSES = ("COMPLETED", "FAILED")
+
+# Keyed by (URL, credentials fingerprint, source, destination, protocol, source port, destination port).
+# No stale serving: a trace older than the TTL is run again.
+PATH_TRACE_CACHE = RefreshingCache(
+    "catalyst-path-traces", CATALYST_PATH_TRACE_CACHE_TTL_S, 0, max_entries=CATALYST_PATH_TRACE_CACHE_SIZE
+)
+PATH_TRACE_POLLS = PollSchedule(CATALYST_PATH_TRACE_POLL_INITIAL_S, CATALYST_PATH_TRACE_POLL_MAX_S)
+
+
+class PathTraceTimeout(Exception):
+    """
+    Raised when a flow analysis has not finished before the deadline; not cached.
+    """
+
+    def __init__(self, flow_analysis_id: str, status: Optional[str]):
+        super().__init__(f"Path trace {flow_analysis_id} not finished (status {status})")
+        self.flow_analysis_id = flow_analysis_id
+        self.status = status
+
+
+def _interface_name(interface: Optional[dict]) -> Optional[str]:
+    if not interface:
+        return None
+    for kind in ("physicalInterface", "virtualInterface"):
+        value = interface.get(kind)
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if value and value.get("name"):
+            return value["name"]
+    return None
+
+
+def compact_hops(elements: List[dict]) -> List[dict]:
+    """
+    The hops of a flow analysis ("networkElementsInfo") with only what a path
+    rendering needs: name, IP, type, role, ingress/egress interface and link source.
+    """
+    hops = []
+    for number, element in enumerate(elements or [], start=1):
+        hops.append({
+            "hop": number,
+            "name": element.get("name"),
+            "ip": element.get("ip"),
+            "type": element.get("type"),
+            "role": element.get("role"),
+            "ingress": _interface_name(element.get("ingressInterface")),
+            "egress": _interface_name(element.get("egressInterface")),
+            "link_source": element.get("linkInformationSource"),
+        })
+    return hops
+
+
+def path_trace_summary(flow_analysis_id: str, result: dict, elapsed_s: float) -> dict:
+    """
+    A finished flow analysis (the "response" of GET /flow-analysis/{id}) as status plus compact hops.
+    """
+    request = result.get("request") or {}
+    return {
+        "flow_analysis_id": flow_analysis_id,
+        "status": request.get("status"),
+        "failure_reason": request.get("failureReason"),
+        "source_ip": request.get("sourceIP"),
+        "destination_ip": request.get("destIP"),
+        "hops": compact_hops(result.get("networkElementsInfo")),
+        "elapsed_s": round(elapsed_s, 2),
+    }
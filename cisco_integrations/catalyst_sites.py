@@ -0,0 +1,177 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/catalyst_sites.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+import difflib
+from collections import deque
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Site hierarchy age served without refreshing, and up to which a stale one is
+# served while it is refreshed in the background
+CATALYST_SITES_TTL_S = float(os.getenv("CATALYST_SITES_TTL_S", "600"))
+CATALYST_SITES_MAX_STALE_S = float(os.getenv("CATALYST_SITES_MAX_STALE_S", "3600"))
+# /site returns at most 500 sites per request
+CATALYST_SITES_PAGE_SIZE = int(os.getenv("CATALYST_SITES_PAGE_SIZE", "500"))
+# Sites queried in parallel for the devices of a site subtree
+CATALYST_SITE_FANOUT_WORKERS = int(os.getenv("CATALYST_SITE_FANOUT_WORKERS", "8"))
+
+# Shared by every CatalystCenterClient in the process, keyed by (URL, credentials fingerprint)
+SITE_CACHE = RefreshingCache("catalyst-sites", CATALYST_SITES_TTL_S, CATALYST_SITES_MAX_STALE_S)
+
+
+def _hierarchy_key(name: str) -> str:
+    """
+    "Global/USA/San Jose/", "global/usa/san jose" and "USA/San Jose" all give "global/usa/san jose".
+    """
+    parts = [part.strip().lower() for part in (name or "").strip().strip("/").split("/") if part.strip()]
+    if parts and parts[0] != "global":
+        parts.insert(0, "global")
+    return "/".join(parts)
+
+
+def site_type(site: dict) -> str:
+    """
+    "area", "building" or "floor" from the site's Location attributes ("global" for the root).
+    """
+    for info in site.get("additionalInfo") or []:
+        if info.get("nameSpace") == "Location":
+            location_type = (info.get("attributes") or {}).get("type")
+            if location_type:
+                return location_type
+    return "global" if not site.get("parentId") else "area"
+
+
+class SiteTree:
+    """
+    The site hierarchy of a Catalyst Center (/dna/intent/api/v1/site), with
+    id, name hierarchy and leaf name indexes and parent/child links built once
+    per fetch, so site names resolve to IDs without an API call.
+    """
+
+    def __init__(self, base_url: str, sites: List[dict]):
+        self.base_url = base_url
+        self.sites = sites
+        self.fetched_at = time.time()
+        self.by_id: Dict[str, dict] = {}
+        self.by_hierarchy: Dict[str, dict] = {}
+        self.by_name: Dict[str, List[dict]] = {}
+        self.children: Dict[str, List[str]] = {}
+
+        for site in sites:
+            if not site.get("id"):
+                continue
+            self.by_id[site["id"]] = site
+            self.by_hierarchy[_hierarchy_key(site.get("siteNameHierarchy") or site.get("name"))] = site
+            self.by_name.setdefault((site.get("name") or "").strip().lower(), []).append(site)
+        for site in self.by_id.values():
+            parent_id = site.get("parentId")
+            if parent_id in self.by_id:
+                self.children.setdefault(parent_id, []).append(site["id"])
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.fetched_at
+
+    def ancestors(self, site_id: str) -> List[dict]:
+        """
+        The sites above site_id, from Global down to its parent.
+        """
+        chain, seen = [], {site_id}
+        parent_id = (self.by_id.get(site_id) or {}).get("parentId")
+        while parent_id in self.by_id and parent_id not in seen:
+            seen.add(parent_id)
+            chain.append(self.by_id[parent_id])
+            parent_id = self.by_id[parent_id].get("parentId")
+        return list(reversed(chain))
+
+    def descendants(self, site_id: str, include_self: bool = True) -> List[dict]:
+        """
+        The site and every site below it, breadth first.
+        """
+        if site_id not in self.by_id:
+            return []
+        found, queue = [], deque([site_id])
+        while queue:
+            current = queue.popleft()
+            if current != site_id or include_self:
+                found.append(self.by_id[current])
+            queue.extend(self.children.get(current, []))
+        return found
+
+    def resolve(self, site: str) -> Optional[dict]:
+        """
+        The site for an ID, a name hierarchy ("Global/USA/San Jose", "USA/San Jose")
+        or a leaf name that is unique ("San Jose"). Only exact matches: None if there
+        is none or the name is ambiguous (see not_found for close candidates).
+        """
+        if not site:
+            return None
+        site = site.strip()
+        if site in self.by_id:
+            return self.by_id[site]
+        key = _hierarchy_key(site)
+        if key in self.by_hierarchy:
+            return self.by_hierarchy[key]
+        same_name = self.by_name.get(site.strip("/").lower(), [])
+        return same_name[0] if len(same_name) == 1 else None
+
+    def _scored(self, site: str, cutoff: float = 0.75) -> List[tuple]:
+        """
+        (similarity, site) for sites whose name hierarchy or leaf name is close to 'site', best first.
+        """
+        key = _hierarchy_key(site)
+        query = (site or "").strip().strip("/").lower()
+        best: Dict[str, tuple] = {}
+        for candidate_key, candidate in self.by_hierarchy.items():
+            score = difflib.SequenceMatcher(None, key, candidate_key).ratio()
+            name = (candidate.get("name") or "").lower()
+            score = max(score, difflib.SequenceMatcher(None, query, name).ratio())
+            if score >= cutoff and score > best.get(candidate["id"], (0,))[0]:
+                best[candidate["id"]] = (score, candidate)
+        return sorted(best.values(), key=lambda pair: pair[0], reverse=True)
+
+    def matches(self, site: str, limit: int = 5) -> List[dict]:
+        """
+        Sites whose name hierarchy or leaf name is close to 'site', best first.
+        """
+        return [candidate for _, candidate in self._scored(site)[:limit]]
+
+    def not_found(self, site: str) -> dict:
+        """
+        The error for a site that does not resolve, with the closest sites as candidates.
+        """
+        return {
+            "error": f"No single site matches '{site}'.",
+            "candidates": [self.record(match) for match in self.matches(site)],
+        }
+
+    def record(self, site: dict) -> dict:
+        """
+        A site as id, name, name hierarchy, type and parent.
+        """
+        return {
+            "id": site.get("id"),
+            "name": site.get("name"),
+            "hierarchy": site.get("siteNameHierarchy"),
+            "type": site_type(site),
+            "parent_id": site.get("parentId"),
+        }
+
+    def summary(self) -> dict:
+        types: Dict[str, int] = {}
+        for site in self.by_id.values():
+            kind = site_type(site)
+            types[kind] = types.get(kind, 0) + 1
+        return {"base_url": self.base_url, "sites": len(self.by_id), "age_s": round(self.age_s, 1), "types": types}
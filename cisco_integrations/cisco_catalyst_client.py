@@ -7,9 +7,38 @@
 ################################################################################
 
 from .base_client import BaseCiscoClient
+from .catalyst_auth import catalyst_token_manager, use_shared_token
+from .catalyst_commands import CATALYST_CLI_TIMEOUT_S, POLL_SCHEDULE, command_results, task_file_id
+from .catalyst_interfaces import (
+    CATALYST_INTERFACES_MAX_ROWS,
+    CATALYST_INTERFACES_PAGE_SIZE,
+    CATALYST_INTERFACES_TTL_S,
+    INTERFACE_CACHE,
+    InterfaceStore,
+)
+from .catalyst_sites import CATALYST_SITE_FANOUT_WORKERS, CATALYST_SITES_PAGE_SIZE, SITE_CACHE, SiteTree
+from .catalyst_path_trace import (
+    CATALYST_PATH_TRACE_TIMEOUT_S,
+    FINAL_STATUSES,
+    PATH_TRACE_CACHE,
+    PATH_TRACE_POLLS,
+    PathTraceTimeout,
+    path_trace_summary,
+)
+from .catalyst_inventory import (
+    CATALYST_DEVICES_PAGE_SIZE,
+    CATALYST_DEVICES_PAGE_WORKERS,
+    CATALYST_DEVICES_TTL_S,
+    DEVICE_CACHE,
+    DeviceSnapshot,
+    page_offsets,
+)
+from concurrent.futures import ThreadPoolExecutor
 from dnacentersdk import DNACenterAPI, ApiError
+import hashlib
 import logging
 import requests 
+import time
 
 class CatalystCenterClient(BaseCiscoClient):
     """
@@ -26,13 +55,26 @@ class CatalystCenterClient(BaseCiscoClient):
         dnac_version: str = "2.3.7.6"
     ):
         super().__init__(base_url, token)
+        # The SDK and the direct REST helpers share this session's keep-alive connections
+        self.session.verify = dnac_verify
+        # Login tokens come from the process-wide manager for these credentials (see catalyst_auth.py)
+        self.token_manager = None
+        if not token and (dnac_encoded_auth or (dnac_username and dnac_password)):
+            self.token_manager = catalyst_token_manager(
+                base_url, dnac_username, dnac_password, dnac_encoded_auth, dnac_verify
+            )
+        # Device snapshots are shared by every client of the same Catalyst Center and credentials
+        credentials = self.token_manager.fingerprint if self.token_manager else \
+            hashlib.sha256((token or "").encode()).hexdigest()[:16]
+        self._cache_key = (self.base_url, credentials)
         try:
             if dnac_encoded_auth:
                 self.sdk = DNACenterAPI(
                     encoded_auth=dnac_encoded_auth,
                     base_url=base_url,
                     verify=dnac_verify,
-                    version=dnac_version
+                    version=dnac_version,
+                    session=self.session
                 )
             elif dnac_username and dnac_password:
                 self.sdk = DNACenterAPI(
@@ -40,26 +82,108 @@ class CatalystCenterClient(BaseCiscoClient):
                     password=dnac_password,
                     base_url=base_url,
                     verify=dnac_verify,
-                    version=dnac_version
+                    version=dnac_version,
+                    session=self.session
                 )
             else:
                 self.sdk = DNACenterAPI(
                     base_url=base_url,
                     verify=dnac_verify,
-                    version=dnac_version
+                    version=dnac_version,
+                    session=self.session
                 )
+            if self.token_manager:
+                use_shared_token(self.sdk, self.token_manager)
             logging.info("DNACenterAPI client successfully created.")
         except Exception as e:
             logging.error(f"Error creating DNACenterAPI client: {e}")
             self.sdk = None
 
+    def _auth_token(self) -> str:
+        if self.token:
+            return self.token
+        if self.token_manager:
+            return self.token_manager.token()
+        return self.sdk.access_token
+
+    def _direct_get(self, url: str, params: dict = None):
+        """
+        GET a Catalyst Center URL over the pooled session with the shared auth token.
+        A 401 replaces the token once (for every client of these credentials) and retries.
+        """
+        token = self._auth_token()
+        headers = {"Accept": "application/json", "X-Auth-Token": token}
+        resp = self.session.get(url, headers=headers, params=params, timeout=30, verify=self.session.verify)
+        if resp.status_code == 401 and self.token_manager:
+            headers["X-Auth-Token"] = self.token_manager.refresh_after_401(token)
+            resp = self.session.get(url, headers=headers, params=params, timeout=30, verify=self.session.verify)
+        resp.raise_for_status()
+        return resp
+
+    def _fetch_all_pages(self, path: str, page_size: int, workers: int) -> tuple:
+        """
+        Every record of a paged list endpoint: {path}/count first, then all offset/limit
+        pages with up to 'workers' requests in flight. Returns (records, pages fetched).
+        """
+        url = f"{self.base_url}{path}"
+        count = int(self._direct_get(f"{url}/count").json().get("response") or 0)
+        offsets = page_offsets(count, page_size)
+
+        def page(offset: int) -> list:
+            params = {"offset": offset, "limit": page_size}
+            return self._direct_get(url, params=params).json().get("response") or []
+
+        workers = max(1, min(workers, len(offsets)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="catalyst-pages") as pool:
+            pages = list(pool.map(page, offsets))
+        # Records added since the count: keep paging until a page is not full
+        while pages[-1] and len(pages[-1]) >= page_size:
+            offsets.append(offsets[-1] + page_size)
+            pages.append(page(offsets[-1]))
+
+        # A record added or removed mid-crawl shifts the others between pages; keep one copy each
+        records, seen = [], set()
+        for batch in pages:
+            for record in batch:
+                record_id = record.get("id")
+                if record_id in seen:
+                    continue
+                if record_id:
+                    seen.add(record_id)
+                records.append(record)
+        return records, len(pages)
+
+    def _fetch_devices(self) -> DeviceSnapshot:
+        devices, pages = self._fetch_all_pages(
+            "/dna/intent/api/v1/network-device", CATALYST_DEVICES_PAGE_SIZE, CATALYST_DEVICES_PAGE_WORKERS
+        )
+        return DeviceSnapshot(self.base_url, devices, pages=pages)
+
+    def device_snapshot(self, force_refresh: bool = False) -> DeviceSnapshot:
+        """
+        All network devices with id/hostname/IP/serial/MAC indexes, shared by every client
+        of the same Catalyst Center and credentials. Fetched at most once per
+        CATALYST_DEVICES_TTL_S; an older snapshot (up to CATALYST_DEVICES_MAX_STALE_S) is
+        returned immediately while it is refreshed in the background.
+        """
+        return DEVICE_CACHE.get(self._cache_key, self._fetch_devices, force_refresh=force_refresh)
+
+    def _fresh_snapshot(self):
+        """
+        The cached device snapshot if it is younger than CATALYST_DEVICES_TTL_S, else None.
+        Single-device lookups use it instead of an API call.
+        """
+        snapshot = DEVICE_CACHE.peek(self._cache_key)
+        if snapshot is not None and snapshot.age_s < CATALYST_DEVICES_TTL_S:
+            return snapshot
+        return None
+
     def get_all_devices(self):
-        if not self.sdk:
+        if not self.sdk and not self.token:
             logging.error("DNACenterAPI client not initialized.")
             return []
         try:
-            devices = self.sdk.devices.get_device_list()
-            return devices.response if hasattr(devices, 'response') else devices
+            return self.device_snapshot().devices
         except ApiError as e:
             logging.error(f"API Error retrieving devices: {e}")
             return []
@@ -68,6 +192,10 @@ class CatalystCenterClient(BaseCiscoClient):
             return []
 
     def get_device_by_id(self, device_id):
+        snapshot = self._fresh_snapshot()
+        device = snapshot.device(id=device_id) if snapshot else None
+        if device is not None:
+            return {"response": device}
         if not self.sdk:
             logging.error("DNACenterAPI client not initialized.")
             return None
@@ -92,6 +220,89 @@ class CatalystCenterClient(BaseCiscoClient):
             logging.error(f"Error running CLI command: {e}")
             return {"error": str(e)}
 
+    def _resolve_device_ids(self, devices: list) -> tuple:
+        """
+        Device UUIDs for a mix of UUIDs, hostnames and management IPs (looked up in the
+        device snapshot), and the hostname of each UUID that is known.
+        """
+        try:
+            snapshot = self._fresh_snapshot() or self.device_snapshot()
+        except Exception as e:
+            logging.warning(f"Device snapshot unavailable, using device IDs as given: {e}")
+            snapshot = None
+        ids, hostnames = [], {}
+        for value in devices:
+            device = None
+            if snapshot is not None:
+                device = snapshot.device(id=value) or snapshot.device(hostname=value) or snapshot.device(ip=value)
+            device_id = device.get("id") if device else value
+            ids.append(device_id)
+            if device and device.get("hostname"):
+                hostnames[device_id] = device["hostname"]
+        return ids, hostnames
+
+    def run_cli_commands(self, devices: list, commands: list, timeout_s: float = None):
+        """
+        Run read-only CLI commands on devices and return their output in one call:
+        submits one command runner request for all devices x commands, polls the task
+        (see PollSchedule), then reads the output file, all within timeout_s.
+        Devices may be given by UUID, hostname or management IP.
+        """
+        if not self.sdk:
+            logging.error("DNACenterAPI client not initialized.")
+            return {"error": "DNACenterAPI client not initialized."}
+        if isinstance(devices, str):
+            devices = [devices]
+        if isinstance(commands, str):
+            commands = [commands]
+        if not devices or not commands:
+            return {"error": "At least one device and one command are required."}
+
+        start = time.monotonic()
+        deadline = start + (timeout_s or CATALYST_CLI_TIMEOUT_S)
+        device_ids, hostnames = self._resolve_device_ids(devices)
+        try:
+            payload = {"commands": list(commands), "deviceUuids": device_ids}
+            submitted = self.sdk.command_runner.run_read_only_commands_on_devices(payload=payload)
+            task_id = submitted["response"]["taskId"]
+        except Exception as e:
+            logging.error(f"Error running CLI commands: {e}")
+            return {"error": str(e)}
+
+        task_url = f"{self.base_url}/dna/intent/api/v1/task/{task_id}"
+        polls, task = 0, {}
+        try:
+            for wait in POLL_SCHEDULE.waits(deadline):
+                time.sleep(wait)
+                polls += 1
+                task = self._direct_get(task_url).json().get("response") or {}
+                if task.get("isError"):
+                    return {
+                        "error": task.get("failureReason") or task.get("progress") or "Command runner task failed.",
+                        "task_id": task_id,
+                    }
+                file_id = task_file_id(task)
+                if file_id:
+                    POLL_SCHEDULE.record(time.monotonic() - start)
+                    output = self._direct_get(f"{self.base_url}/dna/intent/api/v1/file/{file_id}").json()
+                    return {
+                        "task_id": task_id,
+                        "file_id": file_id,
+                        "polls": polls,
+                        "elapsed_s": round(time.monotonic() - start, 2),
+                        "devices": command_results(output, hostnames),
+                    }
+        except Exception as e:
+            logging.error(f"Error waiting for CLI command task {task_id}: {e}")
+            return {"error": str(e), "task_id": task_id}
+        logging.warning(f"CLI command task {task_id} not finished after {polls} polls")
+        return {
+            "error": "Timed out waiting for the command output. Check the task with get_catalyst_task_status_by_id.",
+            "task_id": task_id,
+            "progress": task.get("progress"),
+            "elapsed_s": round(time.monotonic() - start, 2),
+        }
+
     def get_task_status_by_id(self, task_id: str):
         if not self.sdk:
             logging.error("DNACenterAPI client not initialized.")
@@ -112,13 +323,41 @@ class CatalystCenterClient(BaseCiscoClient):
         except ApiError as e:
             return {"error": f"Failed to retrieve file: {e}"}
 
+    def _fetch_sites(self) -> SiteTree:
+        url = f"{self.base_url}/dna/intent/api/v1/site"
+        sites, offset = [], 1
+        while True:
+            params = {"offset": offset, "limit": CATALYST_SITES_PAGE_SIZE}
+            page = self._direct_get(url, params=params).json().get("response") or []
+            sites.extend(page)
+            if len(page) < CATALYST_SITES_PAGE_SIZE:
+                return SiteTree(self.base_url, sites)
+            offset += CATALYST_SITES_PAGE_SIZE
+
+    def site_tree(self, force_refresh: bool = False) -> SiteTree:
+        """
+        The site hierarchy with name/ID indexes, shared by every client of the same
+        Catalyst Center and credentials and refreshed after CATALYST_SITES_TTL_S.
+        """
+        return SITE_CACHE.get(self._cache_key, self._fetch_sites, force_refresh=force_refresh)
+
+    def resolve_site_id(self, site: str):
+        """
+        Site ID for an ID, name hierarchy or unique site name; None if unknown.
+        """
+        try:
+            found = self.site_tree().resolve(site)
+        except Exception as e:
+            logging.warning(f"Site hierarchy unavailable, using '{site}' as a site ID: {e}")
+            return site
+        return found.get("id") if found else None
+
     def get_all_sites(self):
-        if not self.sdk:
+        if not self.sdk and not self.token:
             logging.error("DNACenterAPI client not initialized.")
             return {"error": "DNACenterAPI client not initialized."}
         try:
-            response = self.sdk.sites.get_site()
-            return response.get('response', [])
+            return self.site_tree().sites
         except ApiError as e:
             logging.error(f"API Error retrieving sites: {e}")
             return {"error": f"Failed to retrieve sites: {e}"}
@@ -149,20 +388,22 @@ class CatalystCenterClient(BaseCiscoClient):
         Uses DNA Center v1 endpoint /dna/intent/api/v1/site
         with the query param `name` = site_name
         Returns JSON data if available.
+        Answered from the cached site hierarchy when it has the site.
         """
         if not self.sdk and not self.token:
             logging.error("No DNACenterAPI client or token available.")
             return {"error": "DNACenterAPI client or token not initialized."}
 
+        try:
+            site = self.site_tree().resolve(site_name)
+            if site is not None:
+                return [site]
+        except Exception as e:
+            logging.warning(f"Site hierarchy unavailable for '{site_name}': {e}")
+
         # Build the full URL. e.g. https://sandboxdnac.cisco.com
         url = f"{self.base_url}/dna/intent/api/v1/site"
 
-        # Use the stored token or dnacentersdk's access token
-        headers = {
-            "Accept": "application/json",
-            "X-Auth-Token": self.token if self.token else self.sdk.access_token
-        }
-
         # Pass the site name hierarchy via query params
         # For v1, you use 'name' instead of 'groupNameHierarchy'
         params = {
@@ -170,8 +411,7 @@ class CatalystCenterClient(BaseCiscoClient):
         }
 
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=30, verify=False)
-            resp.raise_for_status()
+            resp = self._direct_get(url, params=params)
             # Convert response to JSON
             json_data = resp.json()
             # The v1 "get_site" response typically has a "response" key that is a list
@@ -183,6 +423,28 @@ class CatalystCenterClient(BaseCiscoClient):
             logging.error(f"Unknown error retrieving site by name '{site_name}': {ex}")
             return {"error": str(ex)}
 
+    def get_site_by_name_v2(self, site_name: str):
+        """
+        A site by name hierarchy, name or ID with its ancestors and child sites, from
+        the cached site hierarchy; an unknown site returns the closest sites as candidates.
+        """
+        if not self.sdk and not self.token:
+            logging.error("No DNACenterAPI client or token available.")
+            return {"error": "DNACenterAPI client or token not initialized."}
+        try:
+            tree = self.site_tree()
+        except Exception as e:
+            logging.error(f"Error retrieving site hierarchy: {e}")
+            return {"error": str(e)}
+        site = tree.resolve(site_name)
+        if site is None:
+            return tree.not_found(site_name)
+        return {
+            **tree.record(site),
+            "ancestors": [tree.record(ancestor) for ancestor in tree.ancestors(site["id"])],
+            "children": [tree.record(tree.by_id[child]) for child in tree.children.get(site["id"], [])],
+        }
+
     def get_catalyst_system_info(self):
         if not self.sdk:
             logging.error("DNACenterAPI client not initialized.")
@@ -211,18 +473,124 @@ class CatalystCenterClient(BaseCiscoClient):
             logging.error(f"Unknown error retrieving packages summary: {ex}")
             return {"error": f"Unknown error: {ex}"}
 
+    def device_site_map(self) -> dict:
+        """
+        Site hierarchy of every device assigned to a site, from one request per site
+        of the cached site tree ({} if the sites cannot be read). Loaded into the
+        interface store only when a query filters or groups by site.
+        """
+        try:
+            tree = self.site_tree()
+            device_sites = {}
+            for root in tree.by_id.values():
+                if root.get("parentId") not in tree.by_id:
+                    for device in self._get_devices_in_site_tree(tree, root["id"])["devices"]:
+                        device_sites[device.get("id")] = device.get("siteNameHierarchy")
+            return device_sites
+        except Exception as e:
+            logging.warning(f"Device sites unavailable for the interface store: {e}")
+            return {}
+
+    def _fetch_interfaces(self) -> InterfaceStore:
+        records, pages = self._fetch_all_pages(
+            "/dna/intent/api/v1/interface", CATALYST_INTERFACES_PAGE_SIZE, CATALYST_DEVICES_PAGE_WORKERS
+        )
+        try:
+            hostnames = {device.get("id"): device.get("hostname") for device in self.device_snapshot().devices}
+        except Exception as e:
+            logging.warning(f"Device hostnames unavailable for the interface store: {e}")
+            hostnames = {}
+        return InterfaceStore(self.base_url, records, hostnames, pages=pages)
+
+    def interface_store(self, force_refresh: bool = False) -> InterfaceStore:
+        """
+        Every interface as a columnar InterfaceStore with device hostnames (sites are
+        added on first use), shared by every client of the same Catalyst Center and
+        credentials and refreshed after CATALYST_INTERFACES_TTL_S.
+        """
+        return INTERFACE_CACHE.get(self._cache_key, self._fetch_interfaces, force_refresh=force_refresh)
+
+    def query_interfaces(
+        self,
+        status: str = None,
+        admin_status: str = None,
+        speed_mbps: float = None,
+        vlan: int = None,
+        device: str = None,
+        site: str = None,
+        port_mode: str = None,
+        interface_type: str = None,
+        port_name: str = None,
+        group_by: str = None,
+        limit: int = None,
+    ):
+        """
+        Count, group or list interfaces from the interface store, e.g. down ports per
+        site: query_interfaces(status="down", group_by="site"). Without group_by, the
+        match count and up to 'limit' compact rows are returned. site may be an ID,
+        name hierarchy or unique site name; an unknown site returns candidates.
+        """
+        if not self.sdk and not self.token:
+            logging.error("DNACenterAPI client not initialized.")
+            return {"error": "DNACenterAPI client not initialized."}
+        filters = {
+            "status": status, "admin_status": admin_status, "speed_mbps": speed_mbps, "vlan": vlan,
+            "device": device, "site": site, "port_mode": port_mode, "interface_type": interface_type,
+            "port_name": port_name,
+        }
+        filters = {key: value for key, value in filters.items() if value not in (None, "")}
+        try:
+            if "site" in filters:
+                tree = self.site_tree()
+                found = tree.resolve(filters["site"])
+                if found is None:
+                    return tree.not_found(filters["site"])
+                filters["site"] = found.get("siteNameHierarchy") or found.get("name")
+            store = self.interface_store()
+            if "site" in filters or group_by == "site":
+                store.ensure_sites(self.device_site_map)
+            matched = store.filter(**filters)
+            result = {"filters": filters, "matched": len(matched), "total": len(store.frame), "age_s": round(store.age_s, 1)}
+            if group_by:
+                result["group_by"] = group_by
+                result["groups"] = store.group_count(group_by, **filters)
+            else:
+                result["interfaces"] = store.rows(matched, int(limit or CATALYST_INTERFACES_MAX_ROWS))
+            return result
+        except ValueError as ve:
+            return {"error": str(ve)}
+        except Exception as e:
+            logging.error(f"Error querying interfaces: {e}")
+            return {"error": f"Failed to query interfaces: {e}"}
+
     def get_all_interfaces(self):
+        """
+        The first page of /interface, in one request. Counts, breakdowns and filtered
+        lists over every interface come from query_interfaces (query_catalyst_interfaces).
+        """
         if not self.sdk:
             logging.error("DNACenterAPI client not initialized.")
             return {"error": "DNACenterAPI client not initialized."}
         try:
             response = self.sdk.custom_caller.call_api("GET", "/dna/intent/api/v1/interface")
-            return response.get("response", [])
+            interfaces = response.get("response", [])
+            return {
+                "interfaces": interfaces,
+                "note": (
+                    f"First page only ({len(interfaces)} interfaces). To count, group or filter "
+                    "all interfaces, use query_catalyst_interfaces."
+                ),
+            }
         except Exception as e:
             logging.error(f"Error retrieving interfaces: {e}")
             return {"error": f"Failed to retrieve interfaces: {e}"}
 
     def get_device_interfaces(self, device_id):
+        store = INTERFACE_CACHE.peek(self._cache_key)
+        if store is not None and store.age_s < CATALYST_INTERFACES_TTL_S:
+            records = store.device_records(device_id)
+            if records:
+                return records
         if not self.sdk:
             logging.error("DNACenterAPI client not initialized.")
             return {"error": "DNACenterAPI client not initialized."}
@@ -314,21 +682,74 @@ class CatalystCenterClient(BaseCiscoClient):
             logging.error(f"Error retrieving path trace result: {e}")
             return {"error": f"Failed to retrieve path trace result: {e}"}
 
+    def _await_path_trace(self, payload: dict, deadline: float) -> dict:
+        start = time.monotonic()
+        response = self.sdk.custom_caller.call_api("POST", "/dna/intent/api/v1/flow-analysis", json=payload)
+        flow_analysis_id = response["response"]["flowAnalysisId"]
+        url = f"{self.base_url}/dna/intent/api/v1/flow-analysis/{flow_analysis_id}"
+        status = None
+        for wait in PATH_TRACE_POLLS.waits(deadline):
+            time.sleep(wait)
+            result = self._direct_get(url).json().get("response") or {}
+            status = (result.get("request") or {}).get("status")
+            if status in FINAL_STATUSES:
+                elapsed = time.monotonic() - start
+                PATH_TRACE_POLLS.record(elapsed)
+                return path_trace_summary(flow_analysis_id, result, elapsed)
+        raise PathTraceTimeout(flow_analysis_id, status)
+
+    def trace_path(
+        self,
+        source_ip: str,
+        destination_ip: str,
+        protocol: str = None,
+        source_port: str = None,
+        destination_port: str = None,
+        timeout_s: float = None,
+        force_refresh: bool = False,
+    ):
+        """
+        Run a path trace and wait for it: starts a flow analysis, polls it until
+        COMPLETED or FAILED (within timeout_s) and returns the status with a compact
+        hop list. Identical traces within CATALYST_PATH_TRACE_CACHE_TTL_S, including
+        ones still running, share one flow analysis.
+        """
+        if not self.sdk:
+            logging.error("DNACenterAPI client not initialized.")
+            return {"error": "DNACenterAPI client not initialized."}
+        if not source_ip or not destination_ip:
+            return {"error": "Source and destination IP must be provided."}
+        payload = {"sourceIP": source_ip, "destIP": destination_ip}
+        if protocol:
+            payload["protocol"] = protocol
+        if source_port:
+            payload["sourcePort"] = str(source_port)
+        if destination_port:
+            payload["destPort"] = str(destination_port)
+        key = self._cache_key + (source_ip, destination_ip, protocol, source_port, destination_port)
+        deadline = time.monotonic() + (timeout_s or CATALYST_PATH_TRACE_TIMEOUT_S)
+        try:
+            return PATH_TRACE_CACHE.get(
+                key, lambda: self._await_path_trace(payload, deadline), force_refresh=force_refresh
+            )
+        except PathTraceTimeout as e:
+            logging.warning(str(e))
+            return {
+                "error": "Timed out waiting for the path trace. Check it later with get_path_trace_result.",
+                "flow_analysis_id": e.flow_analysis_id,
+                "status": e.status,
+            }
+        except Exception as e:
+            logging.error(f"Error running path trace: {e}")
+            return {"error": f"Failed to run path trace: {e}"}
+
     def get_device_list_direct(self):
         if not self.sdk and not self.token:
             logging.error("No DNACenterAPI client or token.")
             return {"error": "No DNACenterAPI client or token."}
 
-        url = f"{self.base_url}/dna/intent/api/v1/network-device"
-        headers = {
-            "Accept": "application/json",
-            "X-Auth-Token": self.token if self.token else self.sdk.access_token
-        }
         try:
-            resp = requests.get(url, headers=headers, timeout=30, verify=False)
-            resp.raise_for_status()
-            json_data = resp.json()
-            return json_data.get("response", json_data)
+            return self.device_snapshot().devices
         except Exception as e:
             logging.error(f"Error retrieving device list: {e}")
             return {"error": str(e)}
@@ -337,7 +758,19 @@ class CatalystCenterClient(BaseCiscoClient):
         """
         Calls /dna/intent/api/v1/device-detail?identifier={identifier}&searchBy={search_by}
         to retrieve device details (e.g. inventory or extended info).
+        Hostname and MAC lookups are answered from a fresh device snapshot when it has the device.
         """
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            if identifier == "nwDeviceName":
+                device = snapshot.device(hostname=search_by)
+            elif identifier == "macAddress":
+                device = snapshot.device(mac=search_by)
+            else:
+                device = None
+            if device is not None:
+                return device
+
         if not self.token and not self.sdk:
             logging.error("No DNACenterAPI client or token available.")
             return {"error": "No DNACenterAPI client or token."}
@@ -349,22 +782,9 @@ class CatalystCenterClient(BaseCiscoClient):
             "searchBy": search_by
         }
 
-        # Use the stored token or dnacentersdk access token
-        headers = {
-            "Accept": "application/json",
-            "X-Auth-Token": self.token if self.token else self.sdk.access_token
-        }
-
         try:
-            # Do the GET request
-            response = requests.get(
-                url, 
-                headers=headers, 
-                params=params, 
-                timeout=30, 
-                verify=False  # or True if you have valid certs
-            )
-            response.raise_for_status()
+            # Do the GET request with the shared token
+            response = self._direct_get(url, params=params)
             json_data = response.json()
             return json_data.get("response", json_data)
         except requests.exceptions.RequestException as e:
@@ -386,27 +806,49 @@ class CatalystCenterClient(BaseCiscoClient):
         """
         return self.get_device_detail_direct("macAddress", mac_address)
 
-    def get_all_devices_by_site(self, site_id: str):
+    def get_all_devices_by_site(self, site_id: str, include_children: bool = False):
         """
         Retrieves all devices for the given site ID from DNAC v1 endpoint:
         /dna/intent/api/v1/network-device/site/{siteId}
+        The site may also be given by name or name hierarchy. With include_children,
+        every site below it is queried too (in parallel).
         """
         if not self.token and not self.sdk:
             logging.error("No DNACenterAPI client or token available.")
             return {"error": "No DNACenterAPI client or token."}
 
-        # Construct the endpoint
-        base_url = self.base_url.rstrip("/")
-        url = f"{base_url}/dna/intent/api/v1/network-device/site/{site_id}"
-
-        headers = {
-            "Accept": "application/json",
-            "X-Auth-Token": self.token if self.token else self.sdk.access_token
-        }
+        resolved = self.resolve_site_id(site_id)
+        if resolved is None:
+            return self.site_tree().not_found(site_id)
+        if not include_children:
+            return self._get_devices_in_site(resolved)
 
         try:
-            resp = requests.get(url, headers=headers, timeout=30, verify=False)
-            resp.raise_for_status()
+            tree = self.site_tree()
+        except Exception as e:
+            # resolve_site_id already fell back to the raw value: list that site alone
+            logging.warning(f"Site hierarchy unavailable, listing devices of site '{resolved}' without children: {e}")
+            devices = self._get_devices_in_site(resolved)
+            if isinstance(devices, dict) and "error" in devices:
+                return devices
+            return {
+                "site": {"id": resolved},
+                "devices": devices,
+                "sites_queried": 1,
+                "site_errors": {},
+                "warning": f"Site hierarchy unavailable ({e}); devices of child sites are not included.",
+            }
+        if resolved not in tree.by_id:
+            return tree.not_found(site_id)
+        return self._get_devices_in_site_tree(tree, resolved)
+
+    def _get_devices_in_site(self, site_id: str):
+        """
+        Devices of one site (/dna/intent/api/v1/network-device/site/{siteId}).
+        """
+        url = f"{self.base_url.rstrip('/')}/dna/intent/api/v1/network-device/site/{site_id}"
+        try:
+            resp = self._direct_get(url)
             json_data = resp.json()
             # Typically returns {"response": [ {device1}, {device2}, ... ], ...}
             return json_data.get("response", json_data)
@@ -416,3 +858,55 @@ class CatalystCenterClient(BaseCiscoClient):
         except Exception as ex:
             logging.error(f"Unknown error retrieving devices by site '{site_id}': {ex}")
             return {"error": str(ex)}
+
+    def _get_devices_in_site_tree(self, tree: SiteTree, site_id: str) -> dict:
+        """
+        Devices of a site of the tree and every site below it, one request per site, up to
+        CATALYST_SITE_FANOUT_WORKERS at a time. Each device carries the hierarchy of its site.
+        """
+        sites = tree.descendants(site_id)
+        url = f"{self.base_url}/dna/intent/api/v1/network-device/site"
+
+        def site_devices(site: dict):
+            try:
+                return site, self._direct_get(f"{url}/{site['id']}").json().get("response") or [], None
+            except Exception as e:
+                return site, [], str(e)
+
+        # A device listed under several sites of the subtree is tagged with the deepest one
+        deepest, errors = {}, {}
+        workers = max(1, min(CATALYST_SITE_FANOUT_WORKERS, len(sites)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="catalyst-sites") as pool:
+            for site, found, error in pool.map(site_devices, sites):
+                hierarchy = site.get("siteNameHierarchy") or ""
+                if error:
+                    errors[hierarchy or site["id"]] = error
+                for device in found:
+                    key = device.get("id")
+                    if key not in deepest or hierarchy.count("/") > deepest[key][0]:
+                        deepest[key] = (hierarchy.count("/"), {**device, "siteNameHierarchy": hierarchy or None})
+        return {
+            "site": tree.record(tree.by_id[site_id]),
+            "devices": [device for _, device in deepest.values()],
+            "sites_queried": len(sites),
+            "site_errors": errors,
+        }
+
+    def get_site_membership(self, site_id: str, offset=None, limit=None, device_family=None, serial_number=None):
+        """
+        Child sites and devices of a site (SDK sites.get_membership); the site may be
+        given by ID, name or name hierarchy.
+        """
+        if not self.sdk:
+            logging.error("DNACenterAPI client not initialized.")
+            return {"error": "DNACenterAPI client not initialized."}
+        resolved = self.resolve_site_id(site_id)
+        if resolved is None:
+            return self.site_tree().not_found(site_id)
+        try:
+            return self.sdk.sites.get_membership(
+                site_id=resolved, offset=offset, limit=limit, device_family=device_family, serial_number=serial_number
+            )
+        except Exception as e:
+            logging.error(f"Error retrieving membership of site {resolved}: {e}")
+            return {"error": str(e)}
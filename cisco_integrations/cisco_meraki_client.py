@@ -6,10 +6,41 @@
 # Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
 ################################################################################
 
+import os
+import time
+import queue
+import hashlib
 import logging
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+
 import meraki
 from meraki.exceptions import APIError
 
+from cisco_integrations.rate_limit import PRIORITY_BULK, at_priority, current_priority, pace_meraki_dashboard
+from cisco_integrations.meraki_inventory import INVENTORY_CACHE, InventorySnapshot
+from cisco_integrations.meraki_networks import NETWORK_CACHE, MERAKI_NETWORKS_MISS_REFRESH_S, NetworkIndex
+from cisco_integrations.meraki_client_index import (
+    CLIENT_INDEX_CACHE,
+    MERAKI_CLIENT_INDEX_WINDOW_S,
+    NAME_FIELDS,
+    SEARCH_FIELDS,
+    ClientIndex,
+)
+from cisco_integrations.record_stream import RecordStream
+from cisco_integrations.meraki_alert_store import (
+    ALERT_HISTORY_MAX_PER_PAGE,
+    ALERT_HISTORY_PER_PAGE,
+    MERAKI_ALERT_SOURCE,
+    get_alert_store,
+    parse_timestamp,
+)
+
+# Networks queried in parallel by the org-wide aggregator methods (list_all_clients_in_org, ...)
+MERAKI_FANOUT_WORKERS = int(os.getenv("MERAKI_FANOUT_WORKERS", "8"))
+# Pages (of up to 1000 records) buffered between streaming fan-out workers and the consumer
+MERAKI_STREAM_BUFFER_PAGES = int(os.getenv("MERAKI_STREAM_BUFFER_PAGES", "16"))
+
 class MerakiSDKClient:
     """
     A thin wrapper around the official Meraki Dashboard API.
@@ -18,109 +49,438 @@ class MerakiSDKClient:
         if not meraki:
             raise ImportError("The 'meraki' Python package is not installed. Please install via 'pip install meraki'.")
         self.api_key = api_key
-        self.dashboard = meraki.DashboardAPI(
-            api_key=api_key,
-            base_url=base_url or "https://api.meraki.com/api/v1",
+        self.base_url = base_url or "https://api.meraki.com/api/v1"
+        self.dashboard = self.new_dashboard()
+        logging.info("MerakiSDKClient initialized.")
+
+    def new_dashboard(self, **options):
+        return meraki.DashboardAPI(
+            api_key=self.api_key,
+            base_url=self.base_url,
             print_console=False,
+            **options,
         )
-        logging.info("MerakiSDKClient initialized.")
 
 class CiscoMerakiClient:
-    def __init__(self, api_key: str, organization_id: str):
+    def __init__(self, api_key: str, organization_id: str, base_url: str = None):
         """
         Initialize the Cisco Meraki client.
         """
         self.organization_id = organization_id
         # Create the underlying Meraki SDK client.
         logging.info(f"Initializing CiscoMerakiClient with organization_id: '{self.organization_id}'")
-        self.client = MerakiSDKClient(api_key=api_key)
+        self.client = MerakiSDKClient(api_key=api_key, base_url=base_url)
         # Expose the dashboard attribute so that unified_service.py can access it.
         self.dashboard = self.client.dashboard
+        # Shared snapshots (inventory, networks) are keyed by org and API key
+        self._cache_key = (self.organization_id, hashlib.sha256(api_key.encode()).hexdigest()[:16])
+        # Every Dashboard call from this client counts against the org's rate limit
+        if self.organization_id:
+            pace_meraki_dashboard(self.dashboard, self.organization_id)
+        self._stream_dashboard = None
+        self._stream_dashboard_lock = threading.Lock()
+
+    @property
+    def stream_dashboard(self):
+        """
+        A second DashboardAPI whose total_pages calls return generators that fetch one
+        page at a time (the SDK setting is per session, so it cannot be toggled per call
+        on the shared dashboard). Created on first use and paced like self.dashboard.
+        """
+        with self._stream_dashboard_lock:
+            if self._stream_dashboard is None:
+                self._stream_dashboard = self.client.new_dashboard(use_iterator_for_get_pages=True)
+                if self.organization_id:
+                    pace_meraki_dashboard(self._stream_dashboard, self.organization_id)
+            return self._stream_dashboard
 
 # functions that are “aggregator” or multi-step logic methods instead of simple direct single-GET calls
 
-    def list_all_clients_in_org(self, timespan=60 * 60 * 24 * 14):
+    def _fetch_networks(self) -> NetworkIndex:
+        networks = self.dashboard.organizations.getOrganizationNetworks(self.organization_id, total_pages="all")
+        return NetworkIndex(self.organization_id, networks)
+
+    def network_index(self, force_refresh: bool = False) -> NetworkIndex:
+        """
+        The organization's networks indexed by ID, name and tag, shared by every client
+        of the same org and API key and refreshed in the background once older than
+        MERAKI_NETWORKS_TTL_S. Raises APIError when the networks cannot be listed.
+        """
+        return NETWORK_CACHE.get(self._cache_key, self._fetch_networks, force_refresh=force_refresh)
+
+    def resolve_network(self, network: str):
+        """
+        Resolve a network ID or name of this org to its ID.
+        Returns (network_id, None) or (None, {"error": ...}). An unknown value refetches
+        the index (at most every MERAKI_NETWORKS_MISS_REFRESH_S) in case the network is new.
+        """
+        try:
+            index = self.network_index()
+            network_id = index.resolve(network)
+            if network_id is None and index.age_s > MERAKI_NETWORKS_MISS_REFRESH_S:
+                index = self.network_index(force_refresh=True)
+                network_id = index.resolve(network)
+        except APIError as e:
+            logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
+            return None, {"error": f"Cannot list networks for org {self.organization_id}: {e}"}
+
+        if network_id is None:
+            error_msg = (
+                f"Network '{network}' not found in org '{self.organization_id}'. "
+                "Check that you have the correct network ID or name and organization."
+            )
+            logging.warning(error_msg)
+            return None, {"error": error_msg}
+        return network_id, None
+
+    def get_organization_networks(self, tag: str = None):
+        """
+        All networks in the organization (optionally only those with a tag), from the network index.
+        """
+        try:
+            index = self.network_index()
+        except APIError as e:
+            logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
+            return {"error": f"Cannot list networks for org {self.organization_id}: {e}"}
+        return index.with_tag(tag) if tag else list(index.networks)
+
+    def get_network(self, network: str):
+        """
+        One network of the organization by ID or name, from the network index.
+        """
+        network_id, error = self.resolve_network(network)
+        if error:
+            return error
+        return self.network_index().by_id[network_id]
+
+    def _network_clients(self, network: dict, **params) -> list:
+        clients = self.dashboard.networks.getNetworkClients(
+            networkId=network["id"],
+            perPage=1000,
+            total_pages="all",       # auto-paginate
+            **params                 # timespan (seconds back to look) or t0 (seen since)
+        )
+        for client in clients:
+            client.setdefault("networkId", network["id"])
+        return clients
+
+    def _fan_out_network_clients(self, networks: list, params_for, max_workers: int = None):
+        """
+        Retrieve each network's clients, a bounded number of networks at a time.
+        params_for(network) returns that network's getNetworkClients parameters.
+        Returns ({network_id: clients}, network_errors, workers).
+        """
+        results = {}
+        network_errors = []
+        workers = max(1, min(max_workers or MERAKI_FANOUT_WORKERS, len(networks) or 1))
+        # Fan-out pages queue behind other users' single requests on the org's rate limit
+        fetch = at_priority(max(current_priority(), PRIORITY_BULK), self._network_clients)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meraki-fanout") as executor:
+            futures = {executor.submit(fetch, net, **params_for(net)): net for net in networks}
+            for future in as_completed(futures):
+                net = futures[future]
+                try:
+                    results[net["id"]] = future.result()
+                except APIError as e:
+                    logging.error(f"Meraki API error for network {net['id']}: {e}")
+                    network_errors.append({
+                        "network_id": net["id"],
+                        "network_name": net.get("name"),
+                        "status": getattr(e, "status", None),
+                        "error": str(getattr(e, "message", None) or e),
+                    })
+                except Exception as e:
+                    logging.error(f"Unexpected error for network {net['id']}: {e}")
+                    network_errors.append({
+                        "network_id": net["id"],
+                        "network_name": net.get("name"),
+                        "status": None,
+                        "error": str(e),
+                    })
+        return results, network_errors, workers
+
+    def list_all_clients_in_org(self, timespan=60 * 60 * 24 * 14, max_workers: int = None):
         """
-        Returns a list of all clients across all networks in the organization,
+        Returns all clients across all networks in the organization,
         optionally limited by a timespan (default 14 days).
 
+        Networks are queried in parallel (MERAKI_FANOUT_WORKERS threads); every
+        request, including follow-up pages, is paced by the per-org rate limiter. A failing network does not fail the call: its
+        error is reported in "network_errors" and the other networks are returned.
+
         Example return format:
-        [
-          {
-            "mac": "00:11:22:33:44:55",
-            "description": "John's iPhone",
-            "ip": "192.168.0.10",
-            ...other Meraki fields...
-          },
-          ...
-        ]
+        {
+          "organization_id": "123456",
+          "clients": [
+            {
+              "mac": "00:11:22:33:44:55",
+              "description": "John's iPhone",
+              "ip": "192.168.0.10",
+              "networkId": "L_123",
+              ...other Meraki fields...
+            },
+            ...
+          ],
+          "networks_queried": 42,
+          "network_errors": [
+            {"network_id": "L_456", "network_name": "Lab", "status": 404, "error": "..."}
+          ]
+        }
         """
-        all_clients = []
+        start = time.perf_counter()
 
         # 1) Get all networks in the org
-        networks = self.dashboard.organizations.getOrganizationNetworks(self.organization_id)
+        try:
+            networks = self.network_index().networks
+        except APIError as e:
+            logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
+            return {"error": f"Cannot list networks for org {self.organization_id}: {e}"}
+
+        # 2) Retrieve each network's clients, a bounded number at a time
+        results, network_errors, workers = self._fan_out_network_clients(
+            networks, lambda net: {"timespan": timespan}, max_workers
+        )
 
-        # 2) For each network, retrieve its clients
+        # 3) Combine in the order the networks were listed
+        all_clients = []
         for net in networks:
-            net_id = net["id"]
+            all_clients.extend(results.get(net["id"], []))
+
+        logging.info(
+            f"list_all_clients_in_org: {len(all_clients)} clients from {len(networks)} networks "
+            f"({len(network_errors)} failed) in {time.perf_counter() - start:.2f}s with {workers} workers"
+        )
+        return {
+            "organization_id": self.organization_id,
+            "clients": all_clients,
+            "networks_queried": len(networks),
+            "network_errors": network_errors,
+        }
+
+    def iter_network_clients(self, network: dict, **params):
+        """
+        Yield one network's clients page by page (timespan or t0 as in getNetworkClients).
+        """
+        pages = self.stream_dashboard.networks.getNetworkClients(
+            networkId=network["id"], perPage=1000, total_pages="all", **params
+        )
+        try:
+            for client in pages:
+                client.setdefault("networkId", network["id"])
+                yield client
+        finally:
+            # A list when the SDK has no iterator mode
+            if hasattr(pages, "close"):
+                pages.close()
+
+    def _stream_network_clients(self, networks: list, params_for, network_errors: list, max_workers: int = None):
+        """
+        Yield the clients of all networks as their pages arrive, fetching up to
+        max_workers networks at a time. At most MERAKI_STREAM_BUFFER_PAGES pages wait
+        for the consumer; closing the generator stops the remaining requests.
+        Failed networks are appended to network_errors.
+        """
+        workers = max(1, min(max_workers or MERAKI_FANOUT_WORKERS, len(networks) or 1))
+        buffer = queue.Queue(maxsize=MERAKI_STREAM_BUFFER_PAGES)
+        stop = threading.Event()
+        finished = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(net):
+            chunk = []
             try:
-                clients = self.dashboard.networks.getNetworkClients(
-                    networkId=net_id,
-                    timespan=timespan,       # How many seconds back to look
-                    perPage=1000,
-                    total_pages="all"        # auto-paginate
-                )
-                # 3) Append clients to our combined list
-                all_clients.extend(clients)
-            except APIError as e:
-                logging.error(f"Meraki API error for network {net_id}: {e}")
+                clients = self.iter_network_clients(net, **params_for(net))
+                try:
+                    for client in clients:
+                        if stop.is_set():
+                            return
+                        chunk.append(client)
+                        if len(chunk) >= 1000:
+                            if not put(chunk):
+                                return
+                            chunk = []
+                finally:
+                    clients.close()
+                if chunk:
+                    put(chunk)
             except Exception as e:
-                logging.error(f"Unexpected error for network {net_id}: {e}")
+                logging.error(f"Meraki API error for network {net['id']}: {e}")
+                put({
+                    "network_id": net["id"],
+                    "network_name": net.get("name"),
+                    "status": getattr(e, "status", None),
+                    "error": str(getattr(e, "message", None) or e),
+                })
+
+        fetch = at_priority(max(current_priority(), PRIORITY_BULK), produce)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meraki-stream")
+        futures = [executor.submit(fetch, net) for net in networks]
+
+        def mark_finished():
+            for future in futures:
+                try:
+                    future.exception()
+                except CancelledError:
+                    # Not started before the consumer closed the stream (shutdown(cancel_futures=True))
+                    pass
+            put(finished)
+
+        threading.Thread(target=mark_finished, name="meraki-stream-done", daemon=True).start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is finished:
+                    return
+                if isinstance(item, dict):
+                    network_errors.append(item)
+                    continue
+                yield from item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stream_all_clients_in_org(self, timespan=60 * 60 * 24 * 14, max_workers: int = None):
+        """
+        Streaming list_all_clients_in_org: a RecordStream of clients in arrival order
+        (pages of parallel network requests, not network order). Its meta
+        ("organization_id", "networks_queried", "network_errors") is complete once the
+        stream is exhausted. Returns {"error"} if the networks cannot be listed.
+        """
+        try:
+            networks = self.network_index().networks
+        except APIError as e:
+            logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
+            return {"error": f"Cannot list networks for org {self.organization_id}: {e}"}
+        network_errors = []
+        records = self._stream_network_clients(networks, lambda net: {"timespan": timespan}, network_errors, max_workers)
+        return RecordStream("clients", records, {
+            "organization_id": self.organization_id,
+            "networks_queried": len(networks),
+            "network_errors": network_errors,
+        })
+
+    def stream_network_clients(self, network: str, timespan=60 * 60 * 24 * 14):
+        """
+        RecordStream of one network's clients (network ID or name), page by page.
+        """
+        network_id, error = self.resolve_network(network)
+        if error:
+            return error
+        net = self.network_index().by_id[network_id]
+        return RecordStream("clients", self.iter_network_clients(net, timespan=timespan), {
+            "organization_id": self.organization_id,
+            "network_id": network_id,
+        })
 
-        return all_clients
+    def _sync_client_index(self) -> ClientIndex:
+        index = CLIENT_INDEX_CACHE.peek(self._cache_key) or ClientIndex(self.organization_id)
+        started_at = time.time()
+        networks = self.network_index().networks
+        full = index.synced_at is None
+        results, network_errors, _ = self._fan_out_network_clients(
+            networks, lambda net: index.sync_params(net["id"], started_at)
+        )
+        index.apply_sync(started_at, (net["id"] for net in networks), results, network_errors, full)
+        logging.info(
+            f"Meraki client index for org {self.organization_id}: {'full' if full else 'delta'} sync of "
+            f"{len(networks)} networks, {index.syncs['last_upserts']} clients updated, "
+            f"{len(index.clients)} indexed, {len(network_errors)} networks failed"
+        )
+        return index
+
+    def client_index(self, force_refresh: bool = False) -> ClientIndex:
+        """
+        Clients of the organization seen within MERAKI_CLIENT_INDEX_WINDOW_S with a
+        trigram index over description, hostname, MAC, IP and user. The first call
+        crawls every network; afterwards the index is delta-synced (clients seen since
+        each network's last sync) in the background once older than MERAKI_CLIENT_INDEX_TTL_S.
+        """
+        return CLIENT_INDEX_CACHE.get(self._cache_key, self._sync_client_index, force_refresh=force_refresh)
+
+    def search_clients_in_org(self, query: str, timespan=60 * 60 * 24 * 14, fields=SEARCH_FIELDS):
+        """
+        Clients seen within timespan whose description, hostname, MAC, IP or user contains
+        the case-insensitive substring `query`, most recently seen first.
+        Same return format as list_all_clients_in_org, with only the matching clients.
+        Timespans longer than the index window are searched with a full crawl.
+        """
+        if timespan and timespan > MERAKI_CLIENT_INDEX_WINDOW_S:
+            result = self.list_all_clients_in_org(timespan=timespan)
+            if "error" in result:
+                return result
+            query = (query or "").strip().lower()
+            matched = [
+                c for c in result["clients"]
+                if any(query in str(c.get(field) or "").lower() for field in fields)
+            ]
+            return {**result, "clients": matched}
+
+        try:
+            index = self.client_index()
+        except APIError as e:
+            logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
+            return {"error": f"Cannot list networks for org {self.organization_id}: {e}"}
+        return {
+            "organization_id": self.organization_id,
+            "clients": index.search(query, fields, timespan),
+            "networks_queried": len(index.network_ids),
+            "network_errors": index.network_errors,
+            "index_age_s": round(time.time() - index.synced_at, 1),
+        }
 
     def list_all_clients_in_org_by_name(self, name_substring: str, timespan=60 * 60 * 24 * 14):
         """
         Searches all clients (over a given timespan) whose description or hostname
-        contains the case-insensitive substring `name_substring`.
+        contains the case-insensitive substring `name_substring`, using the client index.
+        Same return format as list_all_clients_in_org, with only the matching clients.
         """
-        all_clients = self.list_all_clients_in_org(timespan=timespan)
-        name_substring = name_substring.lower()
-        
-        matched = [
-            c for c in all_clients
-            if name_substring in (c.get("description") or "").lower()
-               or name_substring in (c.get("dhcpHostname") or "").lower()
-        ]
-        return matched
+        return self.search_clients_in_org(name_substring, timespan=timespan, fields=NAME_FIELDS)
 
-    def get_network_alerts_history(self, network_id: str):
+    def get_network_alerts_history(self, network_id: str, **params):
         """
         Retrieve alert history for a specific network (GET /networks/{networkId}/alerts/history).
 
-        - First checks if the network_id belongs to this org (thus aggregator logic).
-        - If valid, calls getNetworkAlertsHistory.
+        - First checks that the network_id (or network name) belongs to this org,
+          using the cached network index (thus aggregator logic).
+        - If the webhook alert store covers the requested window for this network (see alerts_from_webhooks),
+          answers from it: {"source": "webhooks", "coverage", "alerts"}, one page of
+          perPage alerts, most recent first, after startingAfter and before endingBefore
+          (timestamps).
+        - Otherwise calls getNetworkAlertsHistory (with any paging params given).
         - Returns a friendlier error if 404 or network not found.
         """
         # 1) Check if network_id belongs to the current organization
-        try:
-            org_networks = self.dashboard.organizations.getOrganizationNetworks(self.organization_id)
-        except APIError as e:
-            logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
-            return {"error": f"Cannot list networks for org {self.organization_id}: {e}"}
+        network_id, error = self.resolve_network(network_id)
+        if error:
+            return error
+        params = {k: v for k, v in params.items() if v is not None}
 
-        valid_network_ids = [net["id"] for net in org_networks]
-        if network_id not in valid_network_ids:
-            error_msg = (
-                f"Network ID '{network_id}' not found in org '{self.organization_id}'. "
-                "Check that you have the correct network ID and organization."
+        # 2) Alerts received by the webhook receiver, if they cover the window asked for
+        since = parse_timestamp(params["startingAfter"], None) if "startingAfter" in params else None
+        until = parse_timestamp(params["endingBefore"], None) if "endingBefore" in params else None
+        if self.alerts_from_webhooks(network_id, since) and ("endingBefore" not in params or until is not None):
+            per_page = min(int(params.get("perPage") or ALERT_HISTORY_PER_PAGE), ALERT_HISTORY_MAX_PER_PAGE)
+            alerts = get_alert_store().query(
+                organization_id=self.organization_id,
+                network_id=network_id,
+                # startingAfter is exclusive
+                since=since + 1e-6 if since is not None else None,
+                until=until,
+                limit=per_page,
             )
-            logging.warning(error_msg)
-            return {"error": error_msg}
+            return {"source": "webhooks", "coverage": self.webhook_alert_coverage(network_id), "alerts": alerts}
 
-        # 2) If it’s valid, attempt to retrieve alerts
+        # 3) Otherwise ask the Dashboard
         try:
-            alerts_history = self.dashboard.networks.getNetworkAlertsHistory(network_id)
+            alerts_history = self.dashboard.networks.getNetworkAlertsHistory(network_id, **params)
             return alerts_history
         except APIError as e:
             if e.status == 404:
@@ -137,24 +497,140 @@ class CiscoMerakiClient:
                 logging.error(f"Meraki API error: {e}")
                 return {"error": str(e)}
 
-    def get_all_access_points(self):
+    def _webhook_alert_store(self):
         """
-        Retrieves all access points from the organization's inventory by filtering
-        for devices whose model starts with 'MR'.
+        The webhook alert store, or None when alerts come from the API: MERAKI_ALERT_SOURCE=api,
+        or (with "auto") an in-memory store, which every worker process fills with different webhooks.
         """
-        print("Retrieving all APs from the Meraki inventory. This may take a few seconds...")
+        if MERAKI_ALERT_SOURCE == "api":
+            return None
+        store = get_alert_store()
+        if MERAKI_ALERT_SOURCE == "auto" and not store.persistent:
+            return None
+        return store
 
-        try:
-            info_message = "Retrieving all APs from the Meraki inventory. This may take a few seconds..."
+    def webhook_alert_coverage(self, network_id: str):
+        """
+        The window ({"from", "to"}) for which the webhook alert store has every alert of
+        this network, or None when its alerts come from the API (see _webhook_alert_store)
+        or it has not sent a webhook yet.
+        """
+        store = self._webhook_alert_store()
+        if store is None:
+            return None
+        coverage = store.coverage(self.organization_id, network_id)
+        if coverage is None and MERAKI_ALERT_SOURCE == "webhook":
+            now = time.time()
+            coverage = {"from": now, "to": now}
+        return coverage
+
+    def alerts_from_webhooks(self, network_id: str, since: float = None) -> bool:
+        """
+        Whether alerts of this network occurring from since on (None: the whole history) are
+        answered from the webhook alert store: always with MERAKI_ALERT_SOURCE=webhook, never
+        with "api", and with "auto" only if the network's coverage starts no later than since.
+        """
+        if MERAKI_ALERT_SOURCE == "webhook":
+            return True
+        coverage = self.webhook_alert_coverage(network_id)
+        return coverage is not None and since is not None and since >= coverage["from"]
+
+    def search_alerts_in_org(self, network_id: str = None, alert_type: str = None, device_serial: str = None,
+                             timespan=60 * 60 * 24):
+        """
+        Alerts of the whole org received by the webhook receiver, optionally only those of
+        one network (ID or name), alert type or device, within timespan seconds.
+        When the store does not cover the timespan, a single network falls back to
+        getNetworkAlertsHistory (one page, filtered to the timespan). The whole org is
+        answered from the store, reporting each sending network's "coverage" and the
+        "uncovered_networks" that never sent a webhook (their alerts are not included).
+        """
+        if network_id:
+            network_id, error = self.resolve_network(network_id)
+            if error:
+                return error
+        since = time.time() - timespan if timespan else None
+        if network_id and not self.alerts_from_webhooks(network_id, since):
+            history = self.get_network_alerts_history(network_id)
+            if isinstance(history, list) and since is not None:
+                history = [
+                    alert for alert in history
+                    if parse_timestamp(alert.get("occurredAt"), since) >= since
+                ]
+            return {"organization_id": self.organization_id, "source": "api", "alerts": history}
+
+        store = self._webhook_alert_store()
+        if network_id:
+            coverage = {network_id: self.webhook_alert_coverage(network_id)}
+            uncovered = []
+        else:
+            coverage = store.network_coverage(self.organization_id) if store is not None else {}
+            try:
+                network_ids = [net["id"] for net in self.network_index().networks if net.get("id")]
+            except APIError as e:
+                logging.error(f"Failed to list networks for org {self.organization_id}: {e}")
+                network_ids = list(coverage)
+            uncovered = [nid for nid in network_ids if nid not in coverage]
+        if not coverage and MERAKI_ALERT_SOURCE != "webhook":
+            return {
+                "error": (
+                    f"No Meraki webhook alerts have been received for org {self.organization_id}"
+                    " (or MERAKI_ALERT_STORE_PATH is unset, so workers do not share them). "
+                    "Configure a webhook HTTP server pointing at /meraki/meraki/webhooks, or ask about one network."
+                )
+            }
+        alerts = get_alert_store().query(
+            organization_id=self.organization_id,
+            network_id=network_id,
+            alert_type=alert_type,
+            device_serial=device_serial,
+            since=since,
+        )
+        return {
+            "organization_id": self.organization_id,
+            "source": "webhooks",
+            "coverage": coverage,
+            "uncovered_networks": uncovered,
+            "alerts": alerts,
+        }
+
+    def _fetch_inventory(self) -> InventorySnapshot:
+        devices = self.dashboard.organizations.getOrganizationInventoryDevices(
+            self.organization_id,
+            total_pages="all"
+        )
+        return InventorySnapshot(self.organization_id, devices)
 
-            # 1) List all devices in the organization
-            devices = self.dashboard.organizations.getOrganizationInventoryDevices(
-                self.organization_id,
-                total_pages="all"
+    def inventory_snapshot(self, force_refresh: bool = False) -> InventorySnapshot:
+        """
+        The organization's inventory with serial/MAC/network/family indexes, shared
+        by every client of the same org and API key. Fetched at most once per
+        MERAKI_INVENTORY_TTL_S; an older snapshot (up to MERAKI_INVENTORY_MAX_STALE_S)
+        is returned immediately while it is refreshed in the background.
+        Raises APIError when the inventory cannot be fetched and no usable snapshot exists.
+        """
+        return INVENTORY_CACHE.get(self._cache_key, self._fetch_inventory, force_refresh=force_refresh)
+
+    def _inventory_error(self, e: Exception, what: str) -> dict:
+        if isinstance(e, APIError) and e.status == 404:
+            error_msg = (
+                f"404 Not Found: Possibly invalid org ID '{self.organization_id}' or no devices found. Error: {e}"
             )
+        elif isinstance(e, APIError):
+            error_msg = str(e)
+        else:
+            error_msg = f"Unexpected error {what} for org {self.organization_id}: {e}"
+        logging.error(error_msg)
+        return {"error": error_msg}
 
-            # 2) Filter for models starting with 'MR'
-            access_points = [d for d in devices if d.get("model", "").startswith("MR")]
+    def get_all_access_points(self):
+        """
+        Retrieves all access points (models starting with 'MR') from the
+        organization's inventory snapshot.
+        """
+        try:
+            info_message = "Retrieved all APs from the Meraki inventory."
+            access_points = self.inventory_snapshot().with_model_prefix("MR")
 
             return {
                 "status": "success",
@@ -179,44 +655,68 @@ class CiscoMerakiClient:
 
     def list_all_switches_in_org(self):
         """
-        Retrieve all Meraki switches (models starting with 'MS') from the inventory.
+        Retrieve all Meraki switches (models starting with 'MS') from the inventory snapshot.
         """
         try:
-            # 1) List all devices in the org inventory
-            inventory_devices = self.dashboard.organizations.getOrganizationInventoryDevices(
-                self.organization_id,
-                total_pages="all"
-            )
-            # 2) Filter out only the devices whose model starts with 'MS'
-            return [dev for dev in inventory_devices if dev.get("model", "").startswith("MS")]
-        except APIError as e:
-            if e.status == 404:
-                error_msg = (
-                    f"404 Not Found: Possibly invalid org ID '{self.organization_id}' or no devices found. Error: {e}"
-                )
-                return {"error": error_msg}
-            else:
-                return {"error": str(e)}
-        except Exception as ex:
-            error_msg = f"Unexpected error listing switches for org {self.organization_id}: {ex}"
-            return {"error": error_msg}
+            return self.inventory_snapshot().with_model_prefix("MS")
+        except Exception as e:
+            return self._inventory_error(e, "listing switches")
 
     def list_all_cameras_in_org(self):
         """
-        Retrieve all Meraki cameras in the organization by calling getOrganizationCameraOnboardingStatuses,
-        then returning them in a list.
+        Retrieve all Meraki cameras (models starting with 'MV') from the inventory snapshot.
         """
         try:
-            camera_statuses = self.dashboard.camera.getOrganizationCameraOnboardingStatuses(self.organization_id)
-            return camera_statuses
-        except APIError as e:
-            if e.status == 404:
-                error_msg = (
-                    f"404 Not Found: Possibly invalid org ID '{self.organization_id}' or no camera data. Error: {e}"
-                )
-                return {"error": error_msg}
-            else:
-                return {"error": str(e)}
-        except Exception as ex:
-            error_msg = f"Unexpected error retrieving cameras for org {self.organization_id}: {ex}"
-            return {"error": error_msg}
+            return self.inventory_snapshot().with_model_prefix("MV")
+        except Exception as e:
+            return self._inventory_error(e, "retrieving cameras")
+
+    def list_all_devices_in_org(self):
+        """
+        Every device in the organization's inventory snapshot.
+        """
+        try:
+            return list(self.inventory_snapshot().devices)
+        except Exception as e:
+            return self._inventory_error(e, "listing devices")
+
+    def get_organization_inventory_devices(self):
+        return self.list_all_devices_in_org()
+
+    def list_inventory_devices(self, family: str = None, network_id: str = None):
+        """
+        Inventory devices filtered by family (a productType such as 'camera', 'sensor',
+        'cellularGateway', or a model prefix such as 'MT' or 'MS220') and/or network ID.
+        """
+        if network_id:
+            network_id, error = self.resolve_network(network_id)
+            if error:
+                return error
+        try:
+            return self.inventory_snapshot().select(family=family, network_id=network_id)
+        except Exception as e:
+            return self._inventory_error(e, "listing devices")
+
+    def stream_inventory_devices(self, family: str = None, network_id: str = None):
+        """
+        RecordStream over the inventory snapshot (see list_inventory_devices).
+        """
+        devices = self.list_inventory_devices(family=family, network_id=network_id)
+        if isinstance(devices, dict):
+            return devices
+        return RecordStream("devices", iter(devices), {"organization_id": self.organization_id})
+
+    def find_inventory_device(self, serial: str = None, mac: str = None):
+        """
+        Look up one inventory device by serial or MAC address (any common MAC format).
+        """
+        if not serial and not mac:
+            return {"error": "Provide a serial or a MAC address."}
+        try:
+            device = self.inventory_snapshot().device(serial=serial, mac=mac)
+        except Exception as e:
+            return self._inventory_error(e, "looking up a device")
+        if device is None:
+            lookup = f"serial '{serial}'" if serial else f"MAC '{mac}'"
+            return {"error": f"No device with {lookup} in the inventory of org {self.organization_id}."}
+        return device
@@ -7,11 +7,13 @@
 ################################################################################
 
 import os
+import hashlib
 import logging
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
 from .base_client import BaseCiscoClient
+from .spaces_locations import HIERARCHY_CACHE, LocationIndex
 
 def _build_query(params: Dict[str, Any]) -> str:
     valid_items = []
@@ -37,12 +39,21 @@ class CiscoSpacesClient(BaseCiscoClient):
         super().__init__(base_url=base_url, token=api_key)
         logging.info(f"CiscoSpacesClient initialized with base URL: {self.base_url}")
 
-    def get_location_hierarchy(self, tenant_id: str = None) -> dict:
+    def location_index(self, tenant_id: str = None, force_refresh: bool = False) -> LocationIndex:
+        """
+        The location hierarchy with its id/parent/path/floor indexes, shared by every
+        client with the same URL and API key and refreshed after CISCO_SPACES_HIERARCHY_TTL_S.
+        """
         endpoint = "api/location/v2/map/locationhierarchy"
         params = {"tenantId": tenant_id} if tenant_id else {}
-        query_str = _build_query(params)
+        key = (self.base_url, hashlib.sha256(self.token.encode()).hexdigest()[:16], tenant_id)
+        return HIERARCHY_CACHE.get(
+            key, lambda: LocationIndex(self._get(endpoint + _build_query(params))), force_refresh=force_refresh
+        )
+
+    def get_location_hierarchy(self, tenant_id: str = None) -> dict:
         try:
-            return self._get(endpoint + query_str)
+            return self.location_index(tenant_id).hierarchy
         except Exception as e:
             logging.error(f"Error retrieving location hierarchy: {e}")
             return {"error": "Failed to retrieve location hierarchy."}
@@ -158,25 +169,34 @@ class CiscoSpacesClient(BaseCiscoClient):
     def get_location_subtree(self, location_id: str) -> dict:
         """
         Return the subtree of the location hierarchy for the given location_id,
-        including all of its children (recursively).
+        including all of its children (recursively), from the cached location index.
         """
-        # Step 1: Get the entire hierarchy
-        full_hierarchy = self.get_location_hierarchy()
-
-        # Step 2: Define a recursive search function
-        def find_subtree(node, search_id):
-            if node.get("id") == search_id:
-                return node
-            children = node.get("children", [])
-            for child in children:
-                result = find_subtree(child, search_id)
-                if result:
-                    return result
-            return None
-
-        # Step 3: Search for the node in the full hierarchy
-        subtree = find_subtree(full_hierarchy, location_id)
+        try:
+            index = self.location_index()
+        except Exception as e:
+            logging.error(f"Error retrieving location hierarchy: {e}")
+            return {"error": "Failed to retrieve location hierarchy."}
 
+        subtree = index.by_id.get(location_id)
         if not subtree:
             return {"error": f"Location ID '{location_id}' not found in hierarchy."}
         return subtree
+
+    def get_location_path(self, location: str) -> dict:
+        """
+        Where a location is: its path from the root (campus, building, ...) and the
+        floor it is on, for a location ID or name. A name shared by several locations
+        returns each of them.
+        """
+        try:
+            index = self.location_index()
+        except Exception as e:
+            logging.error(f"Error retrieving location hierarchy: {e}")
+            return {"error": "Failed to retrieve location hierarchy."}
+
+        found = index.find(location)
+        if not found:
+            return {"error": f"Location '{location}' not found in hierarchy."}
+        if len(found) == 1:
+            return index.describe(found[0])
+        return {"matches": [index.describe(location_id) for location_id in found]}
@@ -0,0 +1,276 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/client_pool.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from cisco_integrations import unified_service
+from cisco_integrations.unified_service import CiscoUnifiedService
+
+load_dotenv()
+
+# How many credential sets are kept per platform before the least recently used is dropped
+CLIENT_POOL_MAX_PER_PLATFORM = int(os.getenv("CLIENT_POOL_MAX_PER_PLATFORM", "4"))
+
+
+def _build_catalyst(url, username, password, version):
+    from cisco_integrations.cisco_catalyst_client import CatalystCenterClient
+    return CatalystCenterClient(
+        base_url=url,
+        token=None,
+        dnac_username=username,
+        dnac_password=password,
+        dnac_encoded_auth=None,
+        dnac_verify=False,
+        dnac_version=version
+    )
+
+
+def _build_meraki(api_key, organization_id):
+    if not api_key:
+        return None
+    from cisco_integrations.cisco_meraki_client import CiscoMerakiClient
+    return CiscoMerakiClient(api_key=api_key, organization_id=organization_id)
+
+
+def _build_spaces(base_url, api_key):
+    from cisco_integrations.cisco_spaces_client import CiscoSpacesClient
+    return CiscoSpacesClient(base_url=base_url, api_key=api_key)
+
+
+def _build_webex(token):
+    from cisco_integrations.cisco_webex_client import CiscoWebexClient
+    return CiscoWebexClient(token=token)
+
+
+# Same construction CiscoUnifiedService does, one builder per platform
+PLATFORM_BUILDERS = {
+    "catalyst": _build_catalyst,
+    "meraki": _build_meraki,
+    "spaces": _build_spaces,
+    "webex": _build_webex,
+}
+
+
+def platform_enabled(platform: str) -> bool:
+    return {
+        "catalyst": unified_service.ENABLE_CATALYST_CENTER,
+        "meraki": unified_service.ENABLE_MERAKI,
+        "spaces": unified_service.ENABLE_CISCO_SPACES,
+        "webex": unified_service.ENABLE_CISCO_WEBEX,
+    }.get(platform, False)
+
+
+def credentials_from_env() -> Dict[str, dict]:
+    """
+    Current credentials for every platform. Read on each call so that rotated
+    credentials are picked up (and the matching client rebuilt) without a restart.
+    """
+    return {
+        "catalyst": {
+            "url": os.getenv("CISCO_CATALYST_URL", "https://sandboxdnac.cisco.com:443"),
+            "username": os.getenv("CISCO_CATALYST_USERNAME", ""),
+            "password": os.getenv("CISCO_CATALYST_PASSWORD", ""),
+            "version": os.getenv("CISCO_CATALYST_VERSION", "2.3.7.6"),
+        },
+        "meraki": {
+            "api_key": os.getenv("CISCO_MERAKI_API_KEY", ""),
+            "organization_id": os.getenv("MERAKI_ORG_ID", ""),
+        },
+        "spaces": {
+            "base_url": os.getenv("CISCO_SPACES_BASE_URL", "https://dnaspaces.io"),
+            "api_key": os.getenv("CISCO_SPACES_API_KEY", ""),
+        },
+        "webex": {
+            "token": os.getenv("CISCO_WEBEX_TOKEN", ""),
+        },
+    }
+
+
+def fingerprint(credentials: dict) -> str:
+    """
+    Stable hash of a credential set. Used as the pool key so secrets are never
+    stored in the key or shown in stats.
+    """
+    material = "\x1f".join(f"{k}={credentials[k]}" for k in sorted(credentials))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class _PoolEntry:
+    def __init__(self, client: Any, build_ms: float):
+        self.client = client
+        self.created_at = time.time()
+        self.build_ms = build_ms
+        self.hits = 0
+
+
+class ClientPool:
+    """
+    Process-wide registry of long-lived platform clients.
+
+    Each client is built once per (platform, credentials) and then shared by every
+    request, so the Catalyst token, the Meraki dashboard session and the
+    requests.Session keep-alive connections survive across calls. A lookup with
+    new credentials builds a new client; the old one is dropped from the pool
+    (but not closed, since in-flight requests may still be using it).
+    """
+
+    def __init__(self, max_per_platform: int = CLIENT_POOL_MAX_PER_PLATFORM):
+        self.max_per_platform = max(1, max_per_platform)
+        self._entries: Dict[str, "OrderedDict[str, _PoolEntry]"] = {}
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._counters = {"hits": 0, "builds": 0, "rebuilds": 0, "build_errors": 0, "evictions": 0}
+        self._last_error: Dict[str, str] = {}
+
+    def _lookup(self, platform: str, key: str) -> Optional[_PoolEntry]:
+        with self._lock:
+            entries = self._entries.get(platform)
+            entry = entries.get(key) if entries else None
+            if entry is not None:
+                entries.move_to_end(key)
+                entry.hits += 1
+                self._counters["hits"] += 1
+            return entry
+
+    def get_client(self, platform: str, credentials: dict) -> Any:
+        """
+        Return the pooled client for these credentials, building it on first use.
+        Concurrent first calls for the same key wait for a single build.
+        """
+        key = fingerprint(credentials)
+        entry = self._lookup(platform, key)
+        if entry is not None:
+            return entry.client
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault((platform, key), threading.Lock())
+
+        with build_lock:
+            entry = self._lookup(platform, key)
+            if entry is not None:
+                return entry.client
+
+            start = time.perf_counter()
+            try:
+                client = PLATFORM_BUILDERS[platform](**credentials)
+            except Exception as e:
+                with self._lock:
+                    self._counters["build_errors"] += 1
+                    self._last_error[platform] = str(e)
+                    self._build_locks.pop((platform, key), None)
+                logging.error(f"ClientPool: failed to build {platform} client: {e}")
+                raise
+            build_ms = round((time.perf_counter() - start) * 1000, 1)
+
+            with self._lock:
+                entries = self._entries.setdefault(platform, OrderedDict())
+                if entries:
+                    # A different credential set for a platform we already serve
+                    self._counters["rebuilds"] += 1
+                entries[key] = _PoolEntry(client, build_ms)
+                self._counters["builds"] += 1
+                self._last_error.pop(platform, None)
+                while len(entries) > self.max_per_platform:
+                    old_key, _ = entries.popitem(last=False)
+                    self._build_locks.pop((platform, old_key), None)
+                    self._counters["evictions"] += 1
+            logging.info(f"ClientPool: built {platform} client ({key[:8]}) in {build_ms} ms")
+            return client
+
+    def get_service(self, credentials: Optional[Dict[str, dict]] = None) -> CiscoUnifiedService:
+        """
+        CiscoUnifiedService backed by pooled clients for every enabled platform.
+        Credentials default to the current environment.
+        """
+        credentials = credentials or credentials_from_env()
+        clients = {
+            platform: self.get_client(platform, creds)
+            for platform, creds in credentials.items()
+            if platform_enabled(platform)
+        }
+        meraki_creds = credentials.get("meraki", {})
+        catalyst_creds = credentials.get("catalyst", {})
+        return CiscoUnifiedService(
+            catalyst_username=catalyst_creds.get("username"),
+            catalyst_password=catalyst_creds.get("password"),
+            catalyst_url=catalyst_creds.get("url"),
+            catalyst_version=catalyst_creds.get("version"),
+            meraki_api_key=meraki_creds.get("api_key"),
+            spaces_token=credentials.get("spaces", {}).get("api_key"),
+            webex_token=credentials.get("webex", {}).get("token"),
+            clients=clients,
+        )
+
+    def warm(self) -> None:
+        """
+        Build the clients for the current environment ahead of the first request.
+        Failures are logged and retried on first use.
+        """
+        for platform, creds in credentials_from_env().items():
+            if not platform_enabled(platform):
+                continue
+            try:
+                self.get_client(platform, creds)
+            except Exception:
+                pass
+
+    def invalidate(self, platform: Optional[str] = None) -> None:
+        """
+        Drop pooled clients (all platforms, or just one) so the next call rebuilds them.
+        """
+        with self._lock:
+            for name in ([platform] if platform else list(self._entries)):
+                self._entries.pop(name, None)
+                for lock_key in [k for k in self._build_locks if k[0] == name]:
+                    self._build_locks.pop(lock_key, None)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> dict:
+        now = time.time()
+        with self._lock:
+            platforms = {
+                platform: [
+                    {
+                        "fingerprint": key[:8],
+                        "age_s": round(now - entry.created_at, 1),
+                        "build_ms": entry.build_ms,
+                        "hits": entry.hits,
+                        "configured": entry.client is not None,
+                    }
+                    for key, entry in entries.items()
+                ]
+                for platform, entries in self._entries.items()
+            }
+            return {
+                **self._counters,
+                "max_per_platform": self.max_per_platform,
+                "platforms": platforms,
+                "last_errors": dict(self._last_error),
+            }
+
+
+# Shared by the function dispatcher and the REST routers
+CLIENT_POOL = ClientPool()
+
+
+def get_unified_service() -> CiscoUnifiedService:
+    """
+    CiscoUnifiedService for the current environment credentials, built from the
+    process-wide client pool.
+    """
+    return CLIENT_POOL.get_service()
@@ -0,0 +1,332 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/meraki_alert_store.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import json
+import time
+import hmac
+import sqlite3
+import logging
+import threading
+from calendar import timegm
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Shared secret configured on the Meraki webhook HTTP server ("" = receiver disabled)
+MERAKI_WEBHOOK_SECRET = os.getenv("MERAKI_WEBHOOK_SECRET", "")
+# SQLite file for received alerts ("" = in memory, lost on restart)
+MERAKI_ALERT_STORE_PATH = os.getenv("MERAKI_ALERT_STORE_PATH", "")
+# Alerts that occurred longer ago than this are evicted (default 30 days)
+MERAKI_ALERT_RETENTION_S = int(os.getenv("MERAKI_ALERT_RETENTION_S", str(60 * 60 * 24 * 30)))
+# "auto": answer alert history from the store for orgs that send webhooks, else the API
+# "webhook": always from the store; "api": always from the Dashboard API
+MERAKI_ALERT_SOURCE = os.getenv("MERAKI_ALERT_SOURCE", "auto").lower()
+
+# getNetworkAlertsHistory page size: default and maximum perPage
+ALERT_HISTORY_PER_PAGE = 100
+ALERT_HISTORY_MAX_PER_PAGE = 1000
+
+# Eviction runs on insert, at most this often
+_EVICT_INTERVAL_S = 60
+
+
+def verify_shared_secret(payload: dict, secret: str = MERAKI_WEBHOOK_SECRET) -> bool:
+    """
+    True if the webhook payload carries the configured sharedSecret (always False
+    when no secret is configured).
+    """
+    received = payload.get("sharedSecret")
+    if not secret or not isinstance(received, str):
+        return False
+    return hmac.compare_digest(received.encode("utf-8"), secret.encode("utf-8"))
+
+
+def parse_timestamp(value, default: float) -> float:
+    """
+    Epoch seconds for the ISO 8601 timestamps of Meraki webhooks (e.g. "2025-01-01T12:00:00.123456Z").
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            seconds = timegm(time.strptime(value[:19], "%Y-%m-%dT%H:%M:%S"))
+        except ValueError:
+            return default
+        fraction = value[19:].split("Z")[0].split("+")[0]
+        if fraction.startswith("."):
+            try:
+                return seconds + float(fraction)
+            except ValueError:
+                pass
+        return float(seconds)
+    return default
+
+
+def history_entry(payload: dict) -> dict:
+    """
+    A stored webhook in the shape of a getNetworkAlertsHistory entry, plus the
+    webhook's network, level and alert data.
+    """
+    return {
+        "occurredAt": payload.get("occurredAt"),
+        "alertTypeId": payload.get("alertTypeId"),
+        "alertType": payload.get("alertType"),
+        "alertLevel": payload.get("alertLevel"),
+        "alertId": payload.get("alertId"),
+        "networkId": payload.get("networkId"),
+        "networkName": payload.get("networkName"),
+        "device": {
+            "serial": payload.get("deviceSerial"),
+            "name": payload.get("deviceName"),
+            "mac": payload.get("deviceMac"),
+            "model": payload.get("deviceModel"),
+        } if payload.get("deviceSerial") else None,
+        "alertData": payload.get("alertData") or {},
+    }
+
+
+class AlertStore:
+    """
+    Meraki webhook alerts in SQLite, indexed by (org, network, time), (org, time),
+    (org, alert type, time) and (org, device, time), so alert questions are answered without calling
+    getNetworkAlertsHistory per network. Alerts are de-duplicated by alertId
+    (Meraki retries deliveries) and evicted once older than retention_s.
+    """
+
+    def __init__(self, path: str = MERAKI_ALERT_STORE_PATH, retention_s: int = MERAKI_ALERT_RETENTION_S):
+        self.path = path or ":memory:"
+        self.retention_s = retention_s
+        self._lock = threading.Lock()
+        self._last_evict = 0.0
+        self._stats = {"received": 0, "duplicates": 0, "evicted": 0}
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        if path:
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS alerts ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, alert_id TEXT UNIQUE, organization_id TEXT,"
+            " network_id TEXT, alert_type_id TEXT, alert_level TEXT, device_serial TEXT,"
+            " occurred_at REAL, received_at REAL, payload TEXT);"
+            "CREATE INDEX IF NOT EXISTS alerts_org ON alerts (organization_id, occurred_at);"
+            "CREATE INDEX IF NOT EXISTS alerts_network ON alerts (organization_id, network_id, occurred_at);"
+            "CREATE INDEX IF NOT EXISTS alerts_type ON alerts (organization_id, alert_type_id, occurred_at);"
+            "CREATE INDEX IF NOT EXISTS alerts_device ON alerts (organization_id, device_serial, occurred_at);"
+            "CREATE TABLE IF NOT EXISTS alert_types (alert_type_id TEXT PRIMARY KEY, alert_type TEXT);"
+            "CREATE INDEX IF NOT EXISTS alert_types_name ON alert_types (alert_type);"
+        )
+        self._create_senders()
+        self._db.commit()
+        logging.info(f"Meraki alert store at {self.path}")
+        if not self.persistent:
+            logging.warning(
+                "Meraki alert store is in memory: each worker process only has the webhooks it received. "
+                "Set MERAKI_ALERT_STORE_PATH to share one store between workers."
+            )
+
+    def _create_senders(self) -> None:
+        # Coverage is tracked per network: one network sending webhooks says nothing about the others.
+        # Stores written before that had one row per org, so rebuild the table from the stored alerts.
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(senders)")]
+        if columns and "network_id" not in columns:
+            self._db.execute("DROP TABLE senders")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS senders ("
+            " organization_id TEXT, network_id TEXT, first_received REAL, last_received REAL,"
+            " PRIMARY KEY (organization_id, network_id))"
+        )
+        if columns and "network_id" not in columns:
+            self._db.execute(
+                "INSERT INTO senders SELECT organization_id, COALESCE(network_id, ''), MIN(received_at),"
+                " MAX(received_at) FROM alerts GROUP BY organization_id, COALESCE(network_id, '')"
+            )
+
+    @property
+    def persistent(self) -> bool:
+        """
+        Whether the store is a file, shared by every worker process (not ":memory:").
+        """
+        return self.path != ":memory:"
+
+    def add(self, payload: dict, received_at: Optional[float] = None) -> bool:
+        """
+        Store one webhook payload (without its sharedSecret). Returns False for a duplicate.
+        """
+        received_at = time.time() if received_at is None else received_at
+        payload = {k: v for k, v in payload.items() if k != "sharedSecret"}
+        organization_id = str(payload.get("organizationId") or "")
+        row = (
+            payload.get("alertId") or None,
+            organization_id,
+            payload.get("networkId"),
+            payload.get("alertTypeId"),
+            payload.get("alertLevel"),
+            payload.get("deviceSerial"),
+            parse_timestamp(payload.get("occurredAt"), received_at),
+            received_at,
+            json.dumps(payload, separators=(",", ":")),
+        )
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO alerts (alert_id, organization_id, network_id, alert_type_id,"
+                " alert_level, device_serial, occurred_at, received_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            stored = cursor.rowcount == 1
+            if payload.get("alertTypeId"):
+                self._db.execute(
+                    "INSERT OR REPLACE INTO alert_types (alert_type_id, alert_type) VALUES (?, ?)",
+                    (payload["alertTypeId"], (payload.get("alertType") or "").strip().lower()),
+                )
+            self._db.execute(
+                "INSERT INTO senders (organization_id, network_id, first_received, last_received)"
+                " VALUES (?, ?, ?, ?) ON CONFLICT (organization_id, network_id)"
+                " DO UPDATE SET last_received = excluded.last_received",
+                (organization_id, str(payload.get("networkId") or ""), received_at, received_at),
+            )
+            self._stats["received" if stored else "duplicates"] += 1
+            if received_at - self._last_evict >= _EVICT_INTERVAL_S:
+                self._evict(received_at)
+            self._db.commit()
+        return stored
+
+    def _evict(self, now: float) -> int:
+        cursor = self._db.execute("DELETE FROM alerts WHERE occurred_at < ?", (now - self.retention_s,))
+        self._last_evict = now
+        self._stats["evicted"] += cursor.rowcount
+        return cursor.rowcount
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """
+        Delete alerts older than the retention period; returns how many were removed.
+        """
+        with self._lock:
+            removed = self._evict(time.time() if now is None else now)
+            self._db.commit()
+        return removed
+
+    def receiving_since(self, organization_id: str, network_id: str) -> Optional[float]:
+        """
+        When the first webhook of this network was received (None if never).
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT first_received FROM senders WHERE organization_id = ? AND network_id = ?",
+                (str(organization_id), str(network_id)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _window(self, first_received: float, now: Optional[float]) -> dict:
+        now = time.time() if now is None else now
+        return {"from": max(first_received, now - self.retention_s), "to": now}
+
+    def coverage(self, organization_id: str, network_id: str, now: Optional[float] = None) -> Optional[dict]:
+        """
+        The window ({"from", "to"}, epoch seconds) for which the store has every alert of
+        this network: from its first webhook (or the retention horizon, if later) until now.
+        None if the network has never sent a webhook.
+        """
+        first_received = self.receiving_since(organization_id, network_id)
+        if first_received is None:
+            return None
+        return self._window(first_received, now)
+
+    def network_coverage(self, organization_id: str, now: Optional[float] = None) -> Dict[str, dict]:
+        """
+        coverage() of every network of this org that has sent a webhook, by network ID.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT network_id, first_received FROM senders WHERE organization_id = ? AND network_id != ''",
+                (str(organization_id),),
+            ).fetchall()
+        return {network_id: self._window(first_received, now) for network_id, first_received in rows}
+
+    def query(
+        self,
+        organization_id: Optional[str] = None,
+        network_id: Optional[str] = None,
+        alert_type: Optional[str] = None,
+        device_serial: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: Optional[int] = 1000,
+        until: Optional[float] = None,
+    ) -> List[dict]:
+        """
+        Stored alerts matching every given filter, most recent first, as history entries.
+        alert_type matches an alertTypeId (e.g. "appliances_went_down") or, case-insensitively,
+        an alertType (e.g. "Appliance went down"). since is inclusive, until exclusive.
+        """
+        clauses, params = [], []
+        for column, value in (
+            ("organization_id", organization_id),
+            ("network_id", network_id),
+            ("device_serial", device_serial),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(str(value))
+        if alert_type:
+            clauses.append(
+                "alert_type_id IN (SELECT ? UNION SELECT alert_type_id FROM alert_types WHERE alert_type = ?)"
+            )
+            params.extend([alert_type, alert_type.strip().lower()])
+        if since is not None:
+            clauses.append("occurred_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("occurred_at < ?")
+            params.append(until)
+        sql = "SELECT payload FROM alerts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY occurred_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [history_entry(json.loads(payload)) for (payload,) in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM alerts").fetchone()
+            organizations, networks = self._db.execute(
+                "SELECT COUNT(DISTINCT organization_id), COUNT(NULLIF(network_id, '')) FROM senders"
+            ).fetchone()
+        return {
+            **self._stats,
+            "alerts": count,
+            "organizations": organizations,
+            "networks": networks,
+            "retention_s": self.retention_s,
+            "path": self.path,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_store: Optional[AlertStore] = None
+_store_lock = threading.Lock()
+
+
+def get_alert_store() -> AlertStore:
+    """
+    Process-wide store configured from the MERAKI_ALERT_* environment variables.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = AlertStore(MERAKI_ALERT_STORE_PATH, MERAKI_ALERT_RETENTION_S)
+        return _store
@@ -0,0 +1,216 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/meraki_client_index.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+import threading
+from calendar import timegm
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from dotenv import load_dotenv
+
+from cisco_integrations.rate_limit import PRIORITY_BACKGROUND, at_priority
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Index age searched without syncing / searched while a background delta sync runs
+MERAKI_CLIENT_INDEX_TTL_S = float(os.getenv("MERAKI_CLIENT_INDEX_TTL_S", "300"))
+MERAKI_CLIENT_INDEX_MAX_STALE_S = float(os.getenv("MERAKI_CLIENT_INDEX_MAX_STALE_S", "3600"))
+# Clients seen within this window are kept (default 14 days, the searches' default timespan)
+MERAKI_CLIENT_INDEX_WINDOW_S = int(os.getenv("MERAKI_CLIENT_INDEX_WINDOW_S", str(60 * 60 * 24 * 14)))
+# Delta syncs ask for clients seen since the previous sync minus this overlap
+MERAKI_CLIENT_INDEX_OVERLAP_S = int(os.getenv("MERAKI_CLIENT_INDEX_OVERLAP_S", "300"))
+
+# Shared by every CiscoMerakiClient in the process, keyed by (org, API key fingerprint).
+# Background syncs yield the org's rate limit to interactive requests.
+CLIENT_INDEX_CACHE = RefreshingCache(
+    "meraki-clients",
+    MERAKI_CLIENT_INDEX_TTL_S,
+    MERAKI_CLIENT_INDEX_MAX_STALE_S,
+    refresh_wrapper=lambda load: at_priority(PRIORITY_BACKGROUND, load),
+)
+
+SEARCH_FIELDS = ("description", "dhcpHostname", "mac", "ip", "user")
+NAME_FIELDS = ("description", "dhcpHostname")
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    Case-insensitive substring search over a few text fields per document.
+    Each field's trigrams are posted separately; a query's trigrams narrow the
+    candidates, which are then checked with an exact substring match.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self._docs: Dict[Hashable, Tuple[str, ...]] = {}
+        self._postings: Dict[str, Set] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, key, record: dict) -> None:
+        self.remove(key)
+        values = tuple(str(record.get(field) or "").lower() for field in self.fields)
+        self._docs[key] = values
+        for value in values:
+            for gram in _trigrams(value):
+                self._postings[gram].add(key)
+
+    def remove(self, key) -> None:
+        values = self._docs.pop(key, None)
+        if values is None:
+            return
+        for value in values:
+            for gram in _trigrams(value):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self._postings[gram]
+
+    def search(self, query: str, fields: Optional[Sequence[str]] = None) -> List:
+        query = (query or "").strip().lower()
+        positions = [self.fields.index(f) for f in (fields or self.fields)]
+        grams = _trigrams(query)
+        if grams:
+            postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= posting
+        else:
+            # Queries under three characters have no trigrams: scan
+            candidates = self._docs.keys()
+        return [key for key in candidates if any(query in self._docs[key][i] for i in positions)]
+
+
+def last_seen_epoch(client: dict, default: float) -> float:
+    """
+    lastSeen as epoch seconds; the Dashboard returns epoch numbers or ISO 8601 strings.
+    """
+    value = client.get("lastSeen")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return float(timegm(time.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")))
+        except ValueError:
+            pass
+    return default
+
+
+def client_key(client: dict) -> Tuple[str, str]:
+    return client.get("networkId") or "", client.get("id") or (client.get("mac") or "").lower()
+
+
+class ClientIndex:
+    """
+    The organization's network clients seen within MERAKI_CLIENT_INDEX_WINDOW_S,
+    with a trigram index over description, hostname, MAC, IP and user.
+    Kept up to date by delta syncs (see CiscoMerakiClient.client_index).
+    """
+
+    def __init__(self, organization_id: str, window_s: int = MERAKI_CLIENT_INDEX_WINDOW_S):
+        self.organization_id = organization_id
+        self.window_s = window_s
+        self.clients: Dict[Tuple[str, str], dict] = {}
+        self._seen: Dict[Tuple[str, str], float] = {}
+        self._text = TrigramIndex(SEARCH_FIELDS)
+        self._lock = threading.RLock()
+        self.synced_at: Optional[float] = None
+        self.network_synced_at: Dict[str, float] = {}
+        self.network_ids: Set[str] = set()
+        self.network_errors: List[dict] = []
+        self.syncs = {"full": 0, "delta": 0, "last_ms": 0.0, "last_upserts": 0, "last_pruned": 0}
+
+    def apply_sync(
+        self,
+        started_at: float,
+        network_ids: Iterable[str],
+        clients_by_network: Dict[str, List[dict]],
+        network_errors: List[dict],
+        full: bool,
+    ) -> None:
+        """
+        Merge one sync: upsert the returned clients, drop clients of networks that no
+        longer exist and clients not seen within the window. Networks that failed keep
+        their clients and their previous sync time, so the next delta covers the gap.
+        """
+        network_ids = set(network_ids)
+        upserts = 0
+        with self._lock:
+            for network_id, clients in clients_by_network.items():
+                self.network_synced_at[network_id] = started_at
+                for client in clients:
+                    key = client_key(client)
+                    self.clients[key] = client
+                    self._seen[key] = last_seen_epoch(client, started_at)
+                    self._text.add(key, client)
+                    upserts += 1
+
+            oldest = started_at - self.window_s
+            stale = [
+                key for key in self.clients
+                if key[0] not in network_ids or self._seen[key] < oldest
+            ]
+            for key in stale:
+                del self.clients[key]
+                del self._seen[key]
+                self._text.remove(key)
+
+            for network_id in set(self.network_synced_at) - network_ids:
+                del self.network_synced_at[network_id]
+
+            self.synced_at = started_at
+            self.network_ids = network_ids
+            self.network_errors = network_errors
+            self.syncs["full" if full else "delta"] += 1
+            self.syncs["last_ms"] = round((time.time() - started_at) * 1000, 1)
+            self.syncs["last_upserts"] = upserts
+            self.syncs["last_pruned"] = len(stale)
+
+    def sync_params(self, network_id: str, now: float) -> dict:
+        """
+        getNetworkClients parameters for the next sync of a network: the whole window
+        the first time, afterwards only clients seen since its last successful sync.
+        """
+        with self._lock:
+            last = self.network_synced_at.get(network_id)
+        if last is None or now - last >= self.window_s:
+            return {"timespan": self.window_s}
+        t0 = last - MERAKI_CLIENT_INDEX_OVERLAP_S
+        return {"t0": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t0))}
+
+    def search(self, query: str, fields: Sequence[str] = SEARCH_FIELDS, timespan: Optional[int] = None) -> List[dict]:
+        """
+        Clients whose fields contain query (case-insensitive), most recently seen first.
+        """
+        since = time.time() - timespan if timespan else None
+        with self._lock:
+            keys = self._text.search(query, fields)
+            if since is not None:
+                keys = [key for key in keys if self._seen[key] >= since]
+            keys.sort(key=self._seen.__getitem__, reverse=True)
+            return [self.clients[key] for key in keys]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "clients": len(self.clients),
+                "networks": len(self.network_ids),
+                "synced_at": self.synced_at,
+                **self.syncs,
+            }
@@ -0,0 +1,150 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/meraki_inventory.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from cisco_integrations.rate_limit import PRIORITY_BACKGROUND, at_priority
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Snapshot age served without refreshing, and the age up to which a stale
+# snapshot is still served while a background refresh runs
+MERAKI_INVENTORY_TTL_S = float(os.getenv("MERAKI_INVENTORY_TTL_S", "300"))
+MERAKI_INVENTORY_MAX_STALE_S = float(os.getenv("MERAKI_INVENTORY_MAX_STALE_S", "1800"))
+
+# Shared by every CiscoMerakiClient in the process, keyed by (org, API key fingerprint).
+# Background refreshes yield the org's rate limit to interactive requests.
+INVENTORY_CACHE = RefreshingCache(
+    "meraki-inventory",
+    MERAKI_INVENTORY_TTL_S,
+    MERAKI_INVENTORY_MAX_STALE_S,
+    refresh_wrapper=lambda load: at_priority(PRIORITY_BACKGROUND, load),
+)
+
+# Model prefix -> productType, for inventory entries without a productType
+MODEL_PREFIX_PRODUCT_TYPES = {
+    "MR": "wireless",
+    "CW": "wireless",
+    "MS": "switch",
+    "C9": "switch",
+    "MX": "appliance",
+    "Z": "appliance",
+    "MV": "camera",
+    "MG": "cellularGateway",
+    "MT": "sensor",
+}
+
+_NON_HEX = re.compile(r"[^0-9a-f]")
+
+
+def normalize_mac(mac: str) -> str:
+    """
+    'AA-BB-CC-DD-EE-FF', 'aabb.ccdd.eeff' and 'aa:bb:cc:dd:ee:ff' all map to 'aa:bb:cc:dd:ee:ff'.
+    """
+    digits = _NON_HEX.sub("", (mac or "").lower())
+    return ":".join(digits[i:i + 2] for i in range(0, len(digits), 2))
+
+
+def model_prefix(model: str) -> str:
+    """
+    Family prefix of a Meraki model: 'MR46' -> 'MR', 'Z3C' -> 'Z'.
+    """
+    model = (model or "").upper()
+    return model[:1] if model.startswith("Z") else model[:2]
+
+
+def product_type(device: dict) -> str:
+    return device.get("productType") or MODEL_PREFIX_PRODUCT_TYPES.get(model_prefix(device.get("model")), "other")
+
+
+class InventorySnapshot:
+    """
+    One organization's inventory (getOrganizationInventoryDevices) with lookup indexes
+    built once per fetch. Lookups return new lists of the shared device dicts, which
+    callers should treat as read-only.
+    """
+
+    def __init__(self, organization_id: str, devices: List[dict]):
+        self.organization_id = organization_id
+        self.devices = devices
+        self.fetched_at = time.time()
+        self.by_serial: Dict[str, dict] = {}
+        self.by_mac: Dict[str, dict] = {}
+        self.by_network: Dict[str, List[dict]] = defaultdict(list)
+        self.by_prefix: Dict[str, List[dict]] = defaultdict(list)
+        self.by_product_type: Dict[str, List[dict]] = defaultdict(list)
+
+        for device in devices:
+            if device.get("serial"):
+                self.by_serial[device["serial"].upper()] = device
+            if device.get("mac"):
+                self.by_mac[normalize_mac(device["mac"])] = device
+            if device.get("networkId"):
+                self.by_network[device["networkId"]].append(device)
+            self.by_prefix[model_prefix(device.get("model"))].append(device)
+            self.by_product_type[product_type(device)].append(device)
+
+    def with_model_prefix(self, prefix: str) -> List[dict]:
+        """
+        Devices whose model starts with prefix ('MR', 'MS220', ...).
+        """
+        prefix = prefix.upper()
+        bucket = self.by_prefix.get(model_prefix(prefix), [])
+        if len(prefix) <= 2:
+            return list(bucket)
+        return [d for d in bucket if (d.get("model") or "").upper().startswith(prefix)]
+
+    def of_product_type(self, name: str) -> List[dict]:
+        return list(self.by_product_type.get(name, []))
+
+    def family(self, name: str) -> List[dict]:
+        """
+        Devices of a family given either as a productType ('camera') or a model prefix ('MV').
+        """
+        if name in self.by_product_type:
+            return self.of_product_type(name)
+        return self.with_model_prefix(name)
+
+    def in_network(self, network_id: str) -> List[dict]:
+        return list(self.by_network.get(network_id, []))
+
+    def select(self, family: str = None, network_id: str = None) -> List[dict]:
+        """
+        Devices of a family, in a network, or of a family within a network.
+        """
+        if not network_id:
+            return self.family(family) if family else list(self.devices)
+        devices = self.in_network(network_id)
+        if not family:
+            return devices
+        if family in self.by_product_type:
+            return [d for d in devices if product_type(d) == family]
+        prefix = family.upper()
+        return [d for d in devices if (d.get("model") or "").upper().startswith(prefix)]
+
+    def device(self, serial: str = None, mac: str = None) -> Optional[dict]:
+        if serial:
+            return self.by_serial.get(serial.strip().upper())
+        if mac:
+            return self.by_mac.get(normalize_mac(mac))
+        return None
+
+    def summary(self) -> dict:
+        return {
+            "organization_id": self.organization_id,
+            "devices": len(self.devices),
+            "age_s": round(time.time() - self.fetched_at, 1),
+            "product_types": {name: len(devices) for name, devices in self.by_product_type.items()},
+        }
@@ -0,0 +1,78 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/meraki_networks.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from cisco_integrations.rate_limit import PRIORITY_BACKGROUND, at_priority
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Index age served without refreshing / served while a background refresh runs
+MERAKI_NETWORKS_TTL_S = float(os.getenv("MERAKI_NETWORKS_TTL_S", "300"))
+MERAKI_NETWORKS_MAX_STALE_S = float(os.getenv("MERAKI_NETWORKS_MAX_STALE_S", "3600"))
+# An unknown network ID or name refetches the index at most this often (new networks)
+MERAKI_NETWORKS_MISS_REFRESH_S = float(os.getenv("MERAKI_NETWORKS_MISS_REFRESH_S", "60"))
+
+# Shared by every CiscoMerakiClient in the process, keyed by (org, API key fingerprint).
+# Background refreshes yield the org's rate limit to interactive requests.
+NETWORK_CACHE = RefreshingCache(
+    "meraki-networks",
+    MERAKI_NETWORKS_TTL_S,
+    MERAKI_NETWORKS_MAX_STALE_S,
+    refresh_wrapper=lambda load: at_priority(PRIORITY_BACKGROUND, load),
+)
+
+
+class NetworkIndex:
+    """
+    One organization's networks (getOrganizationNetworks) indexed by ID, name and tag.
+    """
+
+    def __init__(self, organization_id: str, networks: List[dict]):
+        self.organization_id = organization_id
+        self.networks = networks
+        self.fetched_at = time.time()
+        self.by_id: Dict[str, dict] = {net["id"]: net for net in networks if net.get("id")}
+        self.ids = frozenset(self.by_id)
+        self.by_name: Dict[str, str] = {}
+        self.by_tag: Dict[str, List[str]] = defaultdict(list)
+        for net in networks:
+            if net.get("name"):
+                self.by_name[net["name"].strip().lower()] = net["id"]
+            for tag in net.get("tags") or []:
+                self.by_tag[tag.lower()].append(net["id"])
+
+    def __contains__(self, network_id: str) -> bool:
+        return network_id in self.ids
+
+    def resolve(self, network: str) -> Optional[str]:
+        """
+        Network ID for an ID or a (case-insensitive) network name; None if neither matches.
+        """
+        if not network:
+            return None
+        if network in self.ids:
+            return network
+        return self.by_name.get(network.strip().lower())
+
+    def get(self, network: str) -> Optional[dict]:
+        network_id = self.resolve(network)
+        return self.by_id.get(network_id) if network_id else None
+
+    def with_tag(self, tag: str) -> List[dict]:
+        return [self.by_id[network_id] for network_id in self.by_tag.get(tag.lower(), [])]
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.fetched_at
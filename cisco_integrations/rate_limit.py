@@ -0,0 +1,230 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/rate_limit.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+import heapq
+import logging
+import itertools
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Meraki allows 10 calls per second per organization (with a short burst above that)
+MERAKI_ORG_RATE_LIMIT = float(os.getenv("MERAKI_ORG_RATE_LIMIT", "10"))
+MERAKI_ORG_RATE_BURST = int(os.getenv("MERAKI_ORG_RATE_BURST", "10"))
+# Pause used when a 429 carries no usable Retry-After header
+MERAKI_DEFAULT_RETRY_AFTER_S = float(os.getenv("MERAKI_DEFAULT_RETRY_AFTER_S", "1"))
+
+# Lower value = served first. Waiting requests of equal priority are served in arrival order.
+PRIORITY_INTERACTIVE = 0  # a user's chat or REST request
+PRIORITY_BULK = 1         # fan-out requests of org-wide aggregators
+PRIORITY_BACKGROUND = 2   # cache refreshes nobody is waiting on
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BULK: "bulk", PRIORITY_BACKGROUND: "background"}
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("meraki_priority", default=PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def meraki_priority(priority: int):
+    """
+    Run the enclosed Meraki calls (in this thread / context) at the given priority.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+def at_priority(priority: int, fn: Callable) -> Callable:
+    """
+    Wrap fn so that it runs at the given priority, e.g. for a background refresh thread.
+    """
+    def wrapped(*args, **kwargs):
+        with meraki_priority(priority):
+            return fn(*args, **kwargs)
+    return wrapped
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with a priority queue: 'rate' tokens per second, holding
+    at most 'burst'. acquire() blocks until a token is available and every waiter with
+    a lower priority value (or the same value, earlier) has been served.
+    pause() stops all grants for a while, e.g. for the Retry-After of a 429.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(0.001, rate)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._queue = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self.throttled = 0
+        self.max_queue_depth = 0
+        self._by_priority: Dict[int, dict] = {}
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _record(self, priority: int, waited_s: float) -> None:
+        entry = self._by_priority.setdefault(priority, {"granted": 0, "waits": 0, "waited_s": 0.0, "max_wait_s": 0.0})
+        entry["granted"] += 1
+        if waited_s > 0.001:
+            entry["waits"] += 1
+            entry["waited_s"] += waited_s
+            entry["max_wait_s"] = max(entry["max_wait_s"], waited_s)
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None, priority: Optional[int] = None) -> bool:
+        """
+        Take 'tokens', waiting as long as needed (or until timeout). Returns False on timeout.
+        priority defaults to the calling context's (see meraki_priority).
+        """
+        priority = current_priority() if priority is None else priority
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        ticket = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                at_head = self._queue[0] == ticket
+                if at_head and now >= self._paused_until and self._tokens >= tokens:
+                    heapq.heappop(self._queue)
+                    self._tokens -= tokens
+                    self._record(priority, now - start)
+                    self._cond.notify_all()
+                    return True
+
+                # Only the head of the queue waits for a token; the others wait for their turn
+                wait = None
+                if at_head:
+                    wait = max(self._paused_until - now, (tokens - self._tokens) / self.rate, 0.001)
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0 or (at_head and wait > remaining):
+                        self._queue.remove(ticket)
+                        heapq.heapify(self._queue)
+                        self._cond.notify_all()
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Grant nothing for 'seconds' (and start again from an empty bucket).
+        """
+        with self._cond:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            waiting: Dict[str, int] = {}
+            for priority, _ in self._queue:
+                name = PRIORITY_NAMES.get(priority, str(priority))
+                waiting[name] = waiting.get(name, 0) + 1
+            by_priority = {}
+            for priority, entry in sorted(self._by_priority.items()):
+                by_priority[PRIORITY_NAMES.get(priority, str(priority))] = {
+                    **entry,
+                    "waited_s": round(entry["waited_s"], 3),
+                    "max_wait_s": round(entry["max_wait_s"], 3),
+                    "avg_wait_s": round(entry["waited_s"] / entry["granted"], 4) if entry["granted"] else 0.0,
+                }
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "available": round(self._tokens, 2),
+                "queue_depth": len(self._queue),
+                "waiting": waiting,
+                "max_queue_depth": self.max_queue_depth,
+                "paused_for_s": round(max(0.0, self._paused_until - now), 3),
+                "throttled_429": self.throttled,
+                "by_priority": by_priority,
+            }
+
+
+_org_limiters: Dict[str, TokenBucket] = {}
+_org_limiters_lock = threading.Lock()
+
+
+def meraki_org_limiter(organization_id: str) -> TokenBucket:
+    """
+    Process-wide bucket for one Meraki organization, shared by every client and
+    thread that calls the Dashboard API for that org.
+    """
+    with _org_limiters_lock:
+        limiter = _org_limiters.get(organization_id)
+        if limiter is None:
+            limiter = TokenBucket(MERAKI_ORG_RATE_LIMIT, MERAKI_ORG_RATE_BURST)
+            _org_limiters[organization_id] = limiter
+        return limiter
+
+
+def meraki_rate_limit_stats() -> dict:
+    with _org_limiters_lock:
+        limiters = dict(_org_limiters)
+    return {org_id: limiter.stats() for org_id, limiter in limiters.items()}
+
+
+def _retry_after(response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return MERAKI_DEFAULT_RETRY_AFTER_S
+
+
+def pace_meraki_dashboard(dashboard, organization_id: str) -> None:
+    """
+    Route every HTTP attempt of a meraki.DashboardAPI through the org's bucket: single
+    calls, the follow-up page requests of total_pages="all" and the SDK's own retries.
+    A 429 pauses the whole org's bucket for its Retry-After, so every client and thread
+    backs off together instead of each retrying on its own.
+    """
+    session = getattr(dashboard, "_session", None)
+    if session is None or getattr(session, "_org_paced", False):
+        return
+
+    # Older SDKs have no per-attempt hook; pace whole requests there
+    hook = "_send_request" if hasattr(session, "_send_request") else "request"
+    send = getattr(session, hook)
+
+    def paced_send(*args, **kwargs):
+        limiter = meraki_org_limiter(organization_id)
+        limiter.acquire()
+        response = send(*args, **kwargs)
+        if getattr(response, "status_code", None) == 429:
+            wait = _retry_after(response)
+            logging.warning(f"Meraki 429 for org {organization_id}: pausing org requests for {wait}s")
+            limiter.pause(wait)
+        return response
+
+    setattr(session, hook, paced_send)
+    session._org_paced = True
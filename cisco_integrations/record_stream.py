@@ -0,0 +1,57 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/record_stream.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+from itertools import islice
+from typing import Iterator, Optional
+
+
+class RecordStream:
+    """
+    Records produced lazily (e.g. API pages as they arrive) plus metadata such as
+    "network_errors", which is complete once the records are exhausted or closed.
+
+    Consumers either iterate it (NDJSON routes) or collect() it into the usual
+    {**meta, key: [...]} result. Stopping early and calling close() stops the
+    remaining page requests.
+    """
+
+    def __init__(self, key: str, records: Iterator[dict], meta: Optional[dict] = None):
+        self.key = key
+        self.records = records
+        self.meta = meta if meta is not None else {}
+        self.count = 0
+
+    def __iter__(self):
+        for record in self.records:
+            self.count += 1
+            yield record
+
+    def close(self) -> None:
+        close = getattr(self.records, "close", None)
+        if close is not None:
+            close()
+
+    def collect(self, max_rows: Optional[int] = None) -> dict:
+        """
+        Gather at most max_rows records; "truncated" tells whether more were available.
+        """
+        try:
+            if max_rows is None:
+                rows = list(self)
+                truncated = False
+            else:
+                rows = list(islice(self, max_rows + 1))
+                truncated = len(rows) > max_rows
+                del rows[max_rows:]
+        finally:
+            self.close()
+        result = {**self.meta, self.key: rows}
+        if truncated:
+            result["truncated"] = True
+            result["row_limit"] = max_rows
+        return result
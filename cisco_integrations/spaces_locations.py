@@ -0,0 +1,132 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/spaces_locations.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from cisco_integrations.ttl_cache import RefreshingCache
+
+load_dotenv()
+
+# Location hierarchy age served without refreshing, and up to which a stale one is
+# served while it is refreshed in the background
+CISCO_SPACES_HIERARCHY_TTL_S = float(os.getenv("CISCO_SPACES_HIERARCHY_TTL_S", "600"))
+CISCO_SPACES_HIERARCHY_MAX_STALE_S = float(os.getenv("CISCO_SPACES_HIERARCHY_MAX_STALE_S", "3600"))
+
+# Shared by every CiscoSpacesClient in the process, keyed by (URL, API key fingerprint, tenant)
+HIERARCHY_CACHE = RefreshingCache("spaces-hierarchy", CISCO_SPACES_HIERARCHY_TTL_S, CISCO_SPACES_HIERARCHY_MAX_STALE_S)
+
+
+def _children(node: dict) -> List[dict]:
+    # Children are listed under "children" or "relationshipData.children"
+    children = node.get("children")
+    if children is None:
+        children = (node.get("relationshipData") or {}).get("children")
+    return [child for child in children or [] if isinstance(child, dict)]
+
+
+def _roots(hierarchy: Any) -> List[dict]:
+    if isinstance(hierarchy, list):
+        return [node for node in hierarchy if isinstance(node, dict)]
+    if isinstance(hierarchy, dict):
+        if isinstance(hierarchy.get("map"), list):
+            return [node for node in hierarchy["map"] if isinstance(node, dict)]
+        return [hierarchy]
+    return []
+
+
+def _level(node: dict) -> Optional[str]:
+    level = node.get("level") or node.get("type")
+    return level.upper() if isinstance(level, str) else None
+
+
+class LocationIndex:
+    """
+    The Cisco Spaces location hierarchy (GET /map/locationhierarchy) with, built
+    once per fetch without recursion: id -> node (the node is its own subtree),
+    parent pointers and the enclosing floor of every location. Subtree and
+    "which floor is X on" lookups are dict reads; a path follows the parent
+    pointers (a handful of steps: campus, building, floor, zone).
+    """
+
+    def __init__(self, hierarchy: Any):
+        self.hierarchy = hierarchy
+        self.fetched_at = time.time()
+        self.by_id: Dict[str, dict] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self.parent: Dict[str, Optional[str]] = {}
+        self.floor: Dict[str, Optional[str]] = {}
+
+        queue = deque((root, None) for root in _roots(hierarchy))
+        while queue:
+            node, parent_id = queue.popleft()
+            node_id = node.get("id")
+            if node_id is None or node_id in self.by_id:
+                continue
+            self.by_id[node_id] = node
+            self.parent[node_id] = parent_id
+            self.floor[node_id] = node_id if _level(node) == "FLOOR" else self.floor.get(parent_id)
+            if node.get("name"):
+                self.by_name.setdefault(node["name"].strip().lower(), []).append(node_id)
+            queue.extend((child, node_id) for child in _children(node))
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.fetched_at
+
+    def find(self, location: str) -> List[str]:
+        """
+        IDs of the location with this ID, or of every location with this name (case-insensitive).
+        """
+        if not location:
+            return []
+        if location in self.by_id:
+            return [location]
+        return list(self.by_name.get(location.strip().lower(), []))
+
+    def ancestors(self, location_id: str) -> List[str]:
+        """
+        IDs from the root down to the parent of location_id.
+        """
+        chain = []
+        parent_id = self.parent.get(location_id)
+        while parent_id is not None:
+            chain.append(parent_id)
+            parent_id = self.parent[parent_id]
+        return list(reversed(chain))
+
+    def record(self, location_id: str) -> dict:
+        """
+        A location as id, name and level, without its children.
+        """
+        node = self.by_id[location_id]
+        return {"id": location_id, "name": node.get("name"), "level": _level(node)}
+
+    def describe(self, location_id: str) -> dict:
+        """
+        A location with its path from the root, its floor (None above floor level)
+        and how many locations it directly contains.
+        """
+        floor_id = self.floor.get(location_id)
+        return {
+            **self.record(location_id),
+            "path": [self.record(ancestor) for ancestor in self.ancestors(location_id)],
+            "floor": self.record(floor_id) if floor_id else None,
+            "children": len(_children(self.by_id[location_id])),
+        }
+
+    def summary(self) -> dict:
+        levels: Dict[str, int] = {}
+        for node in self.by_id.values():
+            level = _level(node) or "UNKNOWN"
+            levels[level] = levels.get(level, 0) + 1
+        return {"locations": len(self.by_id), "age_s": round(self.age_s, 1), "levels": levels}
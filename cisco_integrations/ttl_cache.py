@@ -0,0 +1,145 @@
+################################################################################
+# cisco-data-bridge-domain-index/cisco_integrations/ttl_cache.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import time
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Entry:
+    def __init__(self, value: Any, loaded_at: float, load_ms: float):
+        self.value = value
+        self.loaded_at = loaded_at
+        self.load_ms = load_ms
+
+
+class RefreshingCache:
+    """
+    Keyed cache with a time-to-live and stale-while-revalidate.
+
+    - Younger than ttl_s: returned as is.
+    - Older than ttl_s but younger than max_stale_s: returned immediately while
+      one background thread reloads it.
+    - Missing or older than max_stale_s: loaded in the caller's thread.
+    Concurrent loads of the same key are collapsed into one loader call. A failed
+    background refresh keeps serving the stale value until max_stale_s.
+    refresh_wrapper, if given, wraps the loader of background refreshes (e.g. to lower
+    their rate-limit priority). With max_entries, the oldest entries are dropped
+    beyond that many keys.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_s: float,
+        max_stale_s: float,
+        refresh_wrapper: Optional[Callable[[Callable], Callable]] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.name = name
+        self.ttl_s = ttl_s
+        self.max_stale_s = max(ttl_s, max_stale_s)
+        self.refresh_wrapper = refresh_wrapper
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale_hits": 0, "loads": 0, "refreshes": 0, "errors": 0, "waits": 0}
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], future: Future, background: bool) -> None:
+        start = time.perf_counter()
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._stats["errors"] += 1
+                self._inflight.pop(key, None)
+            logging.error(f"{self.name}: {'refresh' if background else 'load'} of {key!r} failed: {e}")
+            future.set_exception(e)
+            return
+        load_ms = round((time.perf_counter() - start) * 1000, 1)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = _Entry(value, time.time(), load_ms)
+            if self.max_entries is not None:
+                # Insertion order is load order: the first keys are the oldest
+                for old_key in list(self._entries)[:-self.max_entries or None]:
+                    del self._entries[old_key]
+            self._stats["refreshes" if background else "loads"] += 1
+            self._inflight.pop(key, None)
+        logging.info(f"{self.name}: {'refreshed' if background else 'loaded'} {key!r} in {load_ms} ms")
+        future.set_result(value)
+
+    def get(self, key: Hashable, loader: Callable[[], Any], force_refresh: bool = False) -> Any:
+        """
+        Value for key, calling loader() when it is missing, expired or force_refresh is set.
+        Exceptions from a foreground load propagate to every waiting caller.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            age = now - entry.loaded_at if entry else None
+            if entry and not force_refresh and age < self.ttl_s:
+                self._stats["hits"] += 1
+                return entry.value
+
+            future = self._inflight.get(key)
+            if entry and not force_refresh and age < self.max_stale_s:
+                # Serve stale, refresh once in the background
+                self._stats["stale_hits"] += 1
+                if future is None:
+                    future = Future()
+                    self._inflight[key] = future
+                    if self.refresh_wrapper is not None:
+                        loader = self.refresh_wrapper(loader)
+                    threading.Thread(
+                        target=self._load, args=(key, loader, future, True),
+                        name=f"{self.name}-refresh", daemon=True,
+                    ).start()
+                return entry.value
+
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._stats["waits"] += 1
+
+        if owner:
+            self._load(key, loader, future, False)
+        return future.result()
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        Cached value regardless of age, without loading.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.value if entry else None
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        now = time.time()
+        with self._lock:
+            return {
+                **self._stats,
+                "ttl_s": self.ttl_s,
+                "max_stale_s": self.max_stale_s,
+                "entries": [
+                    {"key": str(key), "age_s": round(now - entry.loaded_at, 1), "load_ms": entry.load_ms}
+                    for key, entry in self._entries.items()
+                ],
+            }
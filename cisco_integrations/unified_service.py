@@ -41,12 +41,18 @@ class CiscoUnifiedService:
         meraki_api_key=None,
         spaces_token=None,
         webex_token=None,
+        clients=None,
     ):
-        
+        # Pre-built platform clients keyed by "catalyst" / "meraki" / "spaces" / "webex"
+        # (see cisco_integrations.client_pool). A platform found here is not constructed again.
+        clients = clients or {}
+
         # -------------------------
         # Catalyst Center Integration
         # -------------------------
-        if ENABLE_CATALYST_CENTER:
+        if ENABLE_CATALYST_CENTER and "catalyst" in clients:
+            self.catalyst_client = clients["catalyst"]
+        elif ENABLE_CATALYST_CENTER:
             self.catalyst_client = CatalystCenterClient(
                 base_url=catalyst_url,
                 token=None,
@@ -69,10 +75,13 @@ class CiscoUnifiedService:
             logging.info(f"MERAKI_ORG_ID from environment: '{self.meraki_org_id}'")
             if not self.meraki_org_id:
                 logging.warning("MERAKI_ORG_ID is not set in the environment.")
-            self.meraki_client = CiscoMerakiClient(
-                api_key=meraki_api_key,
-                organization_id=self.meraki_org_id
-            ) if meraki_api_key else None
+            if "meraki" in clients:
+                self.meraki_client = clients["meraki"]
+            else:
+                self.meraki_client = CiscoMerakiClient(
+                    api_key=meraki_api_key,
+                    organization_id=self.meraki_org_id
+                ) if meraki_api_key else None
         else:
             self.meraki_client = None
             logging.info("Meraki integration is disabled.")
@@ -80,7 +89,9 @@ class CiscoUnifiedService:
         # -------------------------
         # Cisco Spaces Integration
         # -------------------------
-        if ENABLE_CISCO_SPACES:
+        if ENABLE_CISCO_SPACES and "spaces" in clients:
+            self.spaces_client = clients["spaces"]
+        elif ENABLE_CISCO_SPACES:
             self.spaces_client = CiscoSpacesClient(
                 base_url=None,  # Will use CISCO_SPACES_BASE_URL from environment if not provided.
                 api_key=spaces_token
@@ -92,7 +103,9 @@ class CiscoUnifiedService:
         # -------------------------
         # Cisco Webex Integration
         # -------------------------
-        if ENABLE_CISCO_WEBEX:
+        if ENABLE_CISCO_WEBEX and "webex" in clients:
+            self.webex_client = clients["webex"]
+        elif ENABLE_CISCO_WEBEX:
             self.webex_client = CiscoWebexClient(token=webex_token)
         else:
             self.webex_client = None
@@ -119,6 +132,34 @@ class CiscoUnifiedService:
 
         # This calls the method you defined in cisco_meraki_client.py
         return self.meraki_client.list_all_clients_in_org(timespan=timespan)
+
+    def stream_all_clients_in_org(self, timespan=60 * 60 * 24 * 14):
+        """
+        Same clients as list_all_clients_in_org, as a RecordStream that fetches pages
+        while it is consumed (the dispatcher collects it up to DISPATCH_MAX_ROWS).
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.stream_all_clients_in_org(timespan=timespan)
+
+    def stream_network_clients(self, network: str, timespan=60 * 60 * 24 * 14):
+        """
+        One Meraki network's clients (network ID or name) as a RecordStream.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.stream_network_clients(network, timespan=timespan)
+
+    def stream_inventory_devices(self, family: str = None, network_id: str = None):
+        """
+        Meraki inventory devices (optionally by family and/or network) as a RecordStream.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.stream_inventory_devices(family=family, network_id=network_id)
     
     def list_all_clients_in_org_by_name(self, name_substring: str, timespan=60 * 60 * 24 * 14):
         """
@@ -131,10 +172,51 @@ class CiscoUnifiedService:
         # Call the function you defined in cisco_meraki_client.py
         return self.meraki_client.list_all_clients_in_org_by_name(name_substring, timespan=timespan)
 
-    def get_network_alerts_history(self, network_id: str):
+    def search_clients_in_org(self, query: str, timespan=60 * 60 * 24 * 14):
+        """
+        Delegate to the Meraki client. Searches the org's client index by
+        description, hostname, MAC, IP or user.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.search_clients_in_org(query, timespan=timespan)
+
+    def search_alerts_in_org(self, network_id: str = None, alert_type: str = None, device_serial: str = None,
+                             timespan=60 * 60 * 24):
+        """
+        Delegate to the Meraki client. Alerts from the local webhook alert store.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+        return self.meraki_client.search_alerts_in_org(
+            network_id=network_id, alert_type=alert_type, device_serial=device_serial, timespan=timespan
+        )
+
+    def resolve_meraki_network(self, network: str):
+        """
+        Meraki network ID for a network ID or name of the org, from the cached network index.
+        Returns (network_id, None) or (None, {"error": ...}); passes the value through when Meraki is off.
+        """
+        if not self.meraki_client:
+            return network, None
+        return self.meraki_client.resolve_network(network)
+
+    def get_meraki_networks(self, tag: str = None):
+        """
+        All Meraki networks in the org (optionally filtered by tag).
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+        return self.meraki_client.get_organization_networks(tag=tag)
+
+    def get_meraki_network_by_id(self, network_id: str):
+        """
+        One Meraki network by ID or name.
+        """
         if not self.meraki_client:
             return {"message": "Meraki client not configured."}
-        return self.meraki_client.get_network_alerts_history(network_id)
+        return self.meraki_client.get_network(network_id)
 
     def get_all_access_points(self):
         """
@@ -158,12 +240,39 @@ class CiscoUnifiedService:
 
     def list_all_cameras_in_org(self):
         """
-        Lists all Meraki cameras in the organization (onboarding statuses).
+        Lists all Meraki cameras (models starting with 'MV') in the org.
         """
         if not self.meraki_client:
             return {"message": "Meraki client not configured."}
 
         return self.meraki_client.list_all_cameras_in_org()
+
+    def list_all_devices_in_org(self):
+        """
+        Lists every device in the org's Meraki inventory.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.list_all_devices_in_org()
+
+    def list_inventory_devices(self, family: str = None, network_id: str = None):
+        """
+        Lists Meraki inventory devices by family (productType or model prefix) and/or network.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.list_inventory_devices(family=family, network_id=network_id)
+
+    def find_inventory_device(self, serial: str = None, mac: str = None):
+        """
+        Finds one Meraki inventory device by serial or MAC address.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+
+        return self.meraki_client.find_inventory_device(serial=serial, mac=mac)
     
 
 
@@ -463,11 +572,6 @@ class CiscoUnifiedService:
             return {"error": "Meraki integration is disabled."}
         return self.meraki_client.getNetwork(networkId, **kwargs)
 
-    def get_network_alerts_history(self, networkId, perPage=None, startingAfter=None, endingBefore=None, **kwargs):
-        if not self.meraki_client:
-            return {"error": "Meraki integration is disabled."}
-        return self.meraki_client.getNetworkAlertsHistory(networkId, perPage, startingAfter, endingBefore, **kwargs)
-
     def get_network_alerts_settings(self, networkId, **kwargs):
         if not self.meraki_client:
             return {"error": "Meraki integration is disabled."}
@@ -2279,6 +2383,11 @@ class CiscoUnifiedService:
             return {"message": "Catalyst Center integration is disabled."}
         return self.catalyst_client.run_cli_command(device_id, command)
 
+    def run_cli_commands_on_catalyst_devices(self, devices, commands, timeout_s=None):
+        if not self.catalyst_client:
+            return {"message": "Catalyst Center integration is disabled."}
+        return self.catalyst_client.run_cli_commands(devices, commands, timeout_s)
+
     def get_catalyst_task_status_by_id(self, task_id: str):
         if not self.catalyst_client:
             return {"message": "Catalyst Center integration is disabled."}
@@ -2319,6 +2428,15 @@ class CiscoUnifiedService:
             return {"message": "Catalyst Center integration is disabled."}
         return self.catalyst_client.get_device_interfaces(device_id)
 
+    def query_catalyst_interfaces(self, status=None, admin_status=None, speed_mbps=None, vlan=None, device=None,
+                                  site=None, port_mode=None, interface_type=None, port_name=None,
+                                  group_by=None, limit=None):
+        if not self.catalyst_client:
+            return {"message": "Catalyst Center integration is disabled."}
+        return self.catalyst_client.query_interfaces(
+            status, admin_status, speed_mbps, vlan, device, site, port_mode, interface_type, port_name, group_by, limit
+        )
+
     def get_interfaces_by_ip(self, ip_address):
         if not self.catalyst_client:
             return {"message": "Catalyst Center integration is disabled."}
@@ -2329,6 +2447,11 @@ class CiscoUnifiedService:
             return {"message": "Catalyst Center integration is disabled."}
         return self.catalyst_client.initiate_path_trace(source_ip, destination_ip)
 
+    def execute_path_trace(self, source_ip, destination_ip, protocol=None, source_port=None, destination_port=None):
+        if not self.catalyst_client:
+            return {"message": "Catalyst Center integration is disabled."}
+        return self.catalyst_client.trace_path(source_ip, destination_ip, protocol, source_port, destination_port)
+
     def get_path_trace_result(self, flow_analysis_id):
         if not self.catalyst_client:
             return {"message": "Catalyst Center integration is disabled."}
@@ -2360,14 +2483,14 @@ class CiscoUnifiedService:
             return {"error": "Catalyst client not initialized."}
         return self.catalyst_client.get_site_by_name_v2(site_name)
 
-    def get_all_devices_by_site(self, site_id: str):
+    def get_all_devices_by_site(self, site_id: str, include_children: bool = False):
         """
         Calls CatalystCenterClient.get_all_devices_by_site
-        to retrieve all devices for a given site ID.
+        to retrieve all devices for a given site ID (or site name).
         """
         if not self.catalyst_client:
             return {"message": "Catalyst Center integration is disabled."}
-        return self.catalyst_client.get_all_devices_by_site(site_id)
+        return self.catalyst_client.get_all_devices_by_site(site_id, include_children)
 
 
 
@@ -2414,7 +2537,8 @@ class CiscoUnifiedService:
     def get_device_by_id(self, id, **kwargs):
         if not self.catalyst_client:
             return {"error": "Catalyst Center integration is disabled."}
-        return self.catalyst_client.getDeviceById(id, **kwargs)
+        # Answered from the device snapshot when it is fresh
+        return self.catalyst_client.get_device_by_id(id)
 
     def retrieve_image_distribution_servers(self, **kwargs):
         if not self.catalyst_client:
@@ -3574,7 +3698,8 @@ class CiscoUnifiedService:
     def get_membership(self, siteId, offset=None, limit=None, deviceFamily=None, serialNumber=None, **kwargs):
         if not self.catalyst_client:
             return {"error": "Catalyst Center integration is disabled."}
-        return self.catalyst_client.getMembership(siteId, offset, limit, deviceFamily, serialNumber, **kwargs)
+        # siteId may be a site name; resolved through the cached site hierarchy
+        return self.catalyst_client.get_site_membership(siteId, offset, limit, deviceFamily, serialNumber)
 
 
 
@@ -3598,7 +3723,23 @@ class CiscoUnifiedService:
         if not self.meraki_client:
             return {"message": "Meraki client not configured."}
         return self.meraki_client.get_organization_networks()
+
+    def get_network_alerts_history(self, networkId, perPage=None, startingAfter=None, endingBefore=None, **kwargs):
+        """
+        Serves both get_network_alerts_history (network ID or name) and getNetworkAlertsHistory:
+        from the webhook alert store when the org sends webhooks, otherwise the Dashboard API.
+        """
+        if not self.meraki_client:
+            return {"message": "Meraki client not configured."}
+        return self.meraki_client.get_network_alerts_history(
+            networkId, perPage=perPage, startingAfter=startingAfter, endingBefore=endingBefore, **kwargs
+        )
     
+    def get_spaces_location_path(self, location: str):
+        if not self.spaces_client:
+            return {"message": "Cisco Spaces integration is disabled."}
+        return self.spaces_client.get_location_path(location)
+
     def get_spaces_floor_details(self, floor_id: str):
         if not self.spaces_client:
             return {"message": "Cisco Spaces integration is disabled."}
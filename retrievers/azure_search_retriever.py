@@ -10,22 +10,12 @@ import os
 import logging
 import requests
 import json
-import re
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from .embedding_cache import cached_embedding
 
 load_dotenv()
 
-def sanitize_filename(s: str, max_length=100) -> str:
-    """
-    Removes invalid characters from a string for filenames, then trims
-    it to 'max_length' characters to avoid overly long filenames.
-    """
-    # Replace invalid characters with '_'
-    s = re.sub(r'[\\/:*?"<>|]', '_', s)
-    # Trim to max_length; also remove trailing spaces
-    return s[:max_length].rstrip()
-
 class AzureSearchRetriever:
     """
     This class encapsulates logic to retrieve documents from Azure Cognitive Search
@@ -62,7 +52,6 @@ class AzureSearchRetriever:
         # Where embeddings are stored in the index (usually "embedding")
         self.vector_columns = os.getenv("AZURE_SEARCH_VECTOR_COLUMNS", "embedding")
         self.top_k = int(os.getenv("AZURE_SEARCH_TOP_K", "5"))
-        self.safe_query = ""
 
         if not self.search_endpoint and self.search_service:
             self.search_endpoint = f"https://{self.search_service}.search.windows.net"
@@ -79,8 +68,16 @@ class AzureSearchRetriever:
         logging.info(f"Top K: {self.top_k}")
 
     def generate_embedding(self, user_input: str) -> List[float]:
+        """
+        Embedding for the given user input. Reuses the vector already computed in
+        this chat request or held in the embedding cache before calling Azure OpenAI.
+        """
+        return cached_embedding(self.embedding_deployment, user_input, self._create_embedding)
+
+    def _create_embedding(self, user_input: str) -> List[float]:
         """
         Generate embeddings for the given user input using Azure OpenAI (text-embedding).
+        Vectors are persisted by the embedding store (EMBEDDING_STORE_PATH), not here.
         """
         try:
             url = (
@@ -100,21 +97,6 @@ class AzureSearchRetriever:
             embedding_vector = data["data"][0]["embedding"]
             logging.info(f"Generated embedding vector of length {len(embedding_vector)}.")
 
-            # Create a safe filename for the embedding
-            self.safe_query = sanitize_filename(user_input)
-
-            # Ensure an "embeddings" directory exists
-            output_dir = "embeddings"
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Construct a final file path
-            file_path = os.path.join(output_dir, f"embedding_{self.safe_query}.json")
-
-            # Write to disk
-            with open(file_path, "w") as f:
-                json.dump({"query": user_input, "embedding": embedding_vector}, f, indent=4)
-            logging.info(f"Saved embedding to {file_path}")
-
             return embedding_vector
 
         except requests.exceptions.RequestException as e:
@@ -8,6 +8,7 @@ from chromadb.config import Settings
 # For embeddings, you can use your LLM or a local embedding approach.
 # You might import from your existing AzureOpenAIClient or a separate embedding class:
 from app.llm.azure_openai import AzureOpenAIClient
+from .embedding_cache import cached_embedding
 
 class ChromaRetriever:
     """
@@ -39,7 +40,7 @@ class ChromaRetriever:
         2) Query the local Chroma DB for the top_k nearest vectors
         3) Return doc chunks
         """
-        user_embedding = self.llm_client.get_embedding(user_input)
+        user_embedding = cached_embedding(self.llm_client.embedding_name, user_input, self.llm_client.get_embedding)
 
         results = self.collection.query(
             query_embeddings=[user_embedding],
@@ -4,6 +4,7 @@ import os
 from typing import List
 from elasticsearch import Elasticsearch
 from app.llm.azure_openai import AzureOpenAIClient
+from .embedding_cache import cached_embedding
 
 class ElasticRetriever:
     """
@@ -32,7 +33,7 @@ class ElasticRetriever:
         2) Query Elasticsearch (k-NN or hybrid)
         3) Return doc chunks
         """
-        embedding = self.llm_client.get_embedding(user_input)
+        embedding = cached_embedding(self.llm_client.embedding_name, user_input, self.llm_client.get_embedding)
 
         # EXAMPLE: a simple vector query in ES 8.x
         # If you want strictly vector search:
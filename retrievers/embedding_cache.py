@@ -0,0 +1,280 @@
+################################################################################
+## _retrievers/embedding_cache.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from .embedding_store import get_embedding_store, load_embeddings, EMBEDDING_STORE_PATH
+
+load_dotenv()
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "1024"))
+# Optional SQLite file for a persistent second tier ("" = memory only)
+EMBEDDING_CACHE_DISK_PATH = os.getenv("EMBEDDING_CACHE_DISK_PATH", "")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Embeddings already computed in the current chat request (see request_scope)
+_request_embeddings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar("request_embeddings", default=None)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Text normalization used for cache keys: Unicode NFC, case-folded,
+    with runs of whitespace collapsed to one space.
+    """
+    text = unicodedata.normalize("NFC", text or "")
+    return _WHITESPACE_RE.sub(" ", text).strip().casefold()
+
+
+def cache_key(deployment: str, text: str) -> str:
+    return hashlib.sha256(f"{deployment}\x1f{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of embedding vectors keyed by (deployment, normalized text).
+
+    - Vectors are held as compact float64 arrays and returned as lists.
+    - Concurrent misses for the same key are computed once; other callers wait
+      for that result instead of calling the embeddings API themselves.
+    - With disk_path set, vectors are also written to a SQLite file that is
+      consulted on a memory miss, so they survive restarts.
+    """
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES, disk_path: str = ""):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "waits": 0, "evictions": 0}
+        self._db = None
+        self._db_lock = threading.Lock()
+        if disk_path:
+            self._open_disk(disk_path)
+
+    # -------------------------
+    # Disk tier
+    # -------------------------
+    def _open_disk(self, path: str) -> None:
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, deployment TEXT, text TEXT, vector BLOB, created REAL)"
+            )
+            self._db.commit()
+            logging.info(f"Embedding cache disk tier at {path}")
+        except sqlite3.Error as e:
+            logging.error(f"Could not open embedding cache at {path}, using memory only: {e}")
+            self._db = None
+
+    def _disk_get(self, key: str) -> Optional[array]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Embedding cache disk read failed: {e}")
+            return None
+        if row is None:
+            return None
+        vector = array("d")
+        vector.frombytes(row[0])
+        return vector
+
+    def _disk_put(self, key: str, deployment: str, text: str, vector: array) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO embeddings (key, deployment, text, vector, created) VALUES (?, ?, ?, ?, ?)",
+                    (key, deployment, normalize_text(text), vector.tobytes(), time.time()),
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logging.warning(f"Embedding cache disk write failed: {e}")
+
+    # -------------------------
+    # Memory tier
+    # -------------------------
+    def _store(self, key: str, vector: array) -> None:
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get(self, deployment: str, text: str) -> Optional[List[float]]:
+        key = cache_key(deployment, text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return vector.tolist()
+        return None
+
+    def get_or_compute(self, deployment: str, text: str, compute: Callable[[str], List[float]]) -> List[float]:
+        """
+        Return the cached vector, or call compute(text) once (even under concurrency) and cache it.
+        """
+        key = cache_key(deployment, text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return vector.tolist()
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._stats["waits"] += 1
+
+        if not owner:
+            return future.result().tolist()
+
+        try:
+            vector = self._disk_get(key)
+            if vector is not None:
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+            else:
+                vector = array("d", compute(text))
+                with self._lock:
+                    self._stats["misses"] += 1
+                self._disk_put(key, deployment, text, vector)
+            self._store(key, vector)
+            future.set_result(vector)
+            return vector.tolist()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def preload(self, key: str, vector: List[float]) -> None:
+        """
+        Insert a precomputed vector under an existing cache_key() value (cache warm-up).
+        """
+        self._store(key, array("d", vector))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk": self._db is not None,
+            }
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Process-wide cache configured from EMBEDDING_CACHE_* environment variables.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_DISK_PATH)
+        return _cache
+
+
+@contextmanager
+def request_scope():
+    """
+    Share embeddings between the retrieval calls of one chat request, so a query
+    is embedded once even when several indexes are searched (or the cache is off).
+    Worker threads started with asyncio.to_thread inherit the scope.
+    """
+    token = _request_embeddings.set({})
+    try:
+        yield
+    finally:
+        _request_embeddings.reset(token)
+
+
+def cached_embedding(deployment: str, text: str, compute: Callable[[str], List[float]]) -> List[float]:
+    """
+    Embedding for text: from the current request scope, then the process cache,
+    and only then from compute(text). Newly computed vectors are handed to the
+    embedding store (if enabled) for asynchronous persistence.
+    """
+    scope = _request_embeddings.get()
+    key = cache_key(deployment, text)
+    if scope is not None and key in scope:
+        return scope[key]
+
+    def compute_and_record(query: str) -> List[float]:
+        vector = compute(query)
+        store = get_embedding_store()
+        if store is not None:
+            store.record(deployment, key, query, vector)
+        return vector
+
+    if EMBEDDING_CACHE_ENABLED:
+        vector = get_embedding_cache().get_or_compute(deployment, text, compute_and_record)
+    else:
+        vector = compute_and_record(text)
+
+    if scope is not None:
+        scope[key] = vector
+    return vector
+
+
+def warm_embedding_cache(root: str = EMBEDDING_STORE_PATH, limit: Optional[int] = None) -> int:
+    """
+    Load the most recent vectors of every deployment in the embedding store into
+    the cache. Returns the number of vectors loaded.
+    """
+    if not EMBEDDING_CACHE_ENABLED or not root:
+        return 0
+    cache = get_embedding_cache()
+    limit = cache.max_entries if limit is None else limit
+    loaded = 0
+    for stored in load_embeddings(root).values():
+        # Oldest first, so the newest rows end up most recently used
+        for key, vector in stored.iter_items(start=len(stored) - limit):
+            cache.preload(key, vector.tolist())
+            loaded += 1
+    logging.info(f"Embedding cache warmed with {loaded} vectors from {root}")
+    return loaded
@@ -0,0 +1,417 @@
+################################################################################
+## _retrievers/embedding_store.py
+## Copyright (c) 2025 Jeff Teeter, Ph.D.
+## Cisco Systems, Inc.
+## Licensed under the Apache License, Version 2.0 (see LICENSE)
+## Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import os
+import re
+import json
+import time
+import queue
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+try:
+    import fcntl
+except ImportError:  # Windows: safe for one writer process only
+    fcntl = None
+
+load_dotenv()
+
+# Directory for the persistent embedding store ("" = disabled)
+EMBEDDING_STORE_PATH = os.getenv("EMBEDDING_STORE_PATH", "")
+# float32 or float16 (half the disk size, ~3 significant digits)
+EMBEDDING_STORE_DTYPE = os.getenv("EMBEDDING_STORE_DTYPE", "float32")
+# Vectors waiting to be written; when full, new vectors are dropped rather than blocking a request
+EMBEDDING_STORE_QUEUE_SIZE = int(os.getenv("EMBEDDING_STORE_QUEUE_SIZE", "1024"))
+
+KEY_BYTES = 32  # sha256 digest per row
+META_FILE = "meta.json"
+VECTORS_FILE = "vectors.bin"
+KEYS_FILE = "keys.bin"
+QUERIES_FILE = "queries.jsonl"
+LOCK_FILE = ".lock"
+# Vectors buffered by a segment before they are written under the file lock
+_BATCH_ROWS = 256
+
+
+def deployment_dir(root: str, deployment: str) -> str:
+    """
+    One sub-directory per embedding deployment, since each has its own dimension.
+    """
+    slug = re.sub(r"[^A-Za-z0-9._-]", "_", deployment or "default")[:64]
+    suffix = hashlib.sha256((deployment or "").encode("utf-8")).hexdigest()[:8]
+    return os.path.join(root, f"{slug}-{suffix}")
+
+
+class StoredEmbeddings:
+    """
+    Read-only, zero-copy view of one deployment's vectors.
+
+    - vectors: numpy memmap of shape (rows, dim)
+    - keys:    numpy memmap of 32-byte sha256 keys, row-aligned with vectors
+    The files are only appended to, so a view stays valid while the writer runs;
+    it simply does not see rows written after it was opened.
+    """
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, META_FILE), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.path = path
+        self.deployment = self.meta["deployment"]
+        self.dim = int(self.meta["dim"])
+        self.dtype = np.dtype(self.meta["dtype"])
+
+        vectors_path = os.path.join(path, VECTORS_FILE)
+        keys_path = os.path.join(path, KEYS_FILE)
+        row_bytes = self.dim * self.dtype.itemsize
+        self.rows = min(
+            os.path.getsize(vectors_path) // row_bytes if os.path.exists(vectors_path) else 0,
+            os.path.getsize(keys_path) // KEY_BYTES if os.path.exists(keys_path) else 0,
+        )
+        if self.rows:
+            self.vectors = np.memmap(vectors_path, dtype=self.dtype, mode="r", shape=(self.rows, self.dim))
+            self.keys = np.memmap(keys_path, dtype=f"S{KEY_BYTES}", mode="r", shape=(self.rows,))
+        else:
+            self.vectors = np.empty((0, self.dim), dtype=self.dtype)
+            self.keys = np.empty((0,), dtype=f"S{KEY_BYTES}")
+        self._index: Optional[Dict[bytes, int]] = None
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def index(self) -> Dict[bytes, int]:
+        """
+        key digest -> row, built on first use.
+        """
+        if self._index is None:
+            # numpy strips trailing NUL bytes from "S" items; pad them back
+            self._index = {bytes(k).ljust(KEY_BYTES, b"\0"): i for i, k in enumerate(self.keys)}
+        return self._index
+
+    def row_for(self, key: str) -> Optional[int]:
+        return self.index().get(bytes.fromhex(key))
+
+    def vector(self, key: str) -> Optional[np.ndarray]:
+        row = self.row_for(key)
+        return None if row is None else self.vectors[row]
+
+    def iter_items(self, start: int = 0) -> Iterator[Tuple[str, np.ndarray]]:
+        """
+        (hex key, vector view) pairs in insertion order, from row 'start'.
+        """
+        for row in range(max(0, start), self.rows):
+            yield bytes(self.keys[row]).ljust(KEY_BYTES, b"\0").hex(), self.vectors[row]
+
+    def queries(self) -> Iterator[dict]:
+        """
+        Per-row metadata (row, text, created) for offline analysis.
+        """
+        path = os.path.join(self.path, QUERIES_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("row", self.rows) < self.rows:
+                    yield record
+
+
+def load_embeddings(root: str, deployment: Optional[str] = None) -> Dict[str, StoredEmbeddings]:
+    """
+    Open every deployment under root (or just one) as memory-mapped matrices.
+    """
+    if not root or not os.path.isdir(root):
+        return {}
+    if deployment is not None:
+        paths = [deployment_dir(root, deployment)]
+    else:
+        paths = [os.path.join(root, name) for name in sorted(os.listdir(root))]
+    stores = {}
+    for path in paths:
+        if not os.path.exists(os.path.join(path, META_FILE)):
+            continue
+        try:
+            stored = StoredEmbeddings(path)
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Skipping embedding store at {path}: {e}")
+            continue
+        stores[stored.deployment] = stored
+    return stores
+
+
+class _Segment:
+    """
+    Append-only files for one deployment. Used only from the writer thread.
+
+    Several processes (uvicorn workers) may share one store: every read of the
+    files' sizes and every write happens under an exclusive flock on the
+    segment's lock file. Before writing, a segment picks up the rows other
+    processes appended, so rows are never duplicated and queries.jsonl row
+    numbers stay aligned with keys.bin.
+    """
+
+    def __init__(self, root: str, deployment: str, dim: int, dtype: str):
+        self.path = deployment_dir(root, deployment)
+        os.makedirs(self.path, exist_ok=True)
+        self.lock_path = os.path.join(self.path, LOCK_FILE)
+        meta_path = os.path.join(self.path, META_FILE)
+        self.vectors_path = os.path.join(self.path, VECTORS_FILE)
+        self.keys_path = os.path.join(self.path, KEYS_FILE)
+        self.rows = 0
+        self.index: Dict[bytes, int] = {}
+        self._pending: List[Tuple[bytes, str, List[float]]] = []
+        self._pending_keys = set()
+        self._flush_lock = threading.Lock()
+
+        with self._file_lock():
+            if os.path.exists(meta_path):
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            else:
+                meta = {"version": 1, "deployment": deployment, "dim": dim, "dtype": np.dtype(dtype).name}
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+            self.dim = int(meta["dim"])
+            self.dtype = np.dtype(meta["dtype"])
+            self._catch_up()
+
+        self._vectors = open(self.vectors_path, "ab")
+        self._keys = open(self.keys_path, "ab")
+        self._queries = open(os.path.join(self.path, QUERIES_FILE), "a", encoding="utf-8")
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _repair(self) -> int:
+        """
+        Trim a partially written last row (e.g. after a crash) so vectors and keys line up.
+        Only called under the file lock, when no other process is writing.
+        """
+        row_bytes = self.dim * self.dtype.itemsize
+        vector_size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        key_size = os.path.getsize(self.keys_path) if os.path.exists(self.keys_path) else 0
+        rows = min(vector_size // row_bytes, key_size // KEY_BYTES)
+        for path, size in ((self.vectors_path, rows * row_bytes), (self.keys_path, rows * KEY_BYTES)):
+            if os.path.exists(path) and os.path.getsize(path) != size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+                logging.warning(f"Embedding store: truncated {path} to {rows} rows")
+        return rows
+
+    def _catch_up(self) -> None:
+        """
+        Index the rows appended since this segment last looked (by other processes too).
+        Called under the file lock.
+        """
+        rows = self._repair()
+        if rows < self.rows:
+            # Trimmed below what this process had seen: index from scratch
+            self.rows, self.index = 0, {}
+        if rows > self.rows:
+            with open(self.keys_path, "rb") as f:
+                f.seek(self.rows * KEY_BYTES)
+                data = f.read((rows - self.rows) * KEY_BYTES)
+            for i in range(rows - self.rows):
+                self.index.setdefault(data[i * KEY_BYTES:(i + 1) * KEY_BYTES], self.rows + i)
+            self.rows = rows
+
+    def append(self, digest: bytes, text: str, vector: List[float]) -> bool:
+        """
+        Buffer a new vector until the next flush. False for a known key or a vector
+        of the wrong dimension.
+        """
+        if digest in self.index or digest in self._pending_keys:
+            return False
+        if len(vector) != self.dim:
+            logging.warning(
+                f"Embedding store: vector of length {len(vector)} does not match dimension {self.dim} in {self.path}"
+            )
+            return False
+        self._pending.append((digest, text, vector))
+        self._pending_keys.add(digest)
+        return True
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write the buffered vectors under the file lock; returns how many were new
+        (others may have been written by another process meanwhile).
+        """
+        with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending, self._pending_keys = self._pending, [], set()
+            return self._write(pending)
+
+    def _write(self, pending: List[Tuple[bytes, str, List[float]]]) -> int:
+        written = 0
+        with self._file_lock():
+            self._catch_up()
+            for digest, text, vector in pending:
+                if digest in self.index:
+                    continue
+                # Vector before key: a key on disk always has its row
+                self._vectors.write(np.asarray(vector, dtype=self.dtype).tobytes())
+                self._keys.write(digest)
+                self._queries.write(json.dumps({"row": self.rows, "text": text, "created": time.time()}) + "\n")
+                self.index[digest] = self.rows
+                self.rows += 1
+                written += 1
+            self._vectors.flush()
+            self._keys.flush()
+            self._queries.flush()
+        return written
+
+    def close(self) -> None:
+        self.flush()
+        self._vectors.close()
+        self._keys.close()
+        self._queries.close()
+
+
+class EmbeddingStore:
+    """
+    Persistent, deduplicated log of query embeddings.
+
+    record() only enqueues; a background thread appends each new vector to a
+    per-deployment float32/float16 matrix (vectors.bin) and its sha256 key to a
+    row-aligned index (keys.bin), in batches under a file lock, so several worker
+    processes can share one EMBEDDING_STORE_PATH. Both files can be memory-mapped
+    with load_embeddings() for offline analysis or to warm the embedding cache.
+    """
+
+    def __init__(self, root: str, dtype: str = EMBEDDING_STORE_DTYPE, queue_size: int = EMBEDDING_STORE_QUEUE_SIZE):
+        if np.dtype(dtype) not in (np.dtype("float32"), np.dtype("float16")):
+            raise ValueError(f"Unsupported embedding store dtype: {dtype}")
+        self.root = root
+        self.dtype = np.dtype(dtype).name
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._segments: Dict[str, _Segment] = {}
+        self._stats = {"queued": 0, "written": 0, "duplicates": 0, "dropped": 0, "errors": 0}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="embedding-store-writer", daemon=True)
+                self._thread.start()
+
+    def record(self, deployment: str, key: str, text: str, vector: List[float]) -> bool:
+        """
+        Queue a vector for writing. Never blocks; returns False if the queue is full.
+        """
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((deployment, bytes.fromhex(key), text, list(vector)))
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            return False
+        with self._lock:
+            self._stats["queued"] += 1
+        return True
+
+    def _segment(self, deployment: str, dim: int) -> _Segment:
+        segment = self._segments.get(deployment)
+        if segment is None:
+            segment = _Segment(self.root, deployment, dim, self.dtype)
+            self._segments[deployment] = segment
+        return segment
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                deployment, digest, text, vector = item
+                try:
+                    segment = self._segment(deployment, len(vector))
+                    if not segment.append(digest, text, vector):
+                        with self._lock:
+                            self._stats["duplicates"] += 1
+                    if self._queue.empty() or segment.pending >= _BATCH_ROWS:
+                        self._flush_segments()
+                except (OSError, ValueError) as e:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    logging.error(f"Embedding store write failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _flush_segments(self) -> None:
+        for segment in list(self._segments.values()):
+            buffered = segment.pending
+            written = segment.flush()
+            with self._lock:
+                self._stats["written"] += written
+                self._stats["duplicates"] += buffered - written
+
+    def flush(self) -> None:
+        """
+        Wait until every queued vector is on disk.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        self._flush_segments()
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": self._queue.qsize(),
+                "path": self.root,
+                "dtype": self.dtype,
+                "rows": {name: segment.rows for name, segment in self._segments.items()},
+            }
+
+
+_store: Optional[EmbeddingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    """
+    Process-wide store at EMBEDDING_STORE_PATH, or None when persistence is disabled.
+    """
+    global _store
+    if not EMBEDDING_STORE_PATH:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = EmbeddingStore(EMBEDDING_STORE_PATH)
+        return _store
@@ -0,0 +1,77 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_catalyst_auth.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import time
+import threading
+
+from cisco_integrations.catalyst_auth import CATALYST_TOKEN_REFRESH_MARGIN_S, CatalystTokenManager
+
+
+def _manager(monkeypatch, share_dir: str = "", release: threading.Event = None) -> tuple:
+    manager = CatalystTokenManager("https://dnac", "user", "secret", share_dir=share_dir)
+    fetches = []
+
+    def fetch():
+        if release is not None:
+            release.wait(5)
+        else:
+            time.sleep(0.05)
+        fetches.append(time.time())
+        return f"token-{len(fetches)}", time.time() + 3600
+
+    monkeypatch.setattr(manager, "_fetch", fetch)
+    return manager, fetches
+
+
+def test_concurrent_401s_for_the_same_token_fetch_once(monkeypatch):
+    manager, fetches = _manager(monkeypatch)
+    manager._token, manager._expires_at = "rejected", time.time() + 3600
+    barrier = threading.Barrier(16)
+    results = []
+
+    def on_401():
+        barrier.wait()
+        results.append(manager.refresh_after_401("rejected"))
+
+    threads = [threading.Thread(target=on_401) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+    assert results == ["token-1"] * 16
+    assert manager.stats()["refreshes_401"] == 16
+
+
+def test_token_close_to_expiry_is_served_during_one_background_refresh(monkeypatch):
+    release = threading.Event()
+    manager, fetches = _manager(monkeypatch, release=release)
+    manager._token, manager._expires_at = "old", time.time() + CATALYST_TOKEN_REFRESH_MARGIN_S / 2
+
+    assert [manager.token() for _ in range(5)] == ["old"] * 5
+    background = manager._background
+    assert background is not None and background.is_alive()
+
+    release.set()
+    background.join(5)
+    assert len(fetches) == 1
+    assert manager.token() == "token-1"
+    assert manager.stats()["background_refreshes"] == 1
+
+
+def test_second_manager_reads_the_shared_token_file(monkeypatch, tmp_path):
+    first, first_fetches = _manager(monkeypatch, share_dir=str(tmp_path))
+    second, second_fetches = _manager(monkeypatch, share_dir=str(tmp_path))
+    assert first.share_path == second.share_path
+
+    assert first.token() == "token-1"
+    assert second.token() == "token-1"
+    assert len(first_fetches) == 1
+    assert second_fetches == []
+    assert second.stats()["shared_reads"] == 1
@@ -0,0 +1,89 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_catalyst_paging.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+from cisco_integrations.catalyst_inventory import page_offsets
+from cisco_integrations.cisco_catalyst_client import CatalystCenterClient
+
+PATH = "/dna/intent/api/v1/network-device"
+
+
+class _Response:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def _client(monkeypatch, devices: list, count: int, after_first_page=None):
+    """
+    A client whose _direct_get serves 'devices' by 1-based offset and reports 'count'.
+    after_first_page(devices) runs once the page at offset 1 has been served.
+    """
+    client = CatalystCenterClient("https://dnac", token="test-token")
+    requested = []
+
+    def direct_get(url, params=None):
+        if url.endswith("/count"):
+            return _Response({"response": count})
+        requested.append(params["offset"])
+        start = params["offset"] - 1
+        page = devices[start:start + params["limit"]]
+        if params["offset"] == 1 and after_first_page:
+            after_first_page(devices)
+        return _Response({"response": page})
+
+    monkeypatch.setattr(client, "_direct_get", direct_get)
+    return client, requested
+
+
+def _devices(n: int) -> list:
+    return [{"id": f"d{i}"} for i in range(n)]
+
+
+def test_page_offsets_are_one_based():
+    assert page_offsets(0, 100) == [1]
+    assert page_offsets(100, 100) == [1]
+    assert page_offsets(101, 100) == [1, 101]
+    assert page_offsets(250, 100) == [1, 101, 201]
+
+
+def test_every_page_is_fetched_once(monkeypatch):
+    devices = _devices(250)
+    client, requested = _client(monkeypatch, devices, count=250)
+
+    records, pages = client._fetch_all_pages(PATH, 100, workers=3)
+
+    assert records == devices
+    assert pages == 3
+    assert sorted(requested) == [1, 101, 201]
+
+
+def test_pages_added_since_the_count_are_fetched(monkeypatch):
+    devices = _devices(230)
+    client, requested = _client(monkeypatch, devices, count=200)
+
+    records, pages = client._fetch_all_pages(PATH, 100, workers=2)
+
+    assert records == devices
+    assert pages == 3
+    assert requested[-1] == 201
+
+
+def test_records_shifted_between_pages_are_kept_once(monkeypatch):
+    devices = _devices(150)
+    # A device added at the front after the first page pushes d99 onto the second page
+    client, requested = _client(
+        monkeypatch, devices, count=150, after_first_page=lambda devices: devices.insert(0, {"id": "new"})
+    )
+
+    records, pages = client._fetch_all_pages(PATH, 100, workers=1)
+
+    ids = [record["id"] for record in records]
+    assert ids == [f"d{i}" for i in range(150)]
+    assert pages == 2
@@ -0,0 +1,83 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_catalyst_sites.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+from cisco_integrations.catalyst_sites import SiteTree
+from cisco_integrations.cisco_catalyst_client import CatalystCenterClient
+
+SITES = [
+    {"id": "g", "name": "Global", "siteNameHierarchy": "Global"},
+    {"id": "usa", "name": "USA", "parentId": "g", "siteNameHierarchy": "Global/USA"},
+    {"id": "sj", "name": "San Jose", "parentId": "usa", "siteNameHierarchy": "Global/USA/San Jose"},
+    {"id": "b1", "name": "Building 1", "parentId": "sj", "siteNameHierarchy": "Global/USA/San Jose/Building 1"},
+    {"id": "b2", "name": "Building 2", "parentId": "sj", "siteNameHierarchy": "Global/USA/San Jose/Building 2"},
+]
+
+
+def test_resolve_exact_matches():
+    tree = SiteTree("https://dnac", SITES)
+    assert tree.resolve("b1")["id"] == "b1"
+    assert tree.resolve("USA/San Jose")["id"] == "sj"
+    assert tree.resolve("global/usa/san jose/building 2/")["id"] == "b2"
+    assert tree.resolve("building 1")["id"] == "b1"
+
+
+def test_resolve_never_substitutes_a_different_site():
+    tree = SiteTree("https://dnac", SITES)
+    assert tree.resolve("Building 10") is None
+    assert tree.resolve("San Jose 2") is None
+    error = tree.not_found("Building 10")
+    assert "error" in error
+    assert "b1" in [candidate["id"] for candidate in error["candidates"]]
+
+
+class _Response:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def _client(monkeypatch, tree):
+    client = CatalystCenterClient("https://dnac", token="test-token")
+
+    def site_tree(force_refresh=False):
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    monkeypatch.setattr(client, "site_tree", site_tree)
+    monkeypatch.setattr(
+        client, "_direct_get",
+        lambda url, params=None: _Response({"response": [{"id": f"dev-{url.rsplit('/', 1)[-1]}"}]}),
+    )
+    return client
+
+
+def test_devices_by_site_without_hierarchy_lists_the_site_alone(monkeypatch):
+    client = _client(monkeypatch, RuntimeError("sites unavailable"))
+
+    result = client.get_all_devices_by_site("b1", include_children=True)
+
+    assert result["devices"] == [{"id": "dev-b1"}]
+    assert result["sites_queried"] == 1
+    assert "warning" in result
+    assert client.get_all_devices_by_site("b1") == [{"id": "dev-b1"}]
+
+
+def test_devices_by_site_tree_and_unknown_site(monkeypatch):
+    tree = SiteTree("https://dnac", SITES)
+    client = _client(monkeypatch, tree)
+
+    result = client.get_all_devices_by_site("San Jose", include_children=True)
+    assert result["site"]["id"] == "sj"
+    assert sorted(device["id"] for device in result["devices"]) == ["dev-b1", "dev-b2", "dev-sj"]
+
+    # A site ID missing from the tree is reported, not raised as a KeyError
+    monkeypatch.setattr(client, "resolve_site_id", lambda site: site)
+    assert "error" in client.get_all_devices_by_site("gone", include_children=True)
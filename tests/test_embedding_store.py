@@ -0,0 +1,63 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_embedding_store.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import hashlib
+import multiprocessing
+
+from retrievers.embedding_store import EmbeddingStore, load_embeddings
+
+DIM = 8
+
+
+def _key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _vector(text: str) -> list:
+    return [float(len(text) + i) for i in range(DIM)]
+
+
+def _write(root: str, worker: int) -> None:
+    store = EmbeddingStore(root, queue_size=10_000)
+    # Every worker writes the shared queries plus some of its own, as uvicorn workers would
+    for i in range(300):
+        text = f"shared {i}" if i % 2 else f"worker {worker} {i}"
+        store.record("deployment", _key(text), text, _vector(text))
+    store.flush()
+    store.close()
+
+
+def test_processes_sharing_a_store_do_not_duplicate_or_misalign_rows(tmp_path):
+    root = str(tmp_path)
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_write, args=(root, worker)) for worker in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    stored = load_embeddings(root)["deployment"]
+    keys = [key for key, _ in stored.iter_items()]
+    assert len(keys) == len(set(keys)) == 150 + 4 * 150
+    queries = list(stored.queries())
+    assert sorted(record["row"] for record in queries) == list(range(len(keys)))
+    for record in queries:
+        assert keys[record["row"]] == _key(record["text"])
+        assert list(stored.vectors[record["row"]]) == _vector(record["text"])
+
+
+def test_reopened_store_skips_known_keys(tmp_path):
+    root = str(tmp_path)
+    _write(root, 0)
+    store = EmbeddingStore(root)
+    store.record("deployment", _key("shared 1"), "shared 1", _vector("shared 1"))
+    store.flush()
+    assert store.stats()["written"] == 0
+    store.close()
+    assert len(load_embeddings(root)["deployment"]) == 300
@@ -0,0 +1,26 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_html_renderer.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+from app.llm.html_renderer import choose_columns
+from app.llm.prompt_templates import MERAKI_AP_COLUMNS, MERAKI_INVENTORY_COLUMNS
+
+
+def test_access_points_get_the_ap_preset():
+    records = [{"serial": "Q2", "model": "MR46", "mac": "aa", "networkId": "N", "productType": "wireless",
+                "name": "ap-1", "lanIp": "10.0.0.1"}]
+    assert choose_columns(records) == MERAKI_AP_COLUMNS
+
+
+def test_full_inventory_records_get_the_inventory_preset():
+    records = [{key: "x" for key, _ in MERAKI_INVENTORY_COLUMNS}]
+    assert choose_columns(records) == MERAKI_INVENTORY_COLUMNS
+
+
+def test_other_records_use_their_own_keys():
+    records = [{"hostname": "sw1", "managementIpAddress": "10.0.0.1"}]
+    assert [key for key, _ in choose_columns(records)] == ["hostname", "managementIpAddress"]
@@ -0,0 +1,100 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_meraki_alert_store.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import sqlite3
+
+from cisco_integrations import cisco_meraki_client, meraki_alert_store
+from cisco_integrations.cisco_meraki_client import CiscoMerakiClient
+from cisco_integrations.meraki_alert_store import AlertStore
+from cisco_integrations.meraki_networks import NetworkIndex
+
+NOW = 1_760_000_000.0
+
+
+def _store(tmp_path) -> AlertStore:
+    store = AlertStore(str(tmp_path / "alerts.sqlite"), retention_s=3600)
+    for i in range(100):
+        store.add(
+            {"organizationId": "O", "networkId": "N", "alertId": f"a{i}", "occurredAt": NOW - i * 10},
+            received_at=NOW - 600,
+        )
+    return store
+
+
+def test_coverage_starts_at_first_webhook_or_retention_horizon(tmp_path):
+    store = _store(tmp_path)
+    assert store.persistent
+    assert store.coverage("O", "N", now=NOW) == {"from": NOW - 600, "to": NOW}
+    assert store.coverage("O", "N", now=NOW + 3500) == {"from": NOW - 100, "to": NOW + 3500}
+    assert store.coverage("O", "other", now=NOW) is None
+    assert store.coverage("other", "N", now=NOW) is None
+    assert store.network_coverage("O", now=NOW) == {"N": {"from": NOW - 600, "to": NOW}}
+
+
+def test_old_per_org_senders_table_is_rebuilt_per_network(tmp_path):
+    path = str(tmp_path / "alerts.sqlite")
+    _store(tmp_path).close()
+    db = sqlite3.connect(path)
+    db.executescript(
+        "DROP TABLE senders;"
+        "CREATE TABLE senders (organization_id TEXT PRIMARY KEY, first_received REAL, last_received REAL);"
+        "INSERT INTO senders VALUES ('O', 0, 0);"
+    )
+    db.close()
+    store = AlertStore(path, retention_s=3600)
+    assert store.network_coverage("O", now=NOW) == {"N": {"from": NOW - 600, "to": NOW}}
+    assert store.stats()["networks"] == 1
+
+
+def test_query_window_and_limit(tmp_path):
+    store = _store(tmp_path)
+    alerts = store.query(organization_id="O", since=NOW - 300, until=NOW - 100, limit=5)
+    assert [alert["alertId"] for alert in alerts] == ["a11", "a12", "a13", "a14", "a15"]
+    assert len(store.query(organization_id="O", since=NOW - 300, until=NOW - 100, limit=None)) == 20
+
+
+def test_in_memory_store_is_not_persistent():
+    assert not AlertStore("").persistent
+
+
+def test_only_networks_sending_webhooks_are_answered_from_the_store(monkeypatch, tmp_path):
+    # The Meraki SDK writes its log file to the working directory
+    monkeypatch.chdir(tmp_path)
+    store = AlertStore(str(tmp_path / "alerts.sqlite"), retention_s=7 * 24 * 3600)
+    store.add({"organizationId": "O", "networkId": "N1", "alertId": "w1", "occurredAt": NOW - 60}, received_at=NOW - 7200)
+    monkeypatch.setattr(meraki_alert_store, "_store", store)
+    monkeypatch.setattr(cisco_meraki_client, "MERAKI_ALERT_SOURCE", "auto")
+    monkeypatch.setattr(cisco_meraki_client.time, "time", lambda: NOW)
+
+    client = CiscoMerakiClient(api_key="test-key", organization_id="O")
+    index = NetworkIndex("O", [{"id": "N1", "name": "branch-1"}, {"id": "N2", "name": "branch-2"}])
+    monkeypatch.setattr(client, "network_index", lambda force_refresh=False: index)
+    api_calls = []
+
+    def get_network_alerts_history(network_id, **params):
+        api_calls.append(network_id)
+        return [{"alertId": "api1", "occurredAt": NOW - 30}]
+
+    monkeypatch.setattr(client.dashboard.networks, "getNetworkAlertsHistory", get_network_alerts_history)
+
+    since = NOW - 3600
+    first = client.get_network_alerts_history("N1", startingAfter=since)
+    assert first["source"] == "webhooks"
+    assert [alert["alertId"] for alert in first["alerts"]] == ["w1"]
+    assert client.get_network_alerts_history("N2", startingAfter=since) == [{"alertId": "api1", "occurredAt": NOW - 30}]
+    assert api_calls == ["N2"]
+
+    one = client.search_alerts_in_org(network_id="branch-2", timespan=3600)
+    assert one["source"] == "api"
+    assert api_calls == ["N2", "N2"]
+
+    org = client.search_alerts_in_org(timespan=3600)
+    assert org["source"] == "webhooks"
+    assert org["coverage"] == {"N1": {"from": NOW - 7200, "to": NOW}}
+    assert org["uncovered_networks"] == ["N2"]
+    assert [alert["alertId"] for alert in org["alerts"]] == ["w1"]
@@ -0,0 +1,64 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_meraki_stream.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import time
+import threading
+
+from cisco_integrations.cisco_meraki_client import CiscoMerakiClient
+from cisco_integrations.record_stream import RecordStream
+
+
+def _client(clients_per_network: int) -> CiscoMerakiClient:
+    client = CiscoMerakiClient(api_key="test-key", organization_id="")
+
+    def iter_network_clients(network, **params):
+        for i in range(clients_per_network):
+            time.sleep(0.001)
+            yield {"id": f"{network['id']}-{i}", "networkId": network["id"]}
+
+    client.iter_network_clients = iter_network_clients
+    return client
+
+
+def test_closing_stream_early_does_not_crash_done_thread(monkeypatch, tmp_path):
+    # The Meraki SDK writes its log file to the working directory
+    monkeypatch.chdir(tmp_path)
+    failures = []
+    monkeypatch.setattr(threading, "excepthook", lambda args: failures.append(args.exc_value))
+
+    client = _client(clients_per_network=3000)
+    networks = [{"id": f"N_{i}", "name": f"net-{i}"} for i in range(20)]
+    network_errors = []
+    stream = RecordStream(
+        "clients",
+        client._stream_network_clients(networks, lambda net: {"timespan": 3600}, network_errors, max_workers=2),
+        {"network_errors": network_errors},
+    )
+
+    result = stream.collect(10)
+
+    assert result["truncated"] is True
+    assert len(result["clients"]) == 10
+    # Let the cancelled workers and the done thread finish
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and any(t.name == "meraki-stream-done" for t in threading.enumerate()):
+        time.sleep(0.05)
+    assert not any(t.name == "meraki-stream-done" for t in threading.enumerate())
+    assert failures == []
+
+
+def test_stream_yields_every_client(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    client = _client(clients_per_network=50)
+    networks = [{"id": f"N_{i}", "name": f"net-{i}"} for i in range(4)]
+    network_errors = []
+
+    records = list(client._stream_network_clients(networks, lambda net: {}, network_errors))
+
+    assert len(records) == 200
+    assert network_errors == []
@@ -0,0 +1,88 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_rate_limit.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import time
+import threading
+from types import SimpleNamespace
+
+from cisco_integrations.rate_limit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    TokenBucket,
+    meraki_org_limiter,
+    pace_meraki_dashboard,
+)
+
+
+def _wait_for_queue(bucket: TokenBucket, depth: int) -> None:
+    deadline = time.monotonic() + 5
+    while bucket.stats()["queue_depth"] < depth and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert bucket.stats()["queue_depth"] == depth
+
+
+def test_interactive_waiters_are_served_before_bulk_and_background():
+    bucket = TokenBucket(rate=100, burst=1)
+    bucket.pause(0.3)
+    granted = []
+
+    def take(name, priority):
+        bucket.acquire(priority=priority)
+        granted.append(name)
+
+    threads = []
+    for depth, (name, priority) in enumerate(
+        [("background", PRIORITY_BACKGROUND), ("bulk", PRIORITY_BULK), ("interactive", PRIORITY_INTERACTIVE)], 1
+    ):
+        thread = threading.Thread(target=take, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        _wait_for_queue(bucket, depth)
+    for thread in threads:
+        thread.join(5)
+
+    assert granted == ["interactive", "bulk", "background"]
+    assert bucket.stats()["waiting"] == {}
+
+
+class _Session:
+    def __init__(self, response):
+        self.response = response
+        self.sent = 0
+
+    def _send_request(self, *args, **kwargs):
+        self.sent += 1
+        return self.response
+
+
+def test_429_pauses_the_org_bucket_for_retry_after():
+    response = SimpleNamespace(status_code=429, headers={"Retry-After": "2"})
+    session = _Session(response)
+    pace_meraki_dashboard(SimpleNamespace(_session=session), "org-429")
+
+    assert session._send_request() is response
+
+    stats = meraki_org_limiter("org-429").stats()
+    assert stats["throttled_429"] == 1
+    assert 1.5 < stats["paused_for_s"] <= 2
+    assert stats["available"] == 0
+    assert not meraki_org_limiter("org-429").acquire(timeout=0.1)
+
+
+def test_send_hook_is_installed_once_per_session():
+    session = _Session(SimpleNamespace(status_code=200, headers={}))
+    dashboard = SimpleNamespace(_session=session)
+    pace_meraki_dashboard(dashboard, "org-hook")
+    paced = session._send_request
+    pace_meraki_dashboard(dashboard, "org-hook")
+
+    assert session._send_request is paced
+    session._send_request()
+    assert session.sent == 1
+    assert meraki_org_limiter("org-hook").stats()["by_priority"]["interactive"]["granted"] == 1
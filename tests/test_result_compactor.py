@@ -0,0 +1,67 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_result_compactor.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+import json
+import random
+
+import pytest
+
+from app.llm.function_dispatcher import DispatchResult
+from app.llm.result_compactor import compact_result
+
+
+def _clients(count: int) -> list:
+    rng = random.Random(7)
+    return [
+        {
+            "id": f"k{i:06x}",
+            "mac": f"aa:bb:cc:{i % 256:02x}:{i // 256 % 256:02x}:{i % 7:02x}",
+            "description": f"laptop-{rng.randint(0, 10 ** 6)}",
+            "ip": f"10.{i % 256}.{i // 256 % 256}.{rng.randint(1, 254)}",
+            "user": rng.choice([None, f"user{i}"]),
+            "vlan": rng.choice([10, 20, 30]),
+            "status": rng.choice(["Online", "Offline"]),
+            "ssid": rng.choice(["corp", "guest", None]),
+            "usage": {"sent": rng.randint(0, 10 ** 7), "recv": rng.randint(0, 10 ** 8)},
+            "lastSeen": 1_700_100_000 + i,
+            "manufacturer": rng.choice(["Apple", "Dell", "HP", "Intel"]),
+            "os": rng.choice(["macOS", "Windows 11", "Android"]),
+            "recentDeviceName": f"AP-{i % 40}",
+            "networkId": f"N_{i % 20}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("budget", [8000, 24000])
+def test_large_record_list_is_sampled_into_valid_json(budget):
+    result = DispatchResult("list_all_clients_in_org", {}, {"clients": _clients(5000), "networks_queried": 20})
+
+    compacted = compact_result(result, budget)
+
+    assert compacted.tokens <= budget
+    assert "truncated" not in compacted.steps
+    clients = json.loads(compacted.content)["result"]["clients"]
+    assert clients["total_rows"] == 5000
+    assert clients["aggregates"]
+    assert 0 < clients["sampled_rows"] == len(clients["rows"]) < 5000
+    # Sampling fields come before the rows
+    keys = list(clients)
+    assert keys.index("total_rows") < keys.index("rows")
+    assert keys.index("aggregates") < keys.index("rows")
+
+
+def test_result_without_records_is_still_valid_json():
+    result = DispatchResult("get_config", {}, {"config": "x" * 200_000})
+
+    compacted = compact_result(result, 1000)
+
+    assert compacted.tokens <= 1000
+    payload = json.loads(compacted.content)
+    assert payload["result"]["partial_json"].startswith('{"config":"xxx')
+    assert "/chat/results/" in payload["note"]
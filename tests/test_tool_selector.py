@@ -0,0 +1,47 @@
+################################################################################
+# cisco-data-bridge-domain-index/tests/test_tool_selector.py
+# Copyright (c) 2025 Jeff Teeter, Ph.D.
+# Cisco Systems, Inc.
+# Licensed under the Apache License, Version 2.0 (see LICENSE)
+# Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
+################################################################################
+
+from app.llm.tool_selector import ToolSelector
+
+DEFINITIONS = [
+    {"name": "get_organization_devices", "description": "Meraki devices of the organization."},
+    {"name": "get_network_clients", "description": "Clients of a Meraki network."},
+    {"name": "get_all_devices", "description": "Catalyst Center device inventory."},
+    {"name": "get_site_health", "description": "Catalyst Center site health."},
+]
+PLATFORMS = {
+    "get_organization_devices": "meraki",
+    "get_network_clients": "meraki",
+    "get_all_devices": "catalyst",
+    "get_site_health": "catalyst",
+}
+
+
+def test_query_matching_nothing_selects_the_platform_fallback_set():
+    selector = ToolSelector(DEFINITIONS, PLATFORMS)
+
+    selection = selector.select("zebra quokka", 1, allowed_platforms=["meraki"], fallback_n=10, min_score=5.0)
+
+    assert selection["stats"]["fallback"] is True
+    assert selection["stats"]["top_score"] == 0.0
+    assert [d["name"] for d in selection["functions"]] == ["get_organization_devices", "get_network_clients"]
+    # Without a fallback the selection is empty
+    assert selector.select("zebra quokka", 1, allowed_platforms=["meraki"])["functions"] == []
+
+
+def test_weak_match_falls_back_and_strong_match_does_not():
+    selector = ToolSelector(DEFINITIONS, PLATFORMS)
+
+    weak = selector.select("site health", 1, fallback_n=3, min_score=100.0)
+    assert weak["stats"]["fallback"] is True
+    assert [d["name"] for d in weak["functions"]][0] == "get_site_health"
+    assert len(weak["functions"]) == 3
+
+    strong = selector.select("site health", 1, fallback_n=3, min_score=0.1)
+    assert strong["stats"]["fallback"] is False
+    assert [d["name"] for d in strong["functions"]] == ["get_site_health"]